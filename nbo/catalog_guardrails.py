@@ -1,6 +1,7 @@
 import json, pandas as pd
 
-om = pd.read_csv("offer_master.csv")
+INPUT_TABLES  = ["offer_master"]
+OUTPUT_TABLES = ["offer_catalog_v1"]
 
 default_margin = {"Beverage":0.42, "Dessert":0.35, "Salad":0.30, "Sandwich":0.32, "Side":0.40, "Wrap":0.30}
 default_bands  = {"Beverage":[0,5,10], "Dessert":[0,5,10,15], "Salad":[0,5,10,15], "Sandwich":[0,5,10,15], "Side":[0,5,10], "Wrap":[0,5,10,15]}
@@ -13,12 +14,25 @@ def to_list(v):
         except: return [s.strip() for s in v.split(",")]
     return v if isinstance(v, list) else [v]
 
-offer_catalog_v1 = om.copy()
-offer_catalog_v1["channel_eligibility"]   = offer_catalog_v1["channel_eligibility"].apply(to_list)
-offer_catalog_v1["margin_basis_pct"]      = offer_catalog_v1["product_category"].map(default_margin).fillna(0.30)
-offer_catalog_v1["allowed_discount_bands"]= offer_catalog_v1["product_category"].map(default_bands).apply(lambda x: x if isinstance(x, list) else [0,5])
-offer_catalog_v1["margin_floor_pct"]      = offer_catalog_v1["product_category"].map(default_floor).fillna(0.25)
-offer_catalog_v1["max_discount_pct"]      = offer_catalog_v1["product_category"].map(default_cap).fillna(15)
+def build_offer_catalog(om: pd.DataFrame) -> pd.DataFrame:
+    """Apply category guardrail defaults to the offer master."""
+    offer_catalog_v1 = om.copy()
+    offer_catalog_v1["channel_eligibility"]   = offer_catalog_v1["channel_eligibility"].apply(to_list)
+    offer_catalog_v1["margin_basis_pct"]      = offer_catalog_v1["product_category"].map(default_margin).fillna(0.30)
+    offer_catalog_v1["allowed_discount_bands"]= offer_catalog_v1["product_category"].map(default_bands).apply(lambda x: x if isinstance(x, list) else [0,5])
+    offer_catalog_v1["margin_floor_pct"]      = offer_catalog_v1["product_category"].map(default_floor).fillna(0.25)
+    offer_catalog_v1["max_discount_pct"]      = offer_catalog_v1["product_category"].map(default_cap).fillna(15)
+    return offer_catalog_v1
 
-offer_catalog_v1.to_csv("offer_catalog_v1.csv", index=False)
-offer_catalog_v1.to_parquet("offer_catalog_v1.parquet")
\ No newline at end of file
+def run(tables):
+    """In-process entry point used by NBOPipeline."""
+    return {"offer_catalog_v1": build_offer_catalog(tables["offer_master"])}
+
+def main():
+    om = pd.read_csv("offer_master.csv")
+    offer_catalog_v1 = build_offer_catalog(om)
+    offer_catalog_v1.to_csv("offer_catalog_v1.csv", index=False)
+    offer_catalog_v1.to_parquet("offer_catalog_v1.parquet")
+
+if __name__ == "__main__":
+    main()
@@ -35,7 +35,14 @@ def cmd_run_pipeline(args):
             data_path=args.data_path,
             output_path=args.output_path,
             config_path=args.config_path,
-            steps=args.steps
+            steps=args.steps,
+            execution_mode=args.execution_mode,
+            max_workers=args.max_workers,
+            executor=args.executor,
+            use_cache=args.cache,
+            checkpoint_runs=True if args.checkpoint else None,
+            resume_run_id=args.resume,
+            retrain_model=args.retrain
         )
         
         print(f"\nPipeline run completed: {result.run_id}")
@@ -43,6 +50,9 @@ def cmd_run_pipeline(args):
         print(f"Steps completed: {len(result.steps_completed)}")
         print(f"Steps failed: {len(result.steps_failed)}")
         
+        if result.steps_cached:
+            print(f"Steps restored from cache: {', '.join(result.steps_cached)}")
+        
         if result.steps_completed:
             print(f"Completed steps: {', '.join(result.steps_completed)}")
         
@@ -51,6 +61,29 @@ def cmd_run_pipeline(args):
             for error in result.error_messages:
                 print(f"Error: {error}")
         
+        if result.step_start_times:
+            print(f"\nStep timings:")
+            for step_name, start in sorted(result.step_start_times.items(), key=lambda item: item[1]):
+                end = result.step_end_times.get(step_name)
+                end_str = end.strftime('%H:%M:%S.%f')[:-3] if end else '?'
+                duration = f"{(end - start).total_seconds():.2f}s" if end else '?'
+                print(f"  {step_name}: {start.strftime('%H:%M:%S.%f')[:-3]} -> {end_str} ({duration})")
+        
+        if result.step_metrics:
+            print(f"\nStep metrics:")
+            print(f"  {'step':<22} {'status':<10} {'wall s':>8} {'cpu s':>8} {'peak MB':>8} "
+                  f"{'rows in':>10} {'rows out':>10} {'MB read':>8} {'MB written':>10}")
+            for m in sorted(result.step_metrics.values(), key=lambda m: m.start_time or ""):
+                cpu = f"{m.cpu_time_s:.2f}" if m.cpu_time_s is not None else '-'
+                peak = f"{m.peak_rss_mb:.0f}" if m.peak_rss_mb is not None else '-'
+                print(f"  {m.step_name:<22} {m.status:<10} {m.wall_time_s:>8.2f} {cpu:>8} {peak:>8} "
+                      f"{sum(m.input_rows.values()):>10} {sum(m.output_rows.values()):>10} "
+                      f"{m.bytes_read / 1e6:>8.2f} {m.bytes_written / 1e6:>10.2f}")
+        
+        if args.trace:
+            trace_path = result.export_trace(args.trace)
+            print(f"\nStep metrics trace written to {trace_path}")
+        
         if result.outputs_generated:
             print(f"\nOutputs generated:")
             for filename, path in result.outputs_generated.items():
@@ -78,7 +111,8 @@ def cmd_run_step(args):
         pipeline = NBOPipeline(
             data_path=args.data_path,
             output_path=args.output_path,
-            config=config
+            config=config,
+            execution_mode=args.execution_mode
         )
         
         success = pipeline.run_step(args.step_name)
@@ -194,7 +228,9 @@ def cmd_validate_user_data(args):
         
         validation_report = setup.validate_user_data(
             Path(args.data_path), 
-            strict=not args.ignore_errors
+            strict=not args.ignore_errors,
+            state_dir=Path(args.state_dir) if args.state_dir else None,
+            jobs=args.jobs
         )
         
         # Print summary
@@ -308,6 +344,18 @@ Examples:
   # Run specific steps
   nbo-run pipeline --steps catalog_guardrails fatigue_candidates
   
+  # Run independent steps concurrently
+  nbo-run pipeline --max-workers 4
+  
+  # Reuse unchanged steps from the step cache
+  nbo-run pipeline --execution-mode in_process --cache
+  
+  # Checkpoint a run, then resume it from its first incomplete step
+  nbo-run pipeline --execution-mode in_process --checkpoint
+  nbo-run pipeline --resume run_20250822_020000_000000_3f9a
+  nbo-run pipeline --trace metrics.csv
+  nbo-run pipeline --retrain
+  
   # Run single step
   nbo-run step model_training --data-path ./data
   
@@ -366,6 +414,55 @@ Examples:
         nargs='*',
         help='Specific steps to run (default: all steps)'
     )
+    pipeline_parser.add_argument(
+        '--execution-mode',
+        choices=['subprocess', 'in_process'],
+        help='Run steps as separate scripts or in-process (default: from settings)'
+    )
+    pipeline_parser.add_argument(
+        '--max-workers',
+        type=int,
+        help='Number of independent steps to run concurrently (default: from settings)'
+    )
+    pipeline_parser.add_argument(
+        '--executor',
+        choices=['thread', 'process'],
+        help='Pool type for concurrent steps (default: from settings)'
+    )
+    cache_group = pipeline_parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        '--cache',
+        dest='cache',
+        action='store_true',
+        default=None,
+        help='Restore unchanged in-process steps from the step cache (default: from settings)'
+    )
+    cache_group.add_argument(
+        '--no-cache',
+        dest='cache',
+        action='store_false',
+        help='Recompute every step instead of restoring unchanged steps from the cache'
+    )
+    pipeline_parser.add_argument(
+        '--checkpoint',
+        action='store_true',
+        help='Checkpoint the run so it can be continued with --resume (default: from settings)'
+    )
+    pipeline_parser.add_argument(
+        '--resume',
+        metavar='RUN_ID',
+        help='Continue a checkpointed run from its first incomplete step'
+    )
+    pipeline_parser.add_argument(
+        '--trace',
+        metavar='PATH',
+        help='Export per-step metrics to PATH (.csv for a flat table, otherwise JSON)'
+    )
+    pipeline_parser.add_argument(
+        '--retrain',
+        action='store_true',
+        help='Refit the model even if the model registry has one for the current training data'
+    )
     pipeline_parser.set_defaults(func=cmd_run_pipeline)
     
     # Step command
@@ -377,6 +474,11 @@ Examples:
         'step_name',
         help='Name of the step to run'
     )
+    step_parser.add_argument(
+        '--execution-mode',
+        choices=['subprocess', 'in_process'],
+        help='Run the step as a separate script or in-process (default: from settings)'
+    )
     step_parser.set_defaults(func=cmd_run_step)
     
     # List steps command
@@ -425,6 +527,15 @@ Examples:
         action='store_true',
         help='Save validation report as JSON file'
     )
+    validate_user_parser.add_argument(
+        '--state-dir',
+        help='Directory keeping quality state so appended rows are profiled incrementally'
+    )
+    validate_user_parser.add_argument(
+        '--jobs',
+        type=int,
+        help='Number of tables to validate concurrently in worker processes (default: from settings)'
+    )
     validate_user_parser.set_defaults(func=cmd_validate_user_data)
     
     # Check pipeline command
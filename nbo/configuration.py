@@ -24,6 +24,9 @@ class ColumnConfig:
     data_type: str
     nullable: bool = True
     description: Optional[str] = None
+    # Load as a categorical: True/False forces it, None leaves it to the
+    # loader's cardinality threshold
+    categorical: Optional[bool] = None
 
 
 @dataclass 
@@ -158,7 +161,8 @@ class NBOConfig:
                         name=col_data["name"],
                         data_type=col_data["data_type"],
                         nullable=col_data.get("nullable", True),
-                        description=col_data.get("description")
+                        description=col_data.get("description"),
+                        categorical=col_data.get("categorical")
                     )
                     table_config.columns.append(column_config)
                 
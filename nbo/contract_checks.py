@@ -1,23 +1,37 @@
 import pandas as pd, sys
 
-fm  = pd.read_parquet("feature_mart.parquet")
-lbl = pd.read_parquet("label_set.parquet")
+INPUT_TABLES  = ["feature_mart", "label_set", "offer_master"]
+OUTPUT_TABLES = []
 
-# 1) as-of integrity (if asof_date present)
-if "asof_date" in fm.columns:
-    fm["asof_date"] = pd.to_datetime(fm["asof_date"], utc=True, errors="coerce")
-    bad = fm["asof_date"].isna().sum()
-    if bad > 0:
-        raise AssertionError(f"asof_date nulls: {bad}")
+def check_contracts(fm: pd.DataFrame, lbl: pd.DataFrame, om: pd.DataFrame) -> None:
+    """Raise AssertionError on hard contract violations; report soft ones."""
+    # 1) as-of integrity (if asof_date present)
+    if "asof_date" in fm.columns:
+        asof = pd.to_datetime(fm["asof_date"], utc=True, errors="coerce")
+        bad = asof.isna().sum()
+        if bad > 0:
+            raise AssertionError(f"asof_date nulls: {bad}")
 
-# 2) label coverage (example)
-coverage = 1.0 - lbl["response_within_window"].isna().mean()
-if coverage < 0.95:
-    print(f"[WARN] Label coverage below 95%: {coverage:.3f}", file=sys.stderr)
+    # 2) label coverage (example)
+    coverage = 1.0 - lbl["response_within_window"].isna().mean()
+    if coverage < 0.95:
+        print(f"[WARN] Label coverage below 95%: {coverage:.3f}", file=sys.stderr)
 
-# 3) legal flag in offer_master
-om = pd.read_csv("offer_master.csv")
-illegal = om.loc[om["legal_flag"] != True]
-if len(illegal) > 0:
-    print(f"[INFO] Dropping {len(illegal)} illegal offers from catalog build")
+    # 3) legal flag in offer_master
+    illegal = om.loc[om["legal_flag"] != True]
+    if len(illegal) > 0:
+        print(f"[INFO] Dropping {len(illegal)} illegal offers from catalog build")
 
+def run(tables):
+    """In-process entry point used by NBOPipeline (validation only)."""
+    check_contracts(tables["feature_mart"], tables["label_set"], tables["offer_master"])
+    return {}
+
+def main():
+    fm  = pd.read_parquet("feature_mart.parquet")
+    lbl = pd.read_parquet("label_set.parquet")
+    om  = pd.read_csv("offer_master.csv")
+    check_contracts(fm, lbl, om)
+
+if __name__ == "__main__":
+    main()
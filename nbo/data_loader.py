@@ -6,45 +6,267 @@ This module provides utilities to:
 - Validate data against schema configurations
 - Handle data type conversions and preprocessing
 - Manage file paths and data discovery
+- Cache cleaned, typed tables as Parquet in a user cache directory
 """
 
+import os
+import json
+import hashlib
+import time
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Union, Any, Tuple
 import logging
 from datetime import datetime
 import warnings
 
 from .configuration import NBOConfig, get_config
+from .step_cache import hash_file, hash_text
 
 logger = logging.getLogger(__name__)
 
+# Bump when cleaning or type conversion changes, to invalidate columnar caches
+TABLE_CACHE_VERSION = 2
+
+# c: pandas C parser (single-threaded)
+# pyarrow: Arrow CSV reader, parsing blocks of the file in parallel threads
+CSV_ENGINES = ("c", "pyarrow")
+
+# pandas' default NA strings, so both engines read the same nulls
+CSV_NULL_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+                   '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+                   'n/a', 'nan', 'null']
+
+# read_csv arguments the Arrow engine understands (others use the C parser)
+ARROW_READ_KWARGS = {'encoding', 'low_memory', 'usecols', 'dtype', 'parse_dates', 'na_values'}
+
+# Text that _clean_data treats as missing once whitespace is stripped
+NULL_STRINGS = ['', 'nan', 'None']
+
+
+# copy: hand out a deep copy of cached tables
+# copy_on_write: hand out shallow copies that pandas copies on first write
+CACHE_RETURN_MODES = ("copy", "copy_on_write")
+
+# Pool types for loading several tables concurrently
+EXECUTORS = ("thread", "process")
+
+
+def user_cache_dir() -> Path:
+    """Get the per-user NBO cache directory (``$XDG_CACHE_HOME/nbo``, default ``~/.cache/nbo``)."""
+    return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'nbo'
+
 
 class DataValidationError(Exception):
     """Exception raised when data validation fails."""
     pass
 
 
+def copy_on_write_enabled() -> bool:
+    """Whether pandas copies shared data on write (always on from pandas 3)."""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    try:
+        return pd.get_option('mode.copy_on_write') is True
+    except (KeyError, AttributeError):  # pandas < 2.0 has no copy-on-write mode
+        return False
+
+
+class TableCache:
+    """
+    In-memory table cache with a byte budget and least-recently-used eviction.
+    
+    Table sizes are measured once on insert with ``memory_usage(deep=True)``.
+    All operations are safe to call from concurrent loader threads.
+    """
+    
+    def __init__(self, max_bytes: Optional[int] = None, return_mode: str = "copy"):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_bytes: Memory budget in bytes (None for unlimited)
+            return_mode: One of CACHE_RETURN_MODES; copy_on_write is opt-in and
+                falls back to copy (with a warning) when pandas copy-on-write is
+                not enabled
+        """
+        if return_mode not in CACHE_RETURN_MODES:
+            raise ValueError(f"Unknown cache return mode '{return_mode}'. Choose from: {CACHE_RETURN_MODES}")
+        if return_mode == "copy_on_write" and not copy_on_write_enabled():
+            logger.warning("Cache return mode 'copy_on_write' needs pandas copy-on-write "
+                           "(pd.options.mode.copy_on_write = True or pandas >= 3); "
+                           "cached tables are deep-copied instead")
+            return_mode = "copy"
+        self.max_bytes = max_bytes
+        self.return_mode = return_mode
+        self._shallow = return_mode == "copy_on_write"
+        self._tables: "OrderedDict[str, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __contains__(self, table_name: str) -> bool:
+        with self._lock:
+            return table_name in self._tables
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tables)
+    
+    def keys(self) -> List[str]:
+        """Get cached table names, least recently used first."""
+        with self._lock:
+            return list(self._tables.keys())
+    
+    def _detach(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.copy(deep=not self._shallow)
+    
+    def get(self, table_name: str) -> Optional[pd.DataFrame]:
+        """Get a cached table (counting a hit or miss), or None if not cached."""
+        with self._lock:
+            entry = self._tables.get(table_name)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._tables.move_to_end(table_name)
+            self.hits += 1
+        return self._detach(entry[0])
+    
+    def put(self, table_name: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cache a table, evicting least recently used tables to stay within budget.
+        
+        Returns:
+            The frame to hand to the caller (detached from the cached copy)
+        """
+        size = int(df.memory_usage(deep=True).sum())
+        with self._lock:
+            self.discard(table_name)
+            if self.max_bytes is not None and size > self.max_bytes:
+                logger.debug(f"Not caching {table_name}: {size} bytes exceeds the {self.max_bytes} byte budget")
+                return df
+            
+            while self.max_bytes is not None and self._tables and self.total_bytes + size > self.max_bytes:
+                evicted, (_, evicted_size) = self._tables.popitem(last=False)
+                self.total_bytes -= evicted_size
+                self.evictions += 1
+                logger.debug(f"Evicted {evicted} ({evicted_size} bytes) from the table cache")
+            
+            self._tables[table_name] = (df, size)
+            self.total_bytes += size
+        return self._detach(df)
+    
+    def discard(self, table_name: str):
+        """Remove a table from the cache if present."""
+        with self._lock:
+            entry = self._tables.pop(table_name, None)
+            if entry is not None:
+                self.total_bytes -= entry[1]
+    
+    def clear(self):
+        """Remove all cached tables."""
+        with self._lock:
+            self._tables.clear()
+            self.total_bytes = 0
+    
+    def info(self) -> Dict[str, Any]:
+        """Get cache contents and statistics."""
+        with self._lock:
+            return {
+                'cached_tables': list(self._tables.keys()),
+                'cache_size': len(self._tables),
+                'memory_usage': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'return_mode': self.return_mode,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+def _load_table_in_process(data_path: Path, config: NBOConfig, columnar_cache: bool,
+                           engine: str, table_name: str,
+                           kwargs: Dict[str, Any]) -> Tuple[pd.DataFrame, float]:
+    """Load one table in a worker process (see ``DataLoader.load_multiple_tables``)."""
+    start = time.perf_counter()
+    loader = DataLoader(data_path, config, columnar_cache=columnar_cache, engine=engine)
+    df = loader.load_table(table_name, cache=False, **kwargs)
+    return df, time.perf_counter() - start
+
+
 class DataLoader:
     """Main data loader class for the NBO package."""
     
-    def __init__(self, data_path: Union[str, Path], config: Optional[NBOConfig] = None):
+    def __init__(self, data_path: Union[str, Path], config: Optional[NBOConfig] = None,
+                 columnar_cache: Optional[bool] = None, engine: Optional[str] = None,
+                 cache_max_bytes: Optional[int] = None, cache_return_mode: Optional[str] = None):
         """
         Initialize data loader.
         
         Args:
             data_path: Path to data directory containing CSV files
             config: Configuration instance (uses default if None)
+            columnar_cache: Whether to cache cleaned, typed tables as Parquet
+                under ``loader.cache_dir`` (default: from settings; an unset
+                cache_dir uses a per-data-directory folder of ``user_cache_dir()``)
+            engine: CSV engine for all tables, one of CSV_ENGINES (default:
+                ``loader.engine``; ``loader.table_engines`` overrides it per table)
+            cache_max_bytes: Memory budget of the in-memory table cache
+                (default: ``loader.cache_max_bytes``; None for unlimited)
+            cache_return_mode: How cached tables are handed out, one of
+                CACHE_RETURN_MODES (default: ``loader.cache_return_mode``)
         """
         self.data_path = Path(data_path)
         self.config = config or get_config()
         self._validate_data_path()
         
+        if columnar_cache is None:
+            columnar_cache = self.config.get_setting('loader.columnar_cache', True)
+        self.columnar_cache = columnar_cache
+        cache_dir = self.config.get_setting('loader.cache_dir')
+        if cache_dir:
+            # Relative directories are resolved under the data directory
+            self.columnar_cache_dir = self.data_path / Path(cache_dir).expanduser()
+        else:
+            # One directory per data directory, so the user's data is never written to
+            data_key = hashlib.sha256(str(self.data_path.resolve()).encode('utf-8')).hexdigest()[:16]
+            self.columnar_cache_dir = user_cache_dir() / 'tables' / data_key
+        
+        self.engine = engine or self.config.get_setting('loader.engine', 'c')
+        self.table_engines: Dict[str, str] = dict(self.config.get_setting('loader.table_engines', {}) or {})
+        if engine:
+            self.table_engines = {}  # An explicit engine applies to every table
+        for name in [self.engine, *self.table_engines.values()]:
+            if name not in CSV_ENGINES:
+                raise ValueError(f"Unknown CSV engine '{name}'. Choose from: {CSV_ENGINES}")
+        self.arrow_block_size = int(self.config.get_setting('loader.arrow_block_size', 16 << 20))
+        # Extra null literals recognized while parsing (on top of pandas' defaults)
+        self.na_values: List[str] = list(self.config.get_setting('loader.na_values', []) or [])
+        # Text columns with at most this share of distinct values (in tables of
+        # at least categorical_min_rows rows) load as categoricals; None disables
+        self.categorical_max_unique_ratio: Optional[float] = self.config.get_setting(
+            'loader.categorical_max_unique_ratio')
+        self.categorical_min_rows = int(self.config.get_setting('loader.categorical_min_rows', 100_000))
+        
         # Cache for loaded data
-        self._data_cache: Dict[str, pd.DataFrame] = {}
+        if cache_max_bytes is None:
+            cache_max_bytes = self.config.get_setting('loader.cache_max_bytes')
+        self._data_cache = TableCache(
+            max_bytes=int(cache_max_bytes) if cache_max_bytes is not None else None,
+            return_mode=cache_return_mode or self.config.get_setting('loader.cache_return_mode', 'copy'),
+        )
         self._file_mapping: Dict[str, Path] = {}
         
+        # Timing, row count and error of each table loaded by load_multiple_tables
+        self.load_stats: Dict[str, Dict[str, Any]] = {}
+        
         # Discover available data files
         self._discover_data_files()
     
@@ -84,15 +306,41 @@ class DataLoader:
         """Get list of available table names."""
         return list(self._file_mapping.keys())
     
+    def get_table_path(self, table_name: str) -> Path:
+        """
+        Get the source file path for a table.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            Path to the table's CSV file
+            
+        Raises:
+            FileNotFoundError: If table file is not found
+        """
+        if table_name not in self._file_mapping:
+            raise FileNotFoundError(f"Table '{table_name}' not found")
+        return self._file_mapping[table_name]
+    
+    def get_table_engine(self, table_name: str) -> str:
+        """Get the CSV engine used to parse a table."""
+        return self.table_engines.get(table_name, self.engine)
+    
     def load_table(self, table_name: str, validate_schema: bool = True, 
-                   cache: bool = True, **kwargs) -> pd.DataFrame:
+                   cache: bool = True, columns: Optional[List[str]] = None,
+                   **kwargs) -> pd.DataFrame:
         """
         Load a table from CSV file.
         
+        Column types from the schema configuration are applied while the CSV
+        is parsed, so columns are not materialized as inferred objects first.
+        
         Args:
             table_name: Name of the table to load
             validate_schema: Whether to validate against schema configuration
             cache: Whether to cache the loaded data
+            columns: Only load these columns (in this order)
             **kwargs: Additional arguments passed to pd.read_csv()
             
         Returns:
@@ -103,16 +351,16 @@ class DataLoader:
             DataValidationError: If schema validation fails
         """
         # Check cache first
-        if cache and table_name in self._data_cache:
+        cached = self._data_cache.get(table_name) if cache else None
+        if cached is not None:
             logger.debug(f"Loading {table_name} from cache")
-            return self._data_cache[table_name].copy()
+            return cached[columns] if columns is not None else cached
         
         # Find the file
         if table_name not in self._file_mapping:
             raise FileNotFoundError(f"Table '{table_name}' not found. Available tables: {self.get_available_tables()}")
         
         file_path = self._file_mapping[table_name]
-        logger.info(f"Loading table '{table_name}' from {file_path}")
         
         try:
             # Load CSV with default parameters
@@ -122,21 +370,36 @@ class DataLoader:
             }
             default_kwargs.update(kwargs)
             
-            df = pd.read_csv(file_path, **default_kwargs)
+            cache_key = self._table_cache_key(table_name, default_kwargs) if self.columnar_cache else None
+            df = self._read_columnar_cache(table_name, file_path, cache_key, columns) if cache_key else None
             
-            # Basic data cleaning
-            df = self._clean_data(df, table_name)
-            
-            # Validate schema if requested
-            if validate_schema:
-                self._validate_schema(df, table_name)
-            
-            # Apply data type conversions
-            df = self._apply_data_types(df, table_name)
+            if df is not None:
+                logger.info(f"Loading table '{table_name}' from columnar cache")
+                if validate_schema:
+                    self._validate_schema(df, table_name, columns)
+            else:
+                logger.info(f"Loading table '{table_name}' from {file_path}")
+                df = self._read_csv(file_path, table_name, default_kwargs, columns)
+                
+                # Basic data cleaning
+                df = self._clean_data(df, table_name, drop_empty=columns is None,
+                                      na_applied=bool(self.na_values) or 'na_values' in default_kwargs)
+                
+                # Validate schema if requested
+                if validate_schema:
+                    self._validate_schema(df, table_name, columns)
+                
+                # Apply data type conversions
+                df = self._apply_data_types(df, table_name)
+                df = self._encode_categoricals(df, table_name)
+                
+                # Only complete tables are stored in the columnar cache
+                if cache_key and columns is None:
+                    self._write_columnar_cache(table_name, file_path, cache_key, df)
             
-            # Cache if requested
-            if cache:
-                self._data_cache[table_name] = df.copy()
+            # Cache if requested (projections are not cached)
+            if cache and columns is None:
+                df = self._data_cache.put(table_name, df)
             
             logger.info(f"Successfully loaded {table_name}: {df.shape[0]} rows, {df.shape[1]} columns")
             return df
@@ -145,37 +408,338 @@ class DataLoader:
             logger.error(f"Failed to load table '{table_name}': {e}")
             raise
     
-    def _clean_data(self, df: pd.DataFrame, table_name: str) -> pd.DataFrame:
+    def iter_table(self, table_name: str, chunksize: int = 100_000,
+                   columns: Optional[List[str]] = None, validate_schema: bool = True,
+                   **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Stream a table as cleaned, typed chunks without loading it fully.
+        
+        Chunks get the same cleaning and schema type conversions as
+        ``load_table``, so a table with a schema yields the same dtypes in
+        every chunk. Empty rows are dropped per chunk; empty columns are
+        kept so all chunks share one set of columns. Chunks are read with
+        the C parser and bypass the table caches.
+        
+        Args:
+            table_name: Name of the table to load
+            chunksize: Maximum number of rows per chunk
+            columns: Only load these columns (in this order)
+            validate_schema: Whether to validate the columns against the schema
+            **kwargs: Additional arguments passed to pd.read_csv()
+            
+        Yields:
+            DataFrame chunks of at most ``chunksize`` rows
+            
+        Raises:
+            FileNotFoundError: If table file is not found
+            DataValidationError: If schema validation fails
+        """
+        if table_name not in self._file_mapping:
+            raise FileNotFoundError(f"Table '{table_name}' not found. Available tables: {self.get_available_tables()}")
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be positive, got {chunksize}")
+        
+        file_path = self._file_mapping[table_name]
+        options = self._read_options(table_name, columns)
+        options.update({'encoding': 'utf-8'}, **kwargs)
+        options.pop('low_memory', None)
+        header = pd.read_csv(file_path, nrows=0, encoding=options['encoding']).columns
+        if isinstance(options.get('dtype'), dict):
+            options['dtype'] = {c: t for c, t in options['dtype'].items() if c in header}
+        if isinstance(options.get('parse_dates'), list):
+            options['parse_dates'] = [c for c in options['parse_dates'] if c in header]
+        
+        logger.info(f"Streaming table '{table_name}' from {file_path} in chunks of {chunksize} rows")
+        rows_read = 0
+        first = True
+        while True:
+            try:
+                # Resume after the rows already yielded (skiprows keeps the header)
+                skiprows = range(1, rows_read + 1) if rows_read else None
+                for chunk in pd.read_csv(file_path, chunksize=chunksize, skiprows=skiprows, **options):
+                    chunk.index = pd.RangeIndex(rows_read, rows_read + len(chunk))
+                    rows_read += len(chunk)
+                    if columns is not None:
+                        chunk = chunk[list(columns)]
+                    else:
+                        chunk = chunk.dropna(how='all')
+                    chunk = self._clean_data(chunk, table_name, drop_empty=False,
+                                             na_applied='na_values' in options)
+                    if first and validate_schema:
+                        self._validate_schema(chunk, table_name, columns)
+                    first = False
+                    yield self._apply_data_types(chunk, table_name)
+                return
+            except (ValueError, TypeError) as e:
+                if 'dtype' not in options and 'parse_dates' not in options:
+                    raise
+                logger.debug(f"Schema dtypes did not apply to {table_name} ({e}); inferring types")
+                options.pop('dtype', None)
+                options.pop('parse_dates', None)
+    
+    def _read_options(self, table_name: str, columns: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Build ``pd.read_csv`` options from the table's schema configuration.
+        
+        Args:
+            table_name: Name of the table
+            columns: Columns to project (None for all)
+            
+        Returns:
+            Dictionary with dtype, parse_dates, usecols and na_values entries
+        """
+        options: Dict[str, Any] = {}
+        if columns is not None:
+            options['usecols'] = list(columns)
+        if self.na_values:
+            options['na_values'] = list(self.na_values)
+        
+        table_config = self.config.get_table_config(table_name)
+        if not table_config:
+            return options
+        
+        dtype = {}
+        parse_dates = []
+        for column_config in table_config.columns:
+            if columns is not None and column_config.name not in columns:
+                continue
+            data_type = column_config.data_type.lower()
+            if 'int' in data_type:
+                dtype[column_config.name] = 'Int64'
+            elif 'float' in data_type or 'decimal' in data_type:
+                dtype[column_config.name] = 'float64'
+            elif 'date' in data_type or 'time' in data_type:
+                parse_dates.append(column_config.name)
+            else:
+                # Strings and booleans are converted from their source text
+                dtype[column_config.name] = str
+        
+        options['dtype'] = dtype
+        options['parse_dates'] = parse_dates
+        return options
+    
+    def _read_csv(self, file_path: Path, table_name: str, read_kwargs: Dict[str, Any],
+                  columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read a table's CSV with schema-driven dtypes and optional column projection.
+        
+        Falls back to type inference when values do not parse as their schema
+        type; ``_apply_data_types`` then coerces them as before.
+        """
+        options = self._read_options(table_name, columns)
+        options.update(read_kwargs)
+        
+        header = pd.read_csv(file_path, nrows=0, encoding=options.get('encoding', 'utf-8')).columns
+        if 'dtype' in options and isinstance(options['dtype'], dict):
+            options['dtype'] = {c: t for c, t in options['dtype'].items() if c in header}
+        if 'parse_dates' in options and isinstance(options['parse_dates'], list):
+            options['parse_dates'] = [c for c in options['parse_dates'] if c in header]
+        
+        reader = pd.read_csv
+        if self.get_table_engine(table_name) == 'pyarrow':
+            if set(options) <= ARROW_READ_KWARGS and isinstance(options.get('dtype', {}), dict):
+                reader = self._read_csv_arrow
+            else:
+                logger.debug(f"Arguments {sorted(set(options) - ARROW_READ_KWARGS)} need the C parser; "
+                             f"reading {table_name} with it")
+        
+        try:
+            df = reader(file_path, **options)
+        except (ValueError, TypeError) as e:
+            logger.debug(f"Schema dtypes did not apply to {table_name} ({e}); inferring types")
+            options.pop('dtype', None)
+            options.pop('parse_dates', None)
+            df = reader(file_path, **options)
+        
+        if columns is not None:
+            df = df[list(columns)]
+        return df
+    
+    def _read_csv_arrow(self, file_path: Path, encoding: str = 'utf-8',
+                        usecols: Optional[List[str]] = None, dtype: Optional[Dict[str, Any]] = None,
+                        parse_dates: Optional[List[str]] = None,
+                        na_values: Optional[List[str]] = None, **_) -> pd.DataFrame:
+        """
+        Read a CSV with the multi-threaded Arrow reader.
+        
+        The file is split into ``arrow_block_size`` blocks that are parsed in
+        parallel. String columns stay Arrow-backed; numeric columns convert as
+        the C parser would read them. Date columns are kept as text and
+        parsed by ``_apply_data_types``, like with the C parser.
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+        
+        arrow_types = {'Int64': pa.int64(), 'float64': pa.float64(), str: pa.string()}
+        column_types = {column: arrow_types.get(column_type, pa.string())
+                        for column, column_type in (dtype or {}).items()}
+        for column in parse_dates or []:
+            column_types[column] = pa.string()
+        
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=self.arrow_block_size,
+                                            encoding=encoding),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                include_columns=list(usecols) if usecols is not None else None,
+                null_values=CSV_NULL_VALUES + [v for v in na_values or [] if v not in CSV_NULL_VALUES],
+                strings_can_be_null=True,
+                # A literal-'%' format never matches, so no column is inferred as a
+                # timestamp (the C parser leaves undeclared dates as text too)
+                timestamp_parsers=['%%'],
+            ),
+        )
+        df = table.to_pandas()
+        for column, column_type in (dtype or {}).items():
+            if column_type == 'Int64' and column in df.columns:
+                df[column] = df[column].astype('Int64')
+        return df
+    
+    def _table_cache_key(self, table_name: str, read_kwargs: Dict[str, Any]) -> str:
+        """
+        Build the columnar cache key of a table from its schema and read options.
+        
+        Args:
+            table_name: Name of the table
+            read_kwargs: Arguments passed to the CSV reader
+            
+        Returns:
+            Hex digest identifying how the table is parsed and typed
+        """
+        table_config = self.config.get_table_config(table_name)
+        schema = [[c.name, c.data_type] for c in table_config.columns] if table_config else None
+        return hash_text(
+            str(TABLE_CACHE_VERSION),
+            json.dumps(schema),
+            json.dumps(read_kwargs, sort_keys=True, default=str),
+            self.get_table_engine(table_name),
+            json.dumps(self.na_values),
+            json.dumps([self.categorical_max_unique_ratio, self.categorical_min_rows]),
+            json.dumps([[c.name, c.categorical] for c in table_config.columns] if table_config else None),
+        )
+    
+    def _read_columnar_cache(self, table_name: str, file_path: Path, cache_key: str,
+                             columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Read a table from the columnar cache if it is still valid.
+        
+        The cache is valid when the schema key and source file size match and
+        either the modification time or the content hash is unchanged.
+        
+        Returns:
+            Cached DataFrame, or None on a cache miss
+        """
+        meta_file = self.columnar_cache_dir / f"{table_name}.json"
+        parquet_file = self.columnar_cache_dir / f"{table_name}.parquet"
+        if not meta_file.exists() or not parquet_file.exists():
+            return None
+        
+        try:
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            
+            stat = file_path.stat()
+            if meta.get('cache_key') != cache_key or meta.get('size') != stat.st_size:
+                return None
+            
+            if meta.get('mtime_ns') != stat.st_mtime_ns:
+                # Touched but possibly unchanged: fall back to the content hash
+                if meta.get('sha256') != hash_file(file_path):
+                    return None
+                meta['mtime_ns'] = stat.st_mtime_ns
+                with open(meta_file, 'w', encoding='utf-8') as f:
+                    json.dump(meta, f, indent=2)
+            
+            df = pd.read_parquet(parquet_file, columns=list(columns) if columns is not None else None)
+            
+            # Parquet stores missing dates in object (datetime.date) columns as None
+            table_config = self.config.get_table_config(table_name)
+            for column_config in (table_config.columns if table_config else []):
+                data_type = column_config.data_type.lower()
+                if ('date' in data_type and 'datetime' not in data_type and 'timestamp' not in data_type
+                        and column_config.name in df.columns and df[column_config.name].dtype == object):
+                    df[column_config.name] = df[column_config.name].where(df[column_config.name].notna(), pd.NaT)
+            return df
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable columnar cache for {table_name}: {e}")
+            return None
+    
+    def _write_columnar_cache(self, table_name: str, file_path: Path, cache_key: str,
+                              df: pd.DataFrame):
+        """Store a cleaned, typed table in the columnar cache."""
+        parquet_file = self.columnar_cache_dir / f"{table_name}.parquet"
+        tmp_file = parquet_file.with_suffix('.parquet.tmp')
+        try:
+            self.columnar_cache_dir.mkdir(parents=True, exist_ok=True)
+            stat = file_path.stat()
+            meta = {
+                'table_name': table_name,
+                'source': str(file_path),
+                'cache_key': cache_key,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': hash_file(file_path),
+                'created': datetime.now().isoformat(),
+            }
+            df.to_parquet(tmp_file)
+            os.replace(tmp_file, parquet_file)
+            
+            # Metadata is written last so a partial entry is never read
+            with open(self.columnar_cache_dir / f"{table_name}.json", 'w', encoding='utf-8') as f:
+                json.dump(meta, f, indent=2)
+        except Exception as e:
+            logger.warning(f"Could not write columnar cache for {table_name}: {e}")
+            if tmp_file.exists():
+                tmp_file.unlink()
+    
+    def _clean_data(self, df: pd.DataFrame, table_name: str,
+                    drop_empty: bool = True, na_applied: bool = False) -> pd.DataFrame:
         """
         Apply basic data cleaning operations.
         
         Args:
             df: Input DataFrame
             table_name: Name of the table
+            drop_empty: Whether to drop completely empty rows and columns
+                (disabled for column projections, where emptiness depends
+                on columns that were not read)
+            na_applied: Whether the reader was given ``na_values``; null
+                text was then parsed as NaN at read time, so only values
+                that strip to nothing are nulled
             
         Returns:
             Cleaned DataFrame
         """
         # Remove completely empty rows and columns
-        df = df.dropna(how='all').dropna(axis=1, how='all')
+        if drop_empty:
+            df = df.dropna(how='all').dropna(axis=1, how='all')
         
-        # Strip whitespace from string columns
-        string_columns = df.select_dtypes(include=['object']).columns
-        for col in string_columns:
-            if df[col].dtype == 'object':
-                df[col] = df[col].astype(str).str.strip()
-                # Convert 'nan' strings back to NaN
-                df[col] = df[col].replace(['nan', 'None', ''], np.nan)
+        # Strip whitespace from string values (missing and non-string values
+        # are left as they are) and null out empty text in the same pass;
+        # null literals are only searched for when the reader skipped them
+        for col in df.columns:
+            dtype = df[col].dtype
+            if dtype == object:
+                stripped = df[col].str.strip()
+                text = stripped.where(stripped.notna(), df[col])
+            elif isinstance(dtype, pd.StringDtype):
+                text = df[col].str.strip()
+            else:
+                continue
+            df[col] = text.mask(text == '' if na_applied else text.isin(NULL_STRINGS))
         
         return df
     
-    def _validate_schema(self, df: pd.DataFrame, table_name: str):
+    def _validate_schema(self, df: pd.DataFrame, table_name: str,
+                         columns: Optional[List[str]] = None):
         """
         Validate DataFrame against schema configuration.
         
         Args:
             df: DataFrame to validate
             table_name: Name of the table
+            columns: Columns that were requested (only these are expected)
             
         Raises:
             DataValidationError: If validation fails
@@ -185,6 +749,9 @@ class DataLoader:
             return
         
         validation_result = self.config.validate_table_columns(table_name, df.columns.tolist())
+        if columns is not None:
+            validation_result['missing'] = [c for c in validation_result['missing'] if c in columns]
+            validation_result['extra'] = []
         
         if validation_result['missing']:
             logger.warning(f"Missing columns in {table_name}: {validation_result['missing']}")
@@ -243,12 +810,18 @@ class DataLoader:
         data_type_lower = data_type.lower()
         
         if 'int' in data_type_lower:
+            if isinstance(series.dtype, pd.Int64Dtype):
+                return series  # Already typed at read time
             return pd.to_numeric(series, errors='coerce').astype('Int64')
         
         elif 'float' in data_type_lower or 'decimal' in data_type_lower:
+            if pd.api.types.is_float_dtype(series.dtype):
+                return series
             return pd.to_numeric(series, errors='coerce')
         
         elif 'datetime' in data_type_lower or 'timestamp' in data_type_lower:
+            if isinstance(series.dtype, pd.DatetimeTZDtype) and str(series.dt.tz) == 'UTC':
+                return series
             return pd.to_datetime(series, errors='coerce', utc=True)
         
         elif 'date' in data_type_lower:
@@ -264,6 +837,40 @@ class DataLoader:
             # Default to string
             return series.astype(str)
     
+    def _encode_categoricals(self, df: pd.DataFrame, table_name: str) -> pd.DataFrame:
+        """
+        Convert low-cardinality text columns to categoricals.
+        
+        Columns flagged ``categorical`` in the schema are always converted
+        (and never when flagged False); other text columns are converted when
+        the table is large enough and few enough of their values are distinct.
+        
+        Args:
+            df: Input DataFrame
+            table_name: Name of the table
+            
+        Returns:
+            DataFrame with categorical columns
+        """
+        table_config = self.config.get_table_config(table_name)
+        flags = {c.name: c.categorical for c in table_config.columns} if table_config else {}
+        auto = (self.categorical_max_unique_ratio is not None
+                and len(df) >= self.categorical_min_rows)
+        
+        for col in df.columns:
+            dtype = df[col].dtype
+            if not (isinstance(dtype, pd.StringDtype)
+                    or (dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) == 'string')):
+                continue
+            flag = flags.get(col)
+            if flag is False or (flag is None and not auto):
+                continue
+            if flag is None and df[col].nunique() > self.categorical_max_unique_ratio * len(df):
+                continue
+            df[col] = df[col].astype('category')
+        
+        return df
+    
     def _infer_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Infer appropriate data types when no schema is available.
@@ -284,40 +891,128 @@ class DataLoader:
                     pass
             
             # Try to convert numeric columns
-            if df[col].dtype == 'object':
+            if df[col].dtype == object or isinstance(df[col].dtype, pd.StringDtype):
                 # Try integer first
                 numeric = pd.to_numeric(df[col], errors='coerce')
                 if not numeric.isna().all():
                     # Check if all non-null values are integers
-                    if numeric.dropna().apply(lambda x: x.is_integer()).all():
+                    values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+                    values = values[~np.isnan(values)]
+                    if (np.mod(values, 1) == 0).all():
                         df[col] = numeric.astype('Int64')
                     else:
                         df[col] = numeric
         
         return df
     
-    def load_multiple_tables(self, table_names: List[str], **kwargs) -> Dict[str, pd.DataFrame]:
+    def load_multiple_tables(self, table_names: List[str], max_workers: Optional[int] = None,
+                             executor: Optional[str] = None, strict: bool = False,
+                             **kwargs) -> Dict[str, pd.DataFrame]:
         """
-        Load multiple tables at once.
+        Load multiple tables at once, concurrently on a worker pool.
+        
+        A table that fails to load is logged and left out of the result
+        without affecting the others. Per-table timings, row counts and
+        errors are kept in ``load_stats``.
         
         Args:
             table_names: List of table names to load
+            max_workers: Number of tables to load concurrently; 1 loads them
+                one after another (default: ``loader.max_workers``)
+            executor: "thread" or "process" pool (default: ``loader.executor``)
+            strict: Whether to raise the first load error
             **kwargs: Arguments passed to load_table()
             
         Returns:
-            Dictionary mapping table names to DataFrames
+            Dictionary mapping table names to DataFrames (in requested order)
         """
-        results = {}
+        max_workers = max(1, int(max_workers or self.config.get_setting('loader.max_workers', 1)))
+        executor = executor or self.config.get_setting('loader.executor', 'thread')
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}. Expected one of {list(EXECUTORS)}")
+        
+        table_names = list(dict.fromkeys(table_names))
+        loaded: Dict[str, pd.DataFrame] = {}
+        
+        def record(table_name: str, df: Optional[pd.DataFrame], seconds: float,
+                   error: Optional[Exception] = None):
+            self.load_stats[table_name] = {
+                'seconds': round(seconds, 4),
+                'rows': len(df) if df is not None else None,
+                'error': str(error) if error is not None else None,
+            }
+            if error is not None:
+                logger.error(f"Failed to load table {table_name}: {error}")
+                if strict:
+                    raise error
+            else:
+                logger.debug(f"Loaded {table_name} in {seconds:.2f}s")
+                loaded[table_name] = df
         
+        if max_workers == 1 or len(table_names) <= 1:
+            for table_name in table_names:
+                df, seconds, error = self._timed_load(table_name, kwargs)
+                record(table_name, df, seconds, error)
+            return {name: loaded[name] for name in table_names if name in loaded}
+        
+        # Cached tables are served directly; only the rest go to the pool
+        use_cache = kwargs.get('cache', True) and kwargs.get('columns') is None
+        pending = []
         for table_name in table_names:
+            if use_cache and table_name in self._data_cache:
+                df, seconds, error = self._timed_load(table_name, kwargs)
+                record(table_name, df, seconds, error)
+            else:
+                pending.append(table_name)
+        
+        pool_workers = min(max_workers, max(1, len(pending)))
+        if executor == 'thread':
+            pool = ThreadPoolExecutor(max_workers=pool_workers)
+        else:
+            # Workers are spawned rather than forked since Arrow threads may be live
+            pool = ProcessPoolExecutor(max_workers=pool_workers,
+                                       mp_context=multiprocessing.get_context("spawn"))
+        with pool:
+            if executor == 'thread':
+                futures = {pool.submit(self._timed_load, name, kwargs): name for name in pending}
+            else:
+                process_kwargs = {k: v for k, v in kwargs.items() if k != 'cache'}
+                futures = {
+                    pool.submit(_load_table_in_process, self.data_path, self.config,
+                                self.columnar_cache, self.get_table_engine(name), name,
+                                process_kwargs): name
+                    for name in pending
+                }
             try:
-                results[table_name] = self.load_table(table_name, **kwargs)
-            except Exception as e:
-                logger.error(f"Failed to load table {table_name}: {e}")
-                if kwargs.get('strict', False):
-                    raise
+                for future in as_completed(futures):
+                    table_name = futures[future]
+                    if executor == 'thread':
+                        df, seconds, error = future.result()
+                    else:
+                        try:
+                            df, seconds = future.result()
+                            error = None
+                            if use_cache:
+                                df = self._data_cache.put(table_name, df)
+                        except Exception as e:
+                            df, seconds, error = None, 0.0, e
+                    record(table_name, df, seconds, error)
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
         
-        return results
+        return {name: loaded[name] for name in table_names if name in loaded}
+    
+    def _timed_load(self, table_name: str, kwargs: Dict[str, Any]
+                    ) -> Tuple[Optional[pd.DataFrame], float, Optional[Exception]]:
+        """Load a table, returning (frame, seconds, error) instead of raising."""
+        start = time.perf_counter()
+        try:
+            df = self.load_table(table_name, **kwargs)
+            return df, time.perf_counter() - start, None
+        except Exception as e:
+            return None, time.perf_counter() - start, e
     
     def get_table_info(self, table_name: str) -> Dict[str, Any]:
         """
@@ -363,18 +1058,25 @@ class DataLoader:
         
         return info
     
-    def clear_cache(self):
-        """Clear the data cache."""
+    def clear_cache(self, columnar: bool = False):
+        """
+        Clear the data cache.
+        
+        Args:
+            columnar: Also remove the on-disk columnar cache
+        """
         self._data_cache.clear()
         logger.info("Data cache cleared")
+        
+        if columnar and self.columnar_cache_dir.exists():
+            for cache_file in self.columnar_cache_dir.glob("*"):
+                if cache_file.suffix in ('.parquet', '.json', '.tmp'):
+                    cache_file.unlink()
+            logger.info(f"Columnar cache cleared: {self.columnar_cache_dir}")
     
     def get_cache_info(self) -> Dict[str, Any]:
-        """Get information about cached data."""
-        return {
-            'cached_tables': list(self._data_cache.keys()),
-            'cache_size': len(self._data_cache),
-            'memory_usage': sum(df.memory_usage(deep=True).sum() for df in self._data_cache.values())
-        }
+        """Get information about cached data (contents, memory use, hits, misses and evictions)."""
+        return self._data_cache.info()
 
 
 # Convenience functions
@@ -1,55 +1,248 @@
+import argparse
+import shutil
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
+try:
+    from .configuration import get_config
+except ImportError:  # executed as a script from the nbo/ directory
+    from configuration import get_config
 
 DECISION_DAY = pd.Timestamp("2025-08-22 00:00:00", tz="UTC")
 cutoff = DECISION_DAY - pd.Timedelta(hours=72)
 
-# Load offer catalog data
-try:
-    offer_catalog_v1 = pd.read_parquet("offer_catalog_v1.parquet")
-except FileNotFoundError:
-    try:
-        offer_catalog_v1 = pd.read_csv("offer_catalog_v1.csv")
-    except FileNotFoundError:
-        raise SystemExit("Error: Missing both offer_catalog_v1.parquet and offer_catalog_v1.csv")
+INPUT_TABLES    = ["offer_catalog_v1", "feature_mart"]
+OPTIONAL_TABLES = ["touch_history"]
+OUTPUT_TABLES   = ["scored_candidates"]
+SETTINGS_SECTION = "candidates"  # settings passed to run()/extra_outputs() as keywords
 
-try:
-    touches = pd.read_csv("touch_history.csv")
+DATASET_DIR = "scored_candidates"  # partitioned output: scored_candidates/guest_bucket=<b>/part-0.parquet
+
+def fatigue_window(touches):
+    """Guest/promotion pairs touched within the fatigue window."""
+    if touches is None:
+        return pd.DataFrame(columns=["guest_id","promotion_id"])
+    touches = touches.copy()
     touches["touch_ts"] = pd.to_datetime(touches["touch_ts"], utc=True, errors="coerce")
     # Map offer_id to promotion_id for consistency
     touches = touches.rename(columns={"offer_id": "promotion_id"})
-    v_fatigue_72h_v1 = (touches
+    return (touches
         .loc[(touches["touch_ts"] >= cutoff) & (touches["touch_ts"] < DECISION_DAY), ["guest_id","promotion_id"]]
         .drop_duplicates())
-except FileNotFoundError:
-    v_fatigue_72h_v1 = pd.DataFrame(columns=["guest_id","promotion_id"])
-
-# guests_today = latest as-of slice
-fm = pd.read_parquet("feature_mart.parquet")
-if "asof_date" in fm.columns:
-    fm["asof_date"] = pd.to_datetime(fm["asof_date"], utc=True, errors="coerce")
-    guests_today = (fm.sort_values(["guest_id","asof_date"])
-                      .drop_duplicates(["guest_id"], keep="last")[["guest_id"]])
-else:
-    guests_today = fm[["guest_id"]].drop_duplicates()
-
-active = offer_catalog_v1.loc[
-    (pd.to_datetime(offer_catalog_v1["start_date"], utc=True) <= DECISION_DAY) &
-    (DECISION_DAY <= pd.to_datetime(offer_catalog_v1["end_date"], utc=True)) &
-    (offer_catalog_v1["legal_flag"] == True)
-].copy()
-
-candidates = guests_today.assign(key=1).merge(active.assign(key=1), on="key").drop(columns=["key"])
-candidates["decision_time"] = DECISION_DAY
-
-# Anti-join fatigue
-if not v_fatigue_72h_v1.empty:
-    candidates = candidates.merge(v_fatigue_72h_v1.assign(fatigue_hit=1), on=["guest_id","promotion_id"], how="left")
-    candidates = candidates[candidates["fatigue_hit"].isna()].drop(columns=["fatigue_hit"])
-
-# Save output
-candidates.to_parquet("scored_candidates.parquet", index=False)
-candidates.to_csv("scored_candidates.csv", index=False)
-
-print(f"Generated {len(candidates)} candidate offers")
-print(f"Columns: {list(candidates.columns)}")
 
+def latest_guests(fm):
+    """Today's guests: the latest as-of slice of the feature mart."""
+    if "asof_date" in fm.columns:
+        fm = fm.assign(asof_date=pd.to_datetime(fm["asof_date"], utc=True, errors="coerce"))
+        return (fm.sort_values(["guest_id","asof_date"])
+                  .drop_duplicates(["guest_id"], keep="last")[["guest_id"]])
+    return fm[["guest_id"]].drop_duplicates()
+
+def active_offers(offer_catalog_v1):
+    """Legal offers whose window contains the decision day."""
+    return offer_catalog_v1.loc[
+        (pd.to_datetime(offer_catalog_v1["start_date"], utc=True) <= DECISION_DAY) &
+        (DECISION_DAY <= pd.to_datetime(offer_catalog_v1["end_date"], utc=True)) &
+        (offer_catalog_v1["legal_flag"] == True)
+    ]
+
+def guest_buckets(guest_ids, n_buckets):
+    """Stable hash bucket (hash(guest_id) mod n_buckets) of each guest."""
+    if n_buckets < 1:
+        raise ValueError(f"n_buckets must be at least 1, got {n_buckets}")
+    hashes = pd.util.hash_pandas_object(pd.Series(guest_ids), index=False).to_numpy()
+    return (hashes % np.uint64(n_buckets)).astype(np.int64)
+
+def fatigue_hits(guest_ids, promotion_ids, fatigued):
+    """(guest_idx, offer_idx) positions of fatigued guest/offer pairs."""
+    if fatigued.empty:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    # promotion_id may repeat in the catalog; a fatigue hit covers every row of it
+    promo_codes, promo_uniques = pd.factorize(promotion_ids)
+    hits = pd.DataFrame({
+        "guest_idx": pd.Index(guest_ids).get_indexer_for(fatigued["guest_id"]),
+        "promo_code": pd.Index(promo_uniques).get_indexer_for(fatigued["promotion_id"]),
+    })
+    hits = hits[(hits["guest_idx"] >= 0) & (hits["promo_code"] >= 0)]
+    hits = hits.merge(pd.DataFrame({"promo_code": promo_codes, "offer_idx": np.arange(len(promotion_ids))}),
+                      on="promo_code")
+    return hits["guest_idx"].to_numpy(np.int64), hits["offer_idx"].to_numpy(np.int64)
+
+def candidate_pairs(guests_today, active, fatigued, n_buckets=1):
+    """
+    Yield (bucket, guest_idx, offer_idx) of non-fatigued pairs, one guest bucket at a time.
+
+    Guests and offers are positions in `guests_today`/`active`. Pairs are
+    enumerated by their code guest*n_offers+offer with the (sorted) codes
+    of the bucket's fatigue hits skipped, so besides the pair indices only
+    hit-sized arrays are allocated: no per-pair mask and no pair-level frame.
+    """
+    guest_ids = guests_today.to_numpy()
+    promotion_ids = active["promotion_id"].to_numpy()
+    bucket_of = guest_buckets(guests_today, n_buckets)
+    # Fatigued pairs go to their guest's bucket; pairs of other guests are dropped
+    fatigued_guest = pd.Index(guest_ids).get_indexer_for(fatigued["guest_id"])
+    fatigued = fatigued[fatigued_guest >= 0]
+    fatigued_bucket = bucket_of[fatigued_guest[fatigued_guest >= 0]]
+    n_offers = len(active)
+    for bucket in range(n_buckets):
+        members = np.flatnonzero(bucket_of == bucket)
+        hit_guest, hit_offer = fatigue_hits(guest_ids[members], promotion_ids,
+                                            fatigued[fatigued_bucket == bucket])
+        hit_codes = np.unique(hit_guest * n_offers + hit_offer)
+        codes = np.arange(len(members) * n_offers - len(hit_codes), dtype=np.int64)
+        if len(hit_codes):
+            # The k-th kept code moves past every hit code h_j with h_j - j <= k
+            codes += np.searchsorted(hit_codes - np.arange(len(hit_codes)), codes, side="right")
+        local_guest, offer_idx = np.divmod(codes, max(n_offers, 1))
+        yield bucket, members[local_guest], offer_idx
+
+def candidate_frame(guests_today, active, guest_idx, offer_idx):
+    """
+    Materialize pairs as (guest_id, promotion_id, offer_idx).
+
+    Catalog attributes are not copied onto each pair; consumers attach the
+    ones they need by offer index with `attach_offer_attributes`.
+    """
+    return pd.DataFrame({
+        "guest_id": guests_today.to_numpy()[guest_idx],
+        "promotion_id": active["promotion_id"].to_numpy()[offer_idx],
+        "offer_idx": offer_idx.astype(np.int32),
+    })
+
+def attach_offer_attributes(candidates, offer_catalog_v1, columns):
+    """
+    Add catalog columns to candidates by their `offer_idx`.
+
+    Args:
+        candidates: Candidate pairs from this module
+        offer_catalog_v1: Catalog the candidates were generated from
+        columns: Catalog columns to attach
+    """
+    active = active_offers(offer_catalog_v1)
+    offer_idx = candidates["offer_idx"].to_numpy()
+    return candidates.assign(**{col: active[col].to_numpy()[offer_idx] for col in columns})
+
+def iter_candidate_buckets(offer_catalog_v1, fm, touches=None, n_buckets=1):
+    """Yield (bucket, candidates) for each guest hash bucket."""
+    guests_today = latest_guests(fm)["guest_id"]
+    active = active_offers(offer_catalog_v1)
+    for bucket, guest_idx, offer_idx in candidate_pairs(guests_today, active, fatigue_window(touches), n_buckets):
+        yield bucket, candidate_frame(guests_today, active, guest_idx, offer_idx)
+
+def build_candidates(offer_catalog_v1, fm, touches=None, n_buckets=1):
+    """Pair active offers with today's guests, skipping fatigued pairs."""
+    guests_today = latest_guests(fm)["guest_id"]
+    active = active_offers(offer_catalog_v1)
+    pairs = list(candidate_pairs(guests_today, active, fatigue_window(touches), n_buckets))
+    guest_idx = np.concatenate([g for _, g, _ in pairs])
+    offer_idx = np.concatenate([o for _, _, o in pairs])
+    if n_buckets > 1:
+        # Same row order as a single bucket: by guest, then by offer
+        order = np.lexsort((offer_idx, guest_idx))
+        guest_idx, offer_idx = guest_idx[order], offer_idx[order]
+    return candidate_frame(guests_today, active, guest_idx, offer_idx)
+
+def write_candidate_dataset(buckets, directory):
+    """
+    Write candidate buckets as a partitioned parquet dataset.
+
+    Args:
+        buckets: Iterable of (bucket, candidates), consumed one bucket at a time
+        directory: Dataset root; replaced if it already exists
+
+    Returns:
+        List of part files written
+    """
+    directory = Path(directory)
+    if directory.exists():
+        shutil.rmtree(directory)
+    written = []
+    for bucket, candidates in buckets:
+        if candidates.empty:
+            continue
+        part_dir = directory / f"guest_bucket={bucket}"
+        part_dir.mkdir(parents=True, exist_ok=True)
+        candidates.to_parquet(part_dir / "part-0.parquet", index=False)
+        written.append(part_dir / "part-0.parquet")
+    return written
+
+def dataset_parts(directory):
+    """Part files of a partitioned candidate dataset, in bucket order."""
+    return sorted(Path(directory).glob("guest_bucket=*/part-0.parquet"),
+                  key=lambda part: int(part.parent.name.split("=", 1)[1]))
+
+def run(tables, n_buckets=1, write_partitioned=False, dataset_dir=DATASET_DIR):
+    """
+    In-process entry point used by NBOPipeline.
+
+    With `write_partitioned`, buckets are streamed to the partitioned
+    dataset and no frame is returned: the dataset is the step's output and
+    NBOPipeline reads it back only for steps that consume scored_candidates.
+    """
+    if write_partitioned:
+        write_candidate_dataset(iter_candidate_buckets(tables["offer_catalog_v1"], tables["feature_mart"],
+                                                       tables.get("touch_history"), n_buckets),
+                                dataset_dir)
+        return {}
+    candidates = build_candidates(tables["offer_catalog_v1"], tables["feature_mart"],
+                                  tables.get("touch_history"), n_buckets=n_buckets)
+    return {"scored_candidates": candidates}
+
+def extra_outputs(n_buckets=1, write_partitioned=False, dataset_dir=DATASET_DIR):
+    """Files run() wrote itself, reported to NBOPipeline: the partitioned candidate dataset."""
+    if not write_partitioned:
+        return []
+    return dataset_parts(dataset_dir)
+
+def main():
+    config = get_config()
+    parser = argparse.ArgumentParser(description="Generate guest/offer candidates")
+    parser.add_argument("--buckets", type=int, default=config.get_setting("candidates.n_buckets", 1),
+                        help="Process guests in N hash buckets (default: candidates.n_buckets)")
+    parser.add_argument("--partitioned", action="store_true",
+                        default=config.get_setting("candidates.write_partitioned", False),
+                        help=f"Write a partitioned {DATASET_DIR}/ dataset instead of one file "
+                             "(default: candidates.write_partitioned)")
+    args = parser.parse_args()
+    if args.buckets < 1:
+        raise ValueError(f"--buckets must be at least 1, got {args.buckets}")
+
+    # Load offer catalog data
+    try:
+        offer_catalog_v1 = pd.read_parquet("offer_catalog_v1.parquet")
+    except FileNotFoundError:
+        try:
+            offer_catalog_v1 = pd.read_csv("offer_catalog_v1.csv")
+        except FileNotFoundError:
+            raise SystemExit("Error: Missing both offer_catalog_v1.parquet and offer_catalog_v1.csv")
+
+    try:
+        touches = pd.read_csv("touch_history.csv")
+    except FileNotFoundError:
+        touches = None
+
+    fm = pd.read_parquet("feature_mart.parquet")
+
+    if args.partitioned:
+        # Buckets go straight to the dataset; the full frame is never built
+        parts = write_candidate_dataset(iter_candidate_buckets(offer_catalog_v1, fm, touches, args.buckets),
+                                        DATASET_DIR)
+        # Drop single-file outputs of an earlier run so later steps read the dataset
+        for stale in ("scored_candidates.parquet", "scored_candidates.csv"):
+            Path(stale).unlink(missing_ok=True)
+        print(f"Wrote {len(parts)} candidate partitions to {DATASET_DIR}/")
+        return
+
+    candidates = build_candidates(offer_catalog_v1, fm, touches, n_buckets=args.buckets)
+
+    # Save output
+    candidates.to_parquet("scored_candidates.parquet", index=False)
+    candidates.to_csv("scored_candidates.csv", index=False)
+
+    print(f"Generated {len(candidates)} candidate offers")
+    print(f"Columns: {list(candidates.columns)}")
+
+if __name__ == "__main__":
+    main()
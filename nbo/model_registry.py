@@ -0,0 +1,132 @@
+"""
+Local registry of fitted models.
+
+Models are stored under a key derived from the training data hash, the
+feature list, the hyperparameters and the model version, so scoring runs can
+reuse a fitted model until the training snapshot or model definition changes.
+"""
+
+import json
+import pickle
+import hashlib
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import datetime
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILE = "model.pkl"
+METADATA_FILE = "metadata.json"
+
+
+def hash_training_data(df: pd.DataFrame) -> str:
+    """Hash a training DataFrame's columns, dtypes and values into a hex digest."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(c), str(t)] for c, t in df.dtypes.items()]).encode('utf-8'))
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy(dtype=np.uint64)
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+def model_key(data_hash: str, feature_cols: List[str], params: Dict[str, Any],
+              model_version: str) -> str:
+    """Build a registry key from everything that determines a fitted model."""
+    payload = json.dumps({
+        'data_hash': data_hash,
+        'features': list(feature_cols),
+        'params': params,
+        'model_version': model_version,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ModelRegistry:
+    """Stores pickled models and their metadata, one directory per key."""
+
+    def __init__(self, registry_dir: Union[str, Path]):
+        """
+        Initialize the model registry.
+
+        Args:
+            registry_dir: Directory holding registered models
+        """
+        self.registry_dir = Path(registry_dir)
+        self.registry_dir.mkdir(parents=True, exist_ok=True)
+
+    def _model_dir(self, key: str) -> Path:
+        return self.registry_dir / key
+
+    def load(self, key: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """
+        Load a registered model.
+
+        Args:
+            key: Registry key
+
+        Returns:
+            Tuple of (model, metadata), or None if no model is registered under the key
+        """
+        model_dir = self._model_dir(key)
+        if not (model_dir / METADATA_FILE).exists():
+            return None
+
+        try:
+            with open(model_dir / METADATA_FILE, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+            with open(model_dir / MODEL_FILE, 'rb') as f:
+                model = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load registered model {key}: {e}")
+            return None
+
+        logger.info(f"Loaded model {metadata.get('model_version')} ({key[:12]}) from registry")
+        return model, metadata
+
+    def save(self, key: str, model: Any, metadata: Dict[str, Any]) -> Path:
+        """
+        Register a fitted model, replacing any model under the same key.
+
+        Args:
+            key: Registry key
+            model: Fitted model (must be picklable)
+            metadata: JSON-serializable description (features, params, version, ...)
+
+        Returns:
+            Directory the model was written to
+        """
+        model_dir = self._model_dir(key)
+        if model_dir.exists():
+            shutil.rmtree(model_dir)
+        model_dir.mkdir(parents=True)
+
+        with open(model_dir / MODEL_FILE, 'wb') as f:
+            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # Metadata is written last so a partial entry is never loaded
+        metadata = dict(metadata, key=key, created=datetime.now().isoformat())
+        with open(model_dir / METADATA_FILE, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2, default=str)
+
+        logger.info(f"Registered model {metadata.get('model_version')} ({key[:12]}) in {model_dir}")
+        return model_dir
+
+    def list_models(self) -> List[Dict[str, Any]]:
+        """Get metadata of all registered models, newest first."""
+        models = []
+        for metadata_file in self.registry_dir.glob(f"*/{METADATA_FILE}"):
+            try:
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    models.append(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable model metadata {metadata_file}: {e}")
+        return sorted(models, key=lambda m: m.get('created', ''), reverse=True)
+
+    def remove(self, key: str):
+        """Remove a registered model."""
+        model_dir = self._model_dir(key)
+        if model_dir.exists():
+            shutil.rmtree(model_dir)
@@ -1,57 +1,265 @@
+import argparse
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import GradientBoostingClassifier
-from sklearn.calibration import CalibratedClassifierCV
-from povenance import add_provenance_pdf
+try:
+    from .povenance import add_provenance_pdf, MODEL_VERSION
+    from .model_registry import ModelRegistry, hash_training_data, model_key
+    from .uplift import UpliftModel, feature_matrix
+    from .fatigue_candidates import DATASET_DIR, dataset_parts, attach_offer_attributes
+    from .configuration import get_config
+except ImportError:  # executed as a script from the nbo/ directory
+    from povenance import add_provenance_pdf, MODEL_VERSION
+    from model_registry import ModelRegistry, hash_training_data, model_key
+    from uplift import UpliftModel, feature_matrix
+    from fatigue_candidates import DATASET_DIR, dataset_parts, attach_offer_attributes
+    from configuration import get_config
+
+INPUT_TABLES  = ["modelling_set", "feature_mart", "scored_candidates", "offer_master"]
+OPTIONAL_TABLES = ["offer_catalog_v1"]  # offer-level features of candidates, by offer_idx
+OUTPUT_TABLES = ["model_scores_output"]
+SETTINGS_SECTION = "model"  # settings passed to run() as keywords
+
+# Hyperparameters (overridable from the "model" settings) that identify a fitted model
+MODEL_PARAMS = {"learner": "hist_gbm", "uplift_method": "t_learner", "n_estimators": 100,
+                "random_state": 42, "calibration_cv": 5, "min_control_samples": 10}
 
-modeling = pd.read_parquet("modelling_set.parquet")
 label_col = "response_within_window"
 treat_col = "treatment_flag"
-# Add these conversions before model training
-modeling = modeling.select_dtypes(include=np.number)  # Filter numeric columns only
+meta = {"guest_id","decision_time",label_col,treat_col,"train_split","fold_id","code_commit_sha"}
 
-# Or if you need to keep non-numeric columns, convert dates to numeric timestamps
-# modeling['asof_date'] = pd.to_datetime(modeling['asof_date']).astype(np.int64) // 10**9
+def feature_columns(modeling):
+    """Numeric, non-meta columns of the modeling set used as model features."""
+    # Or if you need to keep non-numeric columns, convert dates to numeric timestamps
+    # modeling['asof_date'] = pd.to_datetime(modeling['asof_date']).astype(np.int64) // 10**9
+    return [c for c in modeling.columns if c not in meta and np.issubdtype(modeling[c].dtype, np.number)]
 
-meta = {"guest_id","decision_time",label_col,treat_col,"train_split","fold_id","code_commit_sha"}
-feat_cols = [c for c in modeling.columns if c not in meta and np.issubdtype(modeling[c].dtype, np.number)]
+def model_params(settings=None):
+    """MODEL_PARAMS with any overrides from the "model" settings."""
+    settings = settings or {}
+    return {k: settings.get(k, v) for k, v in MODEL_PARAMS.items()}
 
-X_t = modeling.loc[modeling[treat_col]==1, feat_cols].fillna(0.0)
-y_t = modeling.loc[modeling[treat_col]==1, label_col].astype(int)
-X_c = modeling.loc[modeling[treat_col]==0, feat_cols].fillna(0.0)
-y_c = modeling.loc[modeling[treat_col]==0, label_col].astype(int)
+def train_model(modeling, settings=None):
+    """Fit the treatment/control uplift model; returns (model, feature columns)."""
+    params = model_params(settings)
+    # Add these conversions before model training
+    modeling = modeling.select_dtypes(include=np.number)  # Filter numeric columns only
+    feat_cols = feature_columns(modeling)
 
-# Add validation checks before model training
-# Replace lines 24-25
-# Original validation (causing error):
-# if len(X_t) == 0 or len(X_c) == 0:
-#     raise ValueError("Both treatment and control groups must contain samples. "
-#                      f"Current counts - Treatment: {len(X_t)}, Control: {len(X_c)}")
+    # One float32 matrix shared by the treatment and control fits
+    X = feature_matrix(modeling, feat_cols)
+    model = UpliftModel(params["uplift_method"], params, n_jobs=(settings or {}).get("n_jobs"))
+    model.fit(X, modeling[treat_col].to_numpy() == 1, modeling[label_col].to_numpy())
+    return model, feat_cols
 
-# New validation:
-if len(X_t) == 0:
-    raise ValueError("Treatment group must contain samples. Current count: 0")
+def get_model(modeling, registry_dir=None, retrain=False, settings=None):
+    """
+    Load the model for this training snapshot from the registry, training it if needed.
+
+    Args:
+        modeling: Modeling set
+        registry_dir: Model registry directory (None trains without registering)
+        retrain: Refit and re-register even if a matching model exists
+        settings: "model" settings (hyperparameter overrides, see MODEL_PARAMS, and n_jobs)
+
+    Returns:
+        Tuple of (model, feature columns)
+    """
+    if registry_dir is None:
+        return train_model(modeling, settings)
+
+    params = model_params(settings)
+    numeric = modeling.select_dtypes(include=np.number)
+    data_hash = hash_training_data(modeling)
+    key = model_key(data_hash, feature_columns(numeric), params, MODEL_VERSION)
+
+    registry = ModelRegistry(registry_dir)
+    if not retrain:
+        registered = registry.load(key)
+        if registered is not None:
+            model, metadata = registered
+            return model, metadata["features"]
+
+    model, feat_cols = train_model(modeling, settings)
+    registry.save(key, model, {
+        "model_version": MODEL_VERSION,
+        "features": feat_cols,
+        "params": params,
+        "training_data_hash": data_hash,
+        "training_rows": len(modeling),
+    })
+    return model, feat_cols
+
+# expected_ticket: prefer aov_28d > aov_90d > aov_365d
+def pick_ticket(r):
+    for c in ["aov_28d","aov_90d","aov_365d"]:     
+        if c in r and pd.notnull(r[c]) and r[c] > 0: return max(5.0, float(r[c]))
+    return 5.0
+
+# Update band parsing to handle string format
+def parse_discount_band(band_str):
+    try:
+        return [float(x.strip('%')) for x in band_str.replace('%','').split('-')]
+    except:
+        return [0.0]
+
+def explode_discount_bands(sc, band_codes, parsed_bands):
+    """
+    One row per candidate and allowed discount band up to the max discount.
+
+    Args:
+        sc: Scored candidates with uplift, expected_ticket, margin_pct,
+            base_price and max_discount_pct columns
+        band_codes: Index into `parsed_bands` for each row of `sc`
+        parsed_bands: Parsed band lists, one per distinct band string
+    """
+    parsed_bands = [bands or [0] for bands in parsed_bands]
+    n_bands = np.array([len(bands) for bands in parsed_bands], dtype=np.int64)
+    band_starts = np.concatenate([[0], np.cumsum(n_bands)[:-1]]).astype(np.int64)
+    flat_bands = np.array([b for bands in parsed_bands for b in bands], dtype=float)
+
+    # Repeat each candidate once per band of its promotion
+    row_n_bands = n_bands[band_codes]
+    row_idx = np.repeat(np.arange(len(sc)), row_n_bands)
+    within = np.arange(len(row_idx)) - np.repeat(np.cumsum(row_n_bands) - row_n_bands, row_n_bands)
+    band = flat_bands[band_starts[band_codes[row_idx]] + within]
+
+    # Convert max_discount_pct back to percentage for comparison
+    keep = band <= sc["max_discount_pct"].to_numpy()[row_idx] * 100
+    row_idx, band = row_idx[keep], band[keep]
+    if len(row_idx) == 0:
+        return pd.DataFrame()
+
+    exploded = sc.take(row_idx).reset_index(drop=True)
+    exploded["discount_band"] = band.astype(np.int64)
+    exploded["discount_cost"] = exploded["base_price"] * (band / 100.0)
+    exploded["cannibalization_penalty"] = 0.0  # until DiD/elasticity is plugged in
+    exploded["eim_raw"] = (exploded["uplift"] * exploded["expected_ticket"] * exploded["margin_pct"]
+                           - exploded["discount_cost"] - exploded["cannibalization_penalty"])
+    return exploded
+
+def predict_uplift(model, feat_cols, feat, candidates):
+    """
+    Attach features to candidates and predict p_treat, p_ctrl and uplift.
+
+    Features found in `feat` are guest-level: they are scored once per
+    distinct guest and broadcast back to candidates by guest index. Any
+    remaining feature columns are guest x offer features taken from
+    `candidates`, in which case every candidate row is scored.
+
+    Returns:
+        Tuple of (candidates with guest_id, promotion_id and feature columns,
+        (p_treat, p_ctrl, uplift) arrays)
+    """
+    guest_cols = [c for c in feat_cols if c in feat.columns]
+    offer_cols = [c for c in feat_cols if c not in feat.columns]
+
+    if not feat["guest_id"].is_unique:
+        # Several feature rows per guest multiply candidates; keep the row-level join
+        sc = candidates[["guest_id","promotion_id"]+offer_cols].merge(
+            feat[["guest_id"]+guest_cols], on="guest_id", how="left")[["guest_id","promotion_id"]+feat_cols]
+        return sc, model.predict(feature_matrix(sc, feat_cols))
+
+    guest_codes, guest_ids = pd.factorize(candidates["guest_id"], use_na_sentinel=False)
+    guests = pd.DataFrame({"guest_id": guest_ids}).merge(feat[["guest_id"]+guest_cols], on="guest_id", how="left")
+
+    sc = candidates[["guest_id","promotion_id"]+offer_cols].reset_index(drop=True)
+    sc = pd.concat([sc, guests[guest_cols].take(guest_codes).reset_index(drop=True)], axis=1)
+    sc = sc[["guest_id","promotion_id"]+feat_cols]
+
+    if offer_cols:
+        return sc, model.predict(feature_matrix(sc, feat_cols))
+    return sc, tuple(p[guest_codes] for p in model.predict(feature_matrix(guests, feat_cols)))
+
+def score_candidates(model, feat_cols, fm, candidates, offer_master, offer_catalog=None):
+    """
+    Score candidates with the uplift model and explode discount bands.
+
+    Model features that are neither guest features nor candidate columns are
+    taken from `offer_catalog` (the catalog the candidates came from) by
+    offer index.
+    """
+    # Join features as-of for each candidate guest
+    feat = fm.sort_values(["guest_id","asof_date"]).drop_duplicates(["guest_id"], keep="last") if "asof_date" in fm.columns else fm.copy()
+    catalog_cols = [c for c in feat_cols if c not in feat.columns and c not in candidates.columns]
+    if catalog_cols and offer_catalog is not None and "offer_idx" in candidates.columns:
+        candidates = attach_offer_attributes(candidates, offer_catalog, catalog_cols)
+    sc, (p_treat, p_ctrl, uplift) = predict_uplift(model, feat_cols, feat, candidates)
+    sc["p_treat"] = p_treat
+    sc["p_ctrl"] = p_ctrl
+    sc["uplift"] = uplift
+
+    # Modify the merge to include required columns
+    sc = sc.merge(offer_master[[
+        "promotion_id",
+        "base_price",
+        "allowed_discount_bands",  # This was missing in the candidates data
+        "margin_basis_pct",
+        "channel_eligibility",
+        "promotion_name",
+        "product_category"
+    ]], left_on="promotion_id", right_on="promotion_id", how="left")
+
+    # Add null check before processing bands
+    sc["allowed_discount_bands"] = sc["allowed_discount_bands"].fillna("0%")  # Handle missing values
+
+    # Convert discount bands from string "10%-20%" to numeric range, once per distinct band string
+    band_codes, band_strings = pd.factorize(sc["allowed_discount_bands"])
+    parsed_bands = [parse_discount_band(b) for b in band_strings]
+    band_lists = np.empty(len(parsed_bands), dtype=object)
+    band_lists[:] = parsed_bands
+    sc["allowed_discount_bands"] = band_lists[band_codes]
+    sc["max_discount_pct"] = np.array([x[-1] if len(x) > 0 else 0 for x in parsed_bands], dtype=float)[band_codes]
+
+    # Convert max_discount_pct to decimal format (e.g., 25.0 -> 0.25)
+    sc["max_discount_pct"] = sc["max_discount_pct"] / 100.0
+
+    # Add default margin_floor_pct if missing
+    if "margin_floor_pct" not in sc.columns:
+        sc["margin_floor_pct"] = 0.0  # Default value
+
+    # Convert both margin percentage columns from percentage format (25.0) to decimal format (0.25)
+    sc["margin_basis_pct"] = sc["margin_basis_pct"].fillna(30.0) / 100.0
+    sc["margin_floor_pct"] = sc["margin_floor_pct"] / 100.0
+
+    sc["expected_ticket"] = sc.apply(pick_ticket, axis=1)
+    # Use the already converted margin_basis_pct for margin_pct
+    sc["margin_pct"]      = sc["margin_basis_pct"].fillna(0.30)
+
+    model_scores_v1 = explode_discount_bands(sc, band_codes, parsed_bands)
+
+    # Add provenance fields before saving
+    return add_provenance_pdf(model_scores_v1)
+
+def run(tables, registry_dir=None, retrain=False, **settings):
+    """In-process entry point used by NBOPipeline."""
+    model, feat_cols = get_model(tables["modelling_set"], registry_dir, retrain, settings)
+    model_scores_v1 = score_candidates(model, feat_cols, tables["feature_mart"],
+                                       tables["scored_candidates"], tables["offer_master"],
+                                       tables.get("offer_catalog_v1"))
+    return {"model_scores_output": model_scores_v1}
+
+def main():
+    config = get_config()
+    registry_dir = config.get_setting("model.registry_dir", "models")
+    parser = argparse.ArgumentParser(description="Train (or load) the response model and score candidates")
+    parser.add_argument("--registry-dir", default=registry_dir,
+                        help=f"Model registry directory (default: model.registry_dir, {registry_dir})")
+    parser.add_argument("--retrain", action="store_true", default=config.get_setting("model.retrain", False),
+                        help="Refit the model even if one is registered for this training snapshot")
+    args = parser.parse_args()
+
+    modeling = pd.read_parquet("modelling_set.parquet")
+    try:
+        model, feat_cols = get_model(modeling, args.registry_dir, args.retrain)
+    except Exception as e:
+        print(f"Model training failed: {str(e)}")
+        raise
 
-# Modify classifier setup with fallback logic
-try:
-    # Modified validation and model training
-    # Replace lines 24-25 with:
-    if len(X_t) == 0:
-        raise ValueError("No samples found in treatment group")
-    
-    # Remove the control group validation entirely
-    # Train only treatment model
-    m_t = CalibratedClassifierCV(GradientBoostingClassifier(n_estimators=100, random_state=42), 
-                                cv=min(5, len(X_t))).fit(X_t, y_t)
-    
-    print("Warning: No control group samples - using baseline assumption")
-    
-    # Join features and predict
     try:
         fm = pd.read_parquet("feature_mart.parquet")
     except FileNotFoundError:
         raise SystemExit("Error: Missing feature_mart.parquet file")
-    
+
     try:
         candidates = pd.read_parquet("scored_candidates.parquet")
     except FileNotFoundError:
@@ -61,113 +269,36 @@ try:
             candidates.to_parquet("scored_candidates.parquet")
             print("Converted CSV to Parquet successfully")
         except FileNotFoundError:
-            raise SystemExit("Error: Missing both scored_candidates.parquet and scored_candidates.csv")
-    
-    feat = fm.sort_values(["guest_id","asof_date"]).drop_duplicates(["guest_id"], keep="last") if "asof_date" in fm.columns else fm.copy()
-    # Keep promotion_id from candidates during merge
-    sc = candidates[["guest_id","promotion_id"]].merge(feat[["guest_id"]+feat_cols], on="guest_id", how="left")
-    
-    p_t = m_t.predict_proba(sc[feat_cols].fillna(0.0))[:,1]
-    sc["p_treat"] = p_t
-    sc["p_ctrl"] = 0.5  # Hardcoded baseline
-    sc["uplift"] = sc["p_treat"] - sc["p_ctrl"]
-
-except Exception as e:
-    print(f"Model training failed: {str(e)}")
-    raise
-
-# Remove the duplicate prediction section at line 54-58
-# Join features as-of for each candidate guest
-# Remove these lines (54-58):
-# feat = fm.sort_values(["guest_id","asof_date"]).drop_duplicates(["guest_id"], keep="last") if "asof_date" in fm.columns else fm.copy()
-# sc = candidates.merge(feat[["guest_id"]+feat_cols], on="guest_id", how="left")
-# 
-# p_t = m_t.predict_proba(sc[feat_cols].fillna(0.0))[:,1]
-# p_c = m_c.predict_proba(sc[feat_cols].fillna(0.0))[:,1]
-# sc["uplift"]  = sc["p_treat"] - sc["p_ctrl"]
-
-# Keep only this part after the try-except block:
-# expected_ticket: prefer aov_28d > aov_90d > aov_365d
-def pick_ticket(r):
-    for c in ["aov_28d","aov_90d","aov_365d"]:     
-        if c in r and pd.notnull(r[c]) and r[c] > 0: return max(5.0, float(r[c]))
-    return 5.0
+            # fatigue_candidates --buckets writes a partitioned dataset instead
+            parts = dataset_parts(DATASET_DIR)
+            if not parts:
+                raise SystemExit("Error: Missing scored_candidates.parquet, scored_candidates.csv "
+                                 f"and a partitioned {DATASET_DIR}/ dataset")
+            candidates = pd.concat([pd.read_parquet(part) for part in parts], ignore_index=True)
+            print(f"Read {len(parts)} candidate partitions from {DATASET_DIR}/")
 
-# Add this after loading candidates
-try:
-    offer_master = pd.read_parquet("offer_master.parquet")
-except FileNotFoundError:
-    print("No offer_master parquet, trying CSV...")
     try:
-        offer_master = pd.read_csv("offer_master.csv")
-        offer_master.to_parquet("offer_master.parquet")
-        print("Converted CSV to Parquet successfully")
+        offer_master = pd.read_parquet("offer_master.parquet")
     except FileNotFoundError:
-        raise SystemExit("Error: Missing both offer_master.parquet and offer_master.csv")
-
-# Change the merge operation to use correct column names
-# Modify the merge to include required columns
-sc = sc.merge(offer_master[[
-    "promotion_id",
-    "base_price",
-    "allowed_discount_bands",  # This was missing in the candidates data
-    "margin_basis_pct",
-    "channel_eligibility",
-    "promotion_name",
-    "product_category"
-]], left_on="promotion_id", right_on="promotion_id", how="left")
-
-# Add null check before processing bands
-sc["allowed_discount_bands"] = sc["allowed_discount_bands"].fillna("0%")  # Handle missing values
+        print("No offer_master parquet, trying CSV...")
+        try:
+            offer_master = pd.read_csv("offer_master.csv")
+            offer_master.to_parquet("offer_master.parquet")
+            print("Converted CSV to Parquet successfully")
+        except FileNotFoundError:
+            raise SystemExit("Error: Missing both offer_master.parquet and offer_master.csv")
 
-# Update band parsing to handle string format
-def parse_discount_band(band_str):
     try:
-        return [float(x.strip('%')) for x in band_str.replace('%','').split('-')]
-    except:
-        return [0.0]
+        offer_catalog = pd.read_parquet("offer_catalog_v1.parquet")
+    except FileNotFoundError:
+        offer_catalog = None
+
+    model_scores_v1 = score_candidates(model, feat_cols, fm, candidates, offer_master, offer_catalog)
 
-# Add these conversions after the merge
-# Convert discount bands from string "10%-20%" to numeric range
-sc["allowed_discount_bands"] = sc["allowed_discount_bands"].apply(parse_discount_band)
-sc["max_discount_pct"] = sc["allowed_discount_bands"].apply(lambda x: x[-1] if len(x) > 0 else 0)
-
-# Convert max_discount_pct to decimal format (e.g., 25.0 -> 0.25)
-sc["max_discount_pct"] = sc["max_discount_pct"] / 100.0
-
-# Add default margin_floor_pct if missing
-if "margin_floor_pct" not in sc.columns:
-    sc["margin_floor_pct"] = 0.0  # Default value
-
-# Convert both margin percentage columns from percentage format (25.0) to decimal format (0.25)
-sc["margin_basis_pct"] = sc["margin_basis_pct"].fillna(30.0) / 100.0
-sc["margin_floor_pct"] = sc["margin_floor_pct"] / 100.0
-
-sc["expected_ticket"] = sc.apply(pick_ticket, axis=1)
-# Use the already converted margin_basis_pct for margin_pct
-sc["margin_pct"]      = sc["margin_basis_pct"].fillna(0.30)
-
-# Explode bands
-rows = []
-for _, r in sc.iterrows():
-    bands = r["allowed_discount_bands"] or [0]
-    for b in bands:
-        if b <= (r["max_discount_pct"] * 100):  # Convert max_discount_pct back to percentage for comparison
-            rr = r.to_dict()
-            rr["discount_band"]  = int(b)
-            rr["discount_cost"]  = r["base_price"] * (b/100.0)
-            rr["cannibalization_penalty"] = 0.0  # until DiD/elasticity is plugged in
-            rr["eim_raw"] = (rr["uplift"] * rr["expected_ticket"] * rr["margin_pct"]
-                             - rr["discount_cost"] - rr["cannibalization_penalty"])
-            rows.append(rr)
-
-model_scores_v1 = pd.DataFrame(rows)
-
-# Add provenance fields before saving
-model_scores_v1 = add_provenance_pdf(model_scores_v1)
-
-# Add this at the end to save results
-model_scores_v1.to_parquet("model_scores_output.parquet")
-# Optional CSV version for inspection
-model_scores_v1.to_csv("model_scores_output.csv", index=False)
+    # Add this at the end to save results
+    model_scores_v1.to_parquet("model_scores_output.parquet")
+    # Optional CSV version for inspection
+    model_scores_v1.to_csv("model_scores_output.csv", index=False)
 
+if __name__ == "__main__":
+    main()
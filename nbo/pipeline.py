@@ -8,19 +8,50 @@ of all NBO components in the correct order with proper dependency management.
 import os
 import sys
 import subprocess
+import importlib
+import multiprocessing
+import threading
+import shutil
+import secrets
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+import json
 import logging
 import pandas as pd
+import pyarrow.parquet as pq
 
+from ._version import __version__
 from .configuration import NBOConfig, get_config
 from .data_loader import DataLoader
+from .step_cache import StepCache, hash_text, local_imports, write_frames, read_frames
+from .profiling import StepMetrics, ResourceMonitor, export_trace, children_cpu_time
 from .validation import assess_data_quality, validate_business_rules
 
 logger = logging.getLogger(__name__)
 
+# Supported ways of executing a step
+EXECUTION_MODES = ("subprocess", "in_process")
+
+# Pool types for running independent steps concurrently
+EXECUTORS = ("thread", "process")
+
+# Files holding a serialized PipelineRun and its step metrics inside its run directory
+RUN_STATE_FILE = "run_state.json"
+TRACE_FILE = "trace.json"
+
+# Settings sections that can change step results, and so feed the cache key
+# (along with each step module's own SETTINGS_SECTION)
+CACHE_KEY_SETTINGS = ("model", "data", "guardrails")
+
+# Tables the step scripts read under a different name than the data files
+TABLE_ALIASES = {
+    "modelling_set": "modeling_set_v2",
+    "touch_history": "stg_touch_history",
+}
+
 
 @dataclass
 class PipelineStep:
@@ -32,6 +63,7 @@ class PipelineStep:
     description: str = ""
     validation_only: bool = False  # For steps like contract_checks that only validate
     dependencies: List[str] = field(default_factory=list)  # Other steps this depends on
+    script_args: Dict[str, str] = field(default_factory=dict)  # Setting key -> script flag in subprocess mode
     
     def __post_init__(self):
         """Validate step configuration."""
@@ -53,6 +85,103 @@ class PipelineRun:
     steps_failed: List[str] = field(default_factory=list)
     error_messages: List[str] = field(default_factory=list)
     outputs_generated: Dict[str, str] = field(default_factory=dict)  # filename -> path
+    step_start_times: Dict[str, datetime] = field(default_factory=dict)
+    step_end_times: Dict[str, datetime] = field(default_factory=dict)
+    steps_cached: List[str] = field(default_factory=list)  # Restored from the step cache
+    steps_requested: List[str] = field(default_factory=list)  # Steps this run was asked to run
+    step_outputs: Dict[str, List[str]] = field(default_factory=dict)  # step -> checkpointed tables
+    step_files: Dict[str, List[str]] = field(default_factory=dict)  # subprocess step -> checkpointed files
+    step_cache_keys: Dict[str, str] = field(default_factory=dict)  # step -> cache key
+    step_metrics: Dict[str, StepMetrics] = field(default_factory=dict)  # step -> resource usage
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert run state to a JSON-serializable dictionary."""
+        def iso(value: Optional[datetime]) -> Optional[str]:
+            return value.isoformat() if value else None
+        
+        return {
+            'run_id': self.run_id,
+            'start_time': iso(self.start_time),
+            'end_time': iso(self.end_time),
+            'status': self.status,
+            'steps_completed': self.steps_completed,
+            'steps_failed': self.steps_failed,
+            'error_messages': self.error_messages,
+            'outputs_generated': self.outputs_generated,
+            'step_start_times': {k: iso(v) for k, v in self.step_start_times.items()},
+            'step_end_times': {k: iso(v) for k, v in self.step_end_times.items()},
+            'steps_cached': self.steps_cached,
+            'steps_requested': self.steps_requested,
+            'step_outputs': self.step_outputs,
+            'step_files': self.step_files,
+            'step_cache_keys': self.step_cache_keys,
+            'step_metrics': {k: v.to_dict() for k, v in self.step_metrics.items()},
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PipelineRun":
+        """Create a run from a dictionary produced by ``to_dict``."""
+        def parse(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+        
+        return cls(
+            run_id=data['run_id'],
+            start_time=parse(data['start_time']),
+            end_time=parse(data.get('end_time')),
+            status=data.get('status', 'running'),
+            steps_completed=data.get('steps_completed', []),
+            steps_failed=data.get('steps_failed', []),
+            error_messages=data.get('error_messages', []),
+            outputs_generated=data.get('outputs_generated', {}),
+            step_start_times={k: parse(v) for k, v in data.get('step_start_times', {}).items()},
+            step_end_times={k: parse(v) for k, v in data.get('step_end_times', {}).items()},
+            steps_cached=data.get('steps_cached', []),
+            steps_requested=data.get('steps_requested', []),
+            step_outputs=data.get('step_outputs', {}),
+            step_files=data.get('step_files', {}),
+            step_cache_keys=data.get('step_cache_keys', {}),
+            step_metrics={k: StepMetrics.from_dict(v)
+                          for k, v in data.get('step_metrics', {}).items()},
+        )
+    
+    def export_trace(self, path: Union[str, Path]) -> Path:
+        """
+        Export per-step metrics as a JSON or CSV trace (chosen by file extension).
+        
+        Args:
+            path: Output file path
+            
+        Returns:
+            Path of the written trace
+        """
+        ordered = sorted(self.step_metrics.values(), key=lambda m: m.start_time or "")
+        return export_trace(self.run_id, ordered, path)
+
+
+def dataset_parts(dataset: Path) -> List[Path]:
+    """Parquet part files of a partitioned dataset directory (``<partition>/<part>.parquet``)."""
+    return sorted(dataset.glob("*/*.parquet"))
+
+
+def _call_step_run(module_name: str, tables: Dict[str, pd.DataFrame],
+                   settings: Optional[Dict[str, Any]] = None
+                   ) -> Tuple[Dict[str, pd.DataFrame], float, Optional[float]]:
+    """
+    Call a step module's ``run`` function (process pool entry point).
+    
+    Returns:
+        Tuple of (outputs, CPU seconds, peak RSS in MB) measured in the worker
+    """
+    module = importlib.import_module(module_name)
+    try:
+        with ResourceMonitor() as monitor:
+            outputs = module.run(tables, **(settings or {}))
+    finally:
+        # Idle joblib (loky) workers started by the step would keep this
+        # worker from exiting when the pool shuts down
+        from joblib.externals.loky import get_reusable_executor
+        get_reusable_executor().shutdown(wait=True)
+    return outputs, monitor.cpu_time_s, monitor.peak_rss_mb
 
 
 class NBOPipeline:
@@ -62,7 +191,12 @@ class NBOPipeline:
                  data_path: Union[str, Path] = "data",
                  output_path: Union[str, Path] = "output", 
                  config: Optional[NBOConfig] = None,
-                 scripts_path: Union[str, Path] = "nbo"):
+                 scripts_path: Union[str, Path] = "nbo",
+                 execution_mode: Optional[str] = None,
+                 max_workers: Optional[int] = None,
+                 executor: Optional[str] = None,
+                 use_cache: Optional[bool] = None,
+                 checkpoint_runs: Optional[bool] = None):
         """
         Initialize the NBO pipeline.
         
@@ -71,12 +205,42 @@ class NBOPipeline:
             output_path: Path to output directory
             config: Configuration instance
             scripts_path: Path to directory containing Python scripts
+            execution_mode: "subprocess" to launch each step script in a new
+                interpreter, "in_process" to call the step functions directly
+                and pass DataFrames between steps (default: from settings)
+            max_workers: Number of steps to run concurrently; 1 runs steps
+                one after another (default: from settings)
+            executor: "thread" or "process" pool for concurrent in-process
+                steps (default: from settings)
+            use_cache: Whether to skip in-process steps whose inputs, code and
+                settings are unchanged, restoring their outputs from the cache
+                under output_path (default: from settings)
+            checkpoint_runs: Whether to checkpoint run state and step outputs
+                under output_path/runs so failed runs can be resumed (default:
+                from settings; the newest ``pipeline.keep_runs`` runs are kept)
         """
         self.data_path = Path(data_path)
         self.output_path = Path(output_path)
         self.scripts_path = Path(scripts_path)
         self.config = config or get_config()
         
+        self.execution_mode = execution_mode or self.config.get_setting(
+            'pipeline.execution_mode', 'subprocess'
+        )
+        if self.execution_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"Unknown execution mode: {self.execution_mode}. "
+                f"Expected one of {list(EXECUTION_MODES)}"
+            )
+        
+        self.max_workers = max(1, int(max_workers or self.config.get_setting('pipeline.max_workers', 1)))
+        self.executor = executor or self.config.get_setting('pipeline.executor', 'thread')
+        if self.executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {self.executor}. Expected one of {list(EXECUTORS)}")
+        
+        # Process pool used for in-process step functions during a parallel run
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        
         # Create output directory if it doesn't exist
         self.output_path.mkdir(parents=True, exist_ok=True)
         
@@ -89,6 +253,26 @@ class NBOPipeline:
         # Current run information
         self.current_run: Optional[PipelineRun] = None
         
+        # In-memory step outputs for in-process execution (step -> table -> frame)
+        self._step_frames: Dict[str, Dict[str, pd.DataFrame]] = {}
+        
+        # Content-hash memoization of in-process steps
+        if use_cache is None:
+            use_cache = self.config.get_setting('pipeline.use_cache', False)
+        self.step_cache: Optional[StepCache] = (
+            StepCache(self.output_path / ".cache") if use_cache else None
+        )
+        self._step_keys: Dict[str, str] = {}
+        
+        # Run state and step outputs are checkpointed under output_path/runs/<run_id>
+        self.runs_path = self.output_path / "runs"
+        if checkpoint_runs is None:
+            checkpoint_runs = self.config.get_setting('pipeline.checkpoint_runs', False)
+        self.checkpoint_runs = checkpoint_runs
+        self.keep_runs = self.config.get_setting('pipeline.keep_runs', 10)
+        # Guards current_run, which concurrent steps update and checkpoint
+        self._run_lock = threading.RLock()
+        
         # Validate pipeline configuration
         self._validate_pipeline()
     
@@ -120,7 +304,8 @@ class NBOPipeline:
                 inputs=["feature_mart.csv", "touch_history.csv", "offer_catalog_v1.csv"],
                 outputs=["scored_candidates.csv"],
                 description="Generate candidate offers while respecting fatigue rules",
-                dependencies=["contract_checks"]
+                dependencies=["contract_checks"],
+                script_args={"candidates.n_buckets": "--buckets", "candidates.write_partitioned": "--partitioned"}
             ),
             
             "model_training": PipelineStep(
@@ -129,7 +314,8 @@ class NBOPipeline:
                 inputs=["offer_master.csv", "scored_candidates.csv", "offer_catalog_v1.csv"],
                 outputs=["model_scores_output.csv"],
                 description="Train uplift models and score candidate offers",
-                dependencies=["fatigue_candidates"]
+                dependencies=["fatigue_candidates"],
+                script_args={"model.registry_dir": "--registry-dir", "model.retrain": "--retrain"}
             ),
             
             "guardrails_winners": PipelineStep(
@@ -164,9 +350,11 @@ class NBOPipeline:
     
     def _validate_pipeline(self):
         """Validate pipeline configuration and dependencies."""
-        # Check that all script files exist
+        # Check that all script files exist (only needed when launching scripts)
         missing_scripts = []
         for step in self.steps.values():
+            if self.execution_mode != "subprocess":
+                break
             script_file = self.scripts_path / step.script_path
             if not script_file.exists():
                 missing_scripts.append(str(script_file))
@@ -270,6 +458,89 @@ class NBOPipeline:
         if step_name not in self.steps:
             raise ValueError(f"Unknown step: {step_name}")
         
+        metrics = StepMetrics(step_name=step_name)
+        start_time = datetime.now()
+        if self.current_run:
+            with self._run_lock:
+                self.current_run.step_start_times[step_name] = start_time
+        
+        # Concurrent steps share the process, so only count this thread's CPU
+        monitor = ResourceMonitor(cpu_clock="thread" if self.max_workers > 1 else "process")
+        children_cpu_before = children_cpu_time()
+        success = False
+        try:
+            with monitor:
+                success = self._execute_step(step_name, metrics=metrics, **kwargs)
+            return success
+        finally:
+            end_time = datetime.now()
+            self._finish_step_metrics(metrics, monitor, children_cpu_before, success,
+                                      start_time, end_time)
+            if self.current_run:
+                with self._run_lock:
+                    self.current_run.step_end_times[step_name] = end_time
+                    self.current_run.step_metrics[step_name] = metrics
+                self._save_run_state()
+    
+    def _finish_step_metrics(self, metrics: StepMetrics, monitor: ResourceMonitor,
+                             children_cpu_before: float, success: bool,
+                             start_time: datetime, end_time: datetime):
+        """Fill in timing and resource figures once a step has finished."""
+        if not success:
+            metrics.status = "failed"
+        elif metrics.status == "running":
+            metrics.status = "completed"
+        metrics.start_time = start_time.isoformat()
+        metrics.end_time = end_time.isoformat()
+        metrics.wall_time_s = monitor.wall_time_s
+        
+        if self.execution_mode == "subprocess":
+            # The work happens in a child process. Its peak RSS is left unset:
+            # ru_maxrss of children is the high-water mark of every child so
+            # far, not of this step's script
+            metrics.cpu_time_s = children_cpu_time() - children_cpu_before
+            self._measure_script_files(self.steps[metrics.step_name], metrics, start_time)
+        elif metrics.cpu_time_s is None:
+            # Not already measured inside a process pool worker
+            metrics.cpu_time_s = monitor.cpu_time_s
+            metrics.peak_rss_mb = monitor.peak_rss_mb
+    
+    def _script_table_files(self, file_name: str) -> List[Path]:
+        """Parquet and CSV versions of a table in the scripts directory, where step scripts read and write."""
+        stem = Path(file_name).stem
+        return [self.scripts_path / f"{stem}{suffix}" for suffix in ('.parquet', '.csv')
+                if (self.scripts_path / f"{stem}{suffix}").exists()]
+    
+    def _measure_script_files(self, step: PipelineStep, metrics: StepMetrics, start_time: datetime):
+        """
+        Record the files a step script read and wrote.
+        
+        Inputs are sized as the file a script reads (parquet before CSV);
+        outputs are the parquet/CSV files of the declared outputs modified
+        since the step started. Row counts come from parquet footers, so
+        tables only available as CSV are sized but not counted.
+        """
+        for input_file in step.inputs:
+            files = self._script_table_files(input_file)
+            if not files:
+                continue
+            metrics.bytes_read += files[0].stat().st_size
+            if files[0].suffix == '.parquet':
+                metrics.input_rows[files[0].stem] = pq.read_metadata(files[0]).num_rows
+        
+        started = start_time.timestamp()
+        for output_file in step.outputs:
+            for path in self._script_table_files(output_file):
+                stat = path.stat()
+                if stat.st_mtime < started:
+                    continue
+                metrics.bytes_written += stat.st_size
+                if path.suffix == '.parquet':
+                    metrics.output_rows[path.stem] = pq.read_metadata(path).num_rows
+    
+    def _execute_step(self, step_name: str, metrics: Optional[StepMetrics] = None,
+                      **kwargs) -> bool:
+        """Run a single pipeline step without timing bookkeeping."""
         step = self.steps[step_name]
         script_file = self.scripts_path / step.script_path
         
@@ -286,58 +557,56 @@ class NBOPipeline:
             if missing_deps:
                 error_msg = f"Step {step_name} missing dependencies: {missing_deps}"
                 logger.error(error_msg)
-                if self.current_run:
-                    self.current_run.error_messages.append(error_msg)
+                self._record_failure(step_name, error_msg, failed=False)
                 return False
         
+        if self.execution_mode == "in_process":
+            return self._run_step_in_process(step, metrics or StepMetrics(step_name=step_name))
+        
         # Validate inputs exist
         for input_file in step.inputs:
             table_name = input_file.replace('.csv', '')
             if table_name not in self.data_loader.get_available_tables():
-                # Check if it's an output from a previous step
+                # Check if it's an output from a previous step (scripts write
+                # theirs in the scripts directory)
                 input_path = self.output_path / input_file
                 data_path = self.data_path / input_file
                 
-                if not input_path.exists() and not data_path.exists():
+                if (not input_path.exists() and not data_path.exists()
+                        and not self._script_table_files(input_file)):
                     error_msg = f"Input file not found: {input_file}"
                     logger.error(error_msg)
-                    if self.current_run:
-                        self.current_run.error_messages.append(error_msg)
+                    self._record_failure(step_name, error_msg, failed=False)
                     return False
         
         try:
-            # Change to the scripts directory for execution
-            original_cwd = os.getcwd()
-            os.chdir(self.scripts_path)
-            
-            # Set up environment
+            # Set up environment; the script runs from the scripts directory
+            # (via cwd=, not os.chdir, so concurrent steps don't interfere)
             env = os.environ.copy()
-            env['PYTHONPATH'] = str(Path(original_cwd))
+            env['PYTHONPATH'] = os.getcwd()
             
             # Run the script
             result = subprocess.run(
-                [sys.executable, step.script_path],
+                self._script_command(step),
                 capture_output=True,
                 text=True,
                 env=env,
                 cwd=self.scripts_path
             )
             
-            # Change back to original directory
-            os.chdir(original_cwd)
-            
             if result.returncode == 0:
                 logger.info(f"Step {step_name} completed successfully")
                 if result.stdout:
                     logger.debug(f"Step output: {result.stdout}")
                 
+                self._checkpoint_script_outputs(step)
+                
                 # Record outputs
-                if self.current_run:
-                    self.current_run.steps_completed.append(step_name)
-                    for output_file in step.outputs:
-                        output_path = self.output_path / output_file
-                        if output_path.exists():
-                            self.current_run.outputs_generated[output_file] = str(output_path)
+                self._record_completion(step_name, {
+                    output_file: str(self.output_path / output_file)
+                    for output_file in step.outputs
+                    if (self.output_path / output_file).exists()
+                })
                 
                 return True
             else:
@@ -348,23 +617,474 @@ class NBOPipeline:
                     error_msg += f"\nOutput: {result.stdout}"
                 
                 logger.error(error_msg)
-                if self.current_run:
-                    self.current_run.steps_failed.append(step_name)
-                    self.current_run.error_messages.append(error_msg)
+                self._record_failure(step_name, error_msg)
                 return False
                 
         except Exception as e:
             error_msg = f"Exception running step {step_name}: {str(e)}"
             logger.error(error_msg)
-            if self.current_run:
-                self.current_run.steps_failed.append(step_name)
-                self.current_run.error_messages.append(error_msg)
+            self._record_failure(step_name, error_msg)
             return False
     
+    def _run_step_in_process(self, step: PipelineStep, metrics: StepMetrics) -> bool:
+        """
+        Run a step by calling its module's ``run`` function in this process.
+        
+        Inputs are taken from the in-memory outputs of upstream steps when
+        available, and read from disk otherwise.
+        
+        Args:
+            step: Step to run
+            metrics: Metrics to record row counts and bytes read/written into
+            
+        Returns:
+            True if step succeeded, False otherwise
+        """
+        try:
+            module = self._load_step_module(step)
+            
+            cache_key = None
+            if self.step_cache is not None:
+                cache_key = self._compute_cache_key(step, module)
+            if cache_key is not None:
+                self._step_keys[step.name] = cache_key
+                if self.current_run:
+                    with self._run_lock:
+                        self.current_run.step_cache_keys[step.name] = cache_key
+                outputs = self.step_cache.load(step.name, cache_key)
+                written = self.step_cache.written_outputs(step.name, cache_key, self._output_settings())
+                if outputs is not None and written is None and hasattr(module, "extra_outputs"):
+                    # Files a step writes itself cannot be rebuilt from its cached frames
+                    logger.info(f"Outputs of {step.name} changed since it was cached; re-running it")
+                    outputs = None
+                if outputs is not None:
+                    logger.info(f"Step {step.name} unchanged; restored outputs from cache")
+                    metrics.status = "cached"
+                    metrics.bytes_read += self.step_cache.entry_bytes(step.name)
+                    metrics.output_rows = {name: len(df) for name, df in outputs.items()}
+                    self._step_frames[step.name] = outputs
+                    metrics.bytes_written += self._checkpoint_step_outputs(step.name, outputs, in_cache=True)
+                    # Output files written from this entry by an earlier run are kept
+                    if written is None:
+                        written = self._write_step_outputs(step.name, outputs, module)
+                        metrics.bytes_written += self._files_size(written.values())
+                        self.step_cache.record_written(step.name, cache_key, written, self._output_settings())
+                    else:
+                        logger.info(f"Outputs of {step.name} are up to date; not rewriting them")
+                    self._record_completion(step.name, written, cached=True)
+                    return True
+            
+            tables = {}
+            missing_tables = []
+            for table_name in module.INPUT_TABLES:
+                df = self._resolve_input(step.name, table_name, metrics)
+                if df is None:
+                    missing_tables.append(table_name)
+                else:
+                    tables[table_name] = df
+            
+            for table_name in getattr(module, "OPTIONAL_TABLES", []):
+                df = self._resolve_input(step.name, table_name, metrics)
+                if df is not None:
+                    tables[table_name] = df
+            
+            metrics.input_rows = {name: len(df) for name, df in tables.items()}
+            
+            if missing_tables:
+                error_msg = f"Step {step.name} missing input tables: {missing_tables}"
+                logger.error(error_msg)
+                self._record_failure(step.name, error_msg)
+                return False
+            
+            settings = self._get_step_settings(module)
+            if self._process_pool is not None:
+                outputs, metrics.cpu_time_s, metrics.peak_rss_mb = self._process_pool.submit(
+                    _call_step_run, module.__name__, tables, settings).result()
+            else:
+                outputs = module.run(tables, **settings)
+            metrics.output_rows = {name: len(df) for name, df in outputs.items()}
+            
+            self._step_frames[step.name] = outputs
+            written = self._write_step_outputs(step.name, outputs, module)
+            metrics.bytes_written += self._files_size(written.values())
+            if cache_key is not None:
+                metrics.bytes_written += self.step_cache.save(step.name, cache_key, outputs)
+                self.step_cache.record_written(step.name, cache_key, written, self._output_settings())
+            metrics.bytes_written += self._checkpoint_step_outputs(step.name, outputs,
+                                                                   in_cache=cache_key is not None)
+            
+            logger.info(f"Step {step.name} completed successfully")
+            self._record_completion(step.name, written)
+            
+            return True
+            
+        except Exception as e:
+            error_msg = f"Exception running step {step.name}: {str(e)}"
+            logger.error(error_msg)
+            self._record_failure(step.name, error_msg)
+            return False
+    
+    def _script_command(self, step: PipelineStep) -> List[str]:
+        """
+        Build the command line of a step script.
+        
+        Settings named in ``step.script_args`` are passed as flags, so the
+        script sees this pipeline's configuration: true booleans become bare
+        flags and relative ``*_dir`` settings are resolved against the
+        output directory, as for in-process steps.
+        """
+        command = [sys.executable, step.script_path]
+        for key, flag in step.script_args.items():
+            value = self.config.get_setting(key)
+            if value is None or value is False:
+                continue
+            if value is True:
+                command.append(flag)
+                continue
+            if key.endswith("_dir"):
+                value = self.output_path.resolve() / value
+            command.extend([flag, str(value)])
+        return command
+    
+    def _record_completion(self, step_name: str, written: Dict[str, str], cached: bool = False):
+        """Record a completed step and the files it wrote in the current run."""
+        if not self.current_run:
+            return
+        with self._run_lock:
+            self.current_run.steps_completed.append(step_name)
+            if cached:
+                self.current_run.steps_cached.append(step_name)
+            self.current_run.outputs_generated.update(written)
+    
+    def _record_failure(self, step_name: str, error_msg: str, failed: bool = True):
+        """Record an error (and, if ``failed``, the failed step) in the current run."""
+        if not self.current_run:
+            return
+        with self._run_lock:
+            if failed:
+                self.current_run.steps_failed.append(step_name)
+            self.current_run.error_messages.append(error_msg)
+    
+    def _load_step_module(self, step: PipelineStep):
+        """Import the module implementing a step."""
+        module_name = Path(step.script_path).stem
+        return importlib.import_module(f"{__package__}.{module_name}")
+    
+    def _get_ancestors(self, step_name: str) -> set:
+        """Get all steps that a step depends on, directly or transitively."""
+        ancestors = set()
+        stack = list(self.steps[step_name].dependencies)
+        while stack:
+            dep = stack.pop()
+            if dep not in ancestors and dep in self.steps:
+                ancestors.add(dep)
+                stack.extend(self.steps[dep].dependencies)
+        return ancestors
+    
+    def _resolve_input(self, step_name: str, table_name: str,
+                       metrics: Optional[StepMetrics] = None) -> Optional[pd.DataFrame]:
+        """
+        Find an input table for a step.
+        
+        The most recent in-memory version produced by one of the step's
+        upstream steps wins; otherwise the table is read from disk.
+        
+        Args:
+            step_name: Name of the consuming step
+            table_name: Name of the table (without extension)
+            metrics: Metrics to add the size of any file read to
+            
+        Returns:
+            DataFrame, or None if the table cannot be found
+        """
+        producer = self._find_producer(step_name, table_name)
+        if producer is not None:
+            return self._step_frames[producer][table_name]
+        
+        table_file = self._find_table_file(table_name)
+        if table_file is None:
+            return None
+        if table_file.is_dir():
+            parts = dataset_parts(table_file)
+            if metrics is not None:
+                metrics.bytes_read += sum(part.stat().st_size for part in parts)
+            return pd.concat([pd.read_parquet(part) for part in parts], ignore_index=True)
+        if metrics is not None:
+            metrics.bytes_read += table_file.stat().st_size
+        if table_file.suffix == '.parquet':
+            return pd.read_parquet(table_file)
+        return pd.read_csv(table_file, low_memory=False)
+    
+    def _find_producer(self, step_name: str, table_name: str) -> Optional[str]:
+        """Find the upstream step whose in-memory output a step should read."""
+        ancestors = self._get_ancestors(step_name)
+        for producer in reversed(self.get_execution_order()):
+            if producer in ancestors and table_name in self._step_frames.get(producer, {}):
+                return producer
+        return None
+    
+    def _find_table_file(self, table_name: str) -> Optional[Path]:
+        """
+        Find a table's file in the output, scripts or data directory.
+        
+        A partitioned dataset (a ``<table>/`` directory of parquet parts, as
+        steps write instead of a single file) is used when it is newer than
+        the table's single file in the same directory.
+        """
+        for directory in [self.output_path, self.scripts_path]:
+            dataset = directory / table_name
+            parts = dataset_parts(dataset) if dataset.is_dir() else []
+            for suffix in ['.parquet', '.csv']:
+                table_file = directory / f"{table_name}{suffix}"
+                if table_file.exists():
+                    if parts and max(p.stat().st_mtime for p in parts) > table_file.stat().st_mtime:
+                        return dataset
+                    return table_file
+            if parts:
+                return dataset
+        
+        available_tables = self.data_loader.get_available_tables()
+        for name in [table_name, TABLE_ALIASES.get(table_name)]:
+            if name in available_tables:
+                return self.data_loader.get_table_path(name)
+        
+        return None
+    
+    def _compute_cache_key(self, step: PipelineStep, module) -> Optional[str]:
+        """
+        Compute a step's cache key from its inputs, code and settings.
+        
+        Inputs held in memory are identified by the cache key of the step
+        that produced them; inputs read from disk by their file hash. The
+        code is the step module plus every package module it imports, and
+        the settings include the step's own ``SETTINGS_SECTION``.
+        Returns None when an in-memory input has no known key.
+        """
+        setting_keys = list(CACHE_KEY_SETTINGS)
+        section = getattr(module, "SETTINGS_SECTION", None)
+        if section and section not in setting_keys:
+            setting_keys.append(section)
+        
+        parts = [step.name, __version__]
+        for source_file in local_imports(module.__file__):
+            parts.append(f"{source_file.name}:{self.step_cache.file_hash(source_file)}")
+        parts.append(json.dumps({k: self.config.get_setting(k) for k in setting_keys},
+                                sort_keys=True, default=str))
+        
+        for table_name in module.INPUT_TABLES + getattr(module, "OPTIONAL_TABLES", []):
+            producer = self._find_producer(step.name, table_name)
+            if producer is not None:
+                if producer not in self._step_keys:
+                    return None
+                parts.append(f"{table_name}:step:{self._step_keys[producer]}")
+                continue
+            table_file = self._find_table_file(table_name)
+            if table_file is not None and table_file.is_dir():
+                part_hashes = [self.step_cache.file_hash(part) for part in dataset_parts(table_file)]
+                parts.append(f"{table_name}:dataset:{hash_text(*part_hashes)}")
+            elif table_file is not None:
+                parts.append(f"{table_name}:file:{self.step_cache.file_hash(table_file)}")
+            else:
+                parts.append(f"{table_name}:missing")
+        
+        return hash_text(*parts)
+    
+    def _get_step_settings(self, module) -> Dict[str, Any]:
+        """
+        Get the settings section a step module asks for via ``SETTINGS_SECTION``.
+        
+        Relative ``*_dir`` settings are resolved against the output directory.
+        """
+        section = getattr(module, "SETTINGS_SECTION", None)
+        if not section:
+            return {}
+        settings = dict(self.config.get_setting(section, {}) or {})
+        for key, value in settings.items():
+            if key.endswith("_dir") and value:
+                settings[key] = str(self.output_path / value)
+        return settings
+    
+    def _write_step_outputs(self, step_name: str, outputs: Dict[str, pd.DataFrame],
+                            module=None) -> Dict[str, str]:
+        """
+        Write in-process step outputs to the output directory.
+        
+        Intermediate outputs are only written when
+        ``output.save_intermediate_files`` is enabled; outputs of steps
+        nothing else depends on are always written. Files a step module's
+        ``run`` writes itself (e.g. partitioned datasets) are reported by an
+        ``extra_outputs(**settings)`` function and recorded with the rest.
+        
+        Returns:
+            Dictionary of filename -> path for files written
+        """
+        written = {}
+        if module is not None and hasattr(module, "extra_outputs"):
+            for path in module.extra_outputs(**self._get_step_settings(module)):
+                written[Path(path).relative_to(self.output_path).as_posix()] = str(path)
+        
+        is_terminal = not any(step_name in s.dependencies for s in self.steps.values())
+        if not is_terminal and not self.config.get_setting('output.save_intermediate_files', True):
+            return written
+        
+        output_format = self.config.get_setting('output.output_format', 'both')
+        
+        for table_name, df in outputs.items():
+            if output_format in ('parquet', 'both'):
+                parquet_file = self.output_path / f"{table_name}.parquet"
+                df.to_parquet(parquet_file, index=False)
+                written[parquet_file.name] = str(parquet_file)
+            if output_format in ('csv', 'both'):
+                csv_file = self.output_path / f"{table_name}.csv"
+                df.to_csv(csv_file, index=False)
+                written[csv_file.name] = str(csv_file)
+        
+        return written
+    
+    def _output_settings(self) -> str:
+        """Serialize the settings that decide which output files a step writes."""
+        return json.dumps(self.config.get_setting('output', {}), sort_keys=True, default=str)
+    
+    def _get_run_dir(self, run_id: str) -> Path:
+        return self.runs_path / run_id
+    
+    def _checkpoint_step_outputs(self, step_name: str, outputs: Dict[str, pd.DataFrame],
+                                 in_cache: bool = False) -> int:
+        """
+        Checkpoint a completed step's outputs in the current run directory.
+        
+        Args:
+            step_name: Name of the step
+            outputs: Dictionary of table name to DataFrame
+            in_cache: Whether the outputs are held in the step cache under the
+                step's recorded cache key, in which case resuming restores them
+                from there and they are not written again
+            
+        Returns:
+            Number of bytes written
+        """
+        if not self.current_run or not self.checkpoint_runs:
+            return 0
+        bytes_written = 0
+        if not in_cache:
+            bytes_written = write_frames(self._get_run_dir(self.current_run.run_id) / step_name, outputs)
+        with self._run_lock:
+            self.current_run.step_outputs[step_name] = list(outputs.keys())
+        return bytes_written
+    
+    def _checkpoint_script_outputs(self, step: PipelineStep):
+        """
+        Checkpoint the files a subprocess step's script wrote in the current run directory.
+        
+        The parquet/CSV files of the step's declared outputs written since
+        it started are copied, so resuming can put them back in the scripts
+        directory before later steps read them.
+        """
+        if not self.current_run or not self.checkpoint_runs:
+            return
+        start_time = self.current_run.step_start_times.get(step.name)
+        started = start_time.timestamp() if start_time else 0.0
+        step_dir = self._get_run_dir(self.current_run.run_id) / step.name
+        copied = []
+        for output_file in step.outputs:
+            for path in self._script_table_files(output_file):
+                if path.stat().st_mtime < started:
+                    continue
+                step_dir.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(path, step_dir / path.name)
+                copied.append(path.name)
+        with self._run_lock:
+            self.current_run.step_files[step.name] = copied
+    
+    @staticmethod
+    def _files_size(paths) -> int:
+        """Get the total size of existing files."""
+        return sum(Path(p).stat().st_size for p in paths if Path(p).exists())
+    
+    def _save_run_state(self):
+        """Write the current run state to its run directory."""
+        if not self.current_run or not self.checkpoint_runs:
+            return
+        with self._run_lock:
+            run_dir = self._get_run_dir(self.current_run.run_id)
+            run_dir.mkdir(parents=True, exist_ok=True)
+            with open(run_dir / RUN_STATE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.current_run.to_dict(), f, indent=2)
+            if self.current_run.step_metrics:
+                self.current_run.export_trace(run_dir / TRACE_FILE)
+    
+    def load_run(self, run_id: str) -> PipelineRun:
+        """
+        Load a checkpointed run.
+        
+        Args:
+            run_id: ID of the run to load
+            
+        Returns:
+            PipelineRun restored from the run directory
+            
+        Raises:
+            FileNotFoundError: If no checkpoint exists for the run
+        """
+        state_file = self._get_run_dir(run_id) / RUN_STATE_FILE
+        if not state_file.exists():
+            raise FileNotFoundError(
+                f"No checkpoint found for run '{run_id}'. Available runs: {self.list_runs()}"
+            )
+        with open(state_file, 'r', encoding='utf-8') as f:
+            return PipelineRun.from_dict(json.load(f))
+    
+    def list_runs(self) -> List[str]:
+        """Get the IDs of all checkpointed runs."""
+        if not self.runs_path.exists():
+            return []
+        return sorted(p.name for p in self.runs_path.iterdir()
+                      if (p / RUN_STATE_FILE).exists())
+    
+    def prune_runs(self, keep: Optional[int] = None) -> List[str]:
+        """
+        Delete the checkpoints of all but the newest runs.
+        
+        Args:
+            keep: Number of runs to keep, the current run included (default:
+                ``pipeline.keep_runs``; None keeps every run)
+            
+        Returns:
+            IDs of the deleted runs
+        """
+        keep = self.keep_runs if keep is None else keep
+        if keep is None:
+            return []
+        # Run IDs sort by start time; the current run is never removed
+        current = self.current_run.run_id if self.current_run else None
+        runs = self.list_runs()
+        removed = [run_id for run_id in runs[:max(0, len(runs) - keep)] if run_id != current]
+        for run_id in removed:
+            shutil.rmtree(self._get_run_dir(run_id))
+        if removed:
+            logger.info(f"Removed checkpoints of {len(removed)} old runs")
+        return removed
+    
+    def get_frame(self, table_name: str) -> Optional[pd.DataFrame]:
+        """
+        Get the latest in-memory version of a table produced by the current run.
+        
+        Args:
+            table_name: Name of the table (without extension)
+            
+        Returns:
+            DataFrame, or None if no in-process step produced the table
+        """
+        for step_name in reversed(self.get_execution_order()):
+            if table_name in self._step_frames.get(step_name, {}):
+                return self._step_frames[step_name][table_name]
+        return None
+    
     def run_pipeline(self, 
                     steps: Optional[List[str]] = None,
                     stop_on_error: bool = True,
-                    validate_outputs: bool = True) -> PipelineRun:
+                    validate_outputs: bool = True,
+                    resume_run_id: Optional[str] = None) -> PipelineRun:
         """
         Run the complete pipeline or specified steps.
         
@@ -372,18 +1092,31 @@ class NBOPipeline:
             steps: List of step names to run (default: all steps in order)
             stop_on_error: Whether to stop on first error
             validate_outputs: Whether to validate outputs after each step
+            resume_run_id: ID of a checkpointed run to continue; its completed
+                steps are skipped and their outputs reused (``steps`` is ignored)
             
         Returns:
             PipelineRun object with execution results
         """
-        # Create new run
-        run_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self.current_run = PipelineRun(
-            run_id=run_id,
-            start_time=datetime.now()
-        )
+        self._step_frames = {}
+        self._step_keys = {}
         
-        logger.info(f"Starting pipeline run: {run_id}")
+        if resume_run_id:
+            self.current_run = self._prepare_resume(resume_run_id)
+            run_id = resume_run_id
+            steps = [s for s in self.current_run.steps_requested
+                     if s not in self.current_run.steps_completed]
+            logger.info(f"Resuming pipeline run: {run_id}")
+        else:
+            # Create new run
+            # Microseconds plus a random suffix keep runs started together apart
+            start_time = datetime.now()
+            run_id = f"run_{start_time.strftime('%Y%m%d_%H%M%S_%f')}_{secrets.token_hex(2)}"
+            self.current_run = PipelineRun(
+                run_id=run_id,
+                start_time=start_time
+            )
+            logger.info(f"Starting pipeline run: {run_id}")
         
         try:
             # Determine steps to run
@@ -396,23 +1129,30 @@ class NBOPipeline:
                     raise ValueError(f"Invalid steps requested: {invalid_steps}")
                 steps_to_run = steps
             
+            if not resume_run_id:
+                self.current_run.steps_requested = list(steps_to_run)
+            self._save_run_state()
+            
             logger.info(f"Steps to run: {steps_to_run}")
             
-            # Run each step
-            for step_name in steps_to_run:
-                success = self.run_step(step_name)
-                
-                if not success:
-                    if stop_on_error:
-                        logger.error(f"Pipeline stopped due to failure in step: {step_name}")
-                        self.current_run.status = "failed"
-                        break
-                    else:
-                        logger.warning(f"Step {step_name} failed, continuing with next steps")
-                
-                # Validate outputs if requested
-                if success and validate_outputs:
-                    self._validate_step_outputs(step_name)
+            if self.max_workers > 1:
+                self._run_steps_parallel(steps_to_run, stop_on_error, validate_outputs)
+            else:
+                # Run each step
+                for step_name in steps_to_run:
+                    success = self.run_step(step_name)
+                    
+                    if not success:
+                        if stop_on_error:
+                            logger.error(f"Pipeline stopped due to failure in step: {step_name}")
+                            self.current_run.status = "failed"
+                            break
+                        else:
+                            logger.warning(f"Step {step_name} failed, continuing with next steps")
+                    
+                    # Validate outputs if requested
+                    if success and validate_outputs:
+                        self._validate_step_outputs(step_name)
             
             # Update final status
             if self.current_run.status == "running":
@@ -422,6 +1162,9 @@ class NBOPipeline:
                     self.current_run.status = "completed"
             
             self.current_run.end_time = datetime.now()
+            self._save_run_state()
+            if self.checkpoint_runs:
+                self.prune_runs()
             duration = self.current_run.end_time - self.current_run.start_time
             
             logger.info(f"Pipeline run {run_id} completed in {duration}")
@@ -437,12 +1180,153 @@ class NBOPipeline:
                 self.current_run.status = "failed"
                 self.current_run.end_time = datetime.now()
                 self.current_run.error_messages.append(str(e))
+                self._save_run_state()
             raise
     
+    def _prepare_resume(self, run_id: str) -> PipelineRun:
+        """
+        Load a checkpointed run and restore its completed steps' outputs.
+        
+        Failed steps are cleared so they are retried.
+        """
+        run = self.load_run(run_id)
+        run.status = "running"
+        run.end_time = None
+        run.steps_failed = []
+        run.error_messages = []
+        
+        self._step_keys = dict(run.step_cache_keys)
+        run_dir = self._get_run_dir(run_id)
+        step_cache = self.step_cache
+        if step_cache is None and (self.output_path / ".cache").exists():
+            step_cache = StepCache(self.output_path / ".cache")
+        for step_name in list(run.steps_completed):
+            if step_name in run.step_files:
+                # Subprocess steps: their scripts read earlier outputs from the scripts directory
+                missing = [f for f in run.step_files[step_name] if not (run_dir / step_name / f).exists()]
+                if missing:
+                    logger.warning(f"Checkpointed files {missing} of {step_name} are gone; it will be re-run")
+                    run.steps_completed.remove(step_name)
+                    continue
+                for file_name in run.step_files[step_name]:
+                    shutil.copy2(run_dir / step_name / file_name, self.scripts_path / file_name)
+                continue
+            if step_name not in run.step_outputs:
+                continue
+            if (run_dir / step_name).exists():
+                self._step_frames[step_name] = read_frames(run_dir / step_name,
+                                                           run.step_outputs[step_name])
+                continue
+            # Outputs that were in the step cache were not checkpointed again
+            outputs = None
+            if step_cache is not None and step_name in run.step_cache_keys:
+                outputs = step_cache.load(step_name, run.step_cache_keys[step_name])
+            if outputs is not None:
+                self._step_frames[step_name] = outputs
+            else:
+                logger.warning(f"Outputs of {step_name} are no longer cached; it will be re-run")
+                run.steps_completed.remove(step_name)
+                run.steps_cached = [s for s in run.steps_cached if s != step_name]
+        
+        logger.info(f"Reusing completed steps: {run.steps_completed}")
+        return run
+    
+    def _run_steps_parallel(self, steps_to_run: List[str], stop_on_error: bool,
+                            validate_outputs: bool):
+        """
+        Run steps concurrently, starting each one as soon as the steps it
+        depends on (among ``steps_to_run``) have finished.
+        
+        Steps are driven from a thread pool of ``max_workers`` threads. With
+        the "process" executor, in-process step functions are additionally
+        handed to a process pool of the same size.
+        
+        Args:
+            steps_to_run: Steps to run
+            stop_on_error: Whether to stop scheduling new steps after a failure
+            validate_outputs: Whether to validate outputs after each step
+        """
+        requested = set(steps_to_run)
+        waiting_on = {
+            name: {dep for dep in self.steps[name].dependencies if dep in requested}
+            for name in steps_to_run
+        }
+        pending = list(steps_to_run)
+        running = {}
+        stopped = False
+        
+        use_processes = self.executor == "process" and self.execution_mode == "in_process"
+        if self.executor == "process" and not use_processes:
+            logger.info("Subprocess steps already run in their own process; using a thread pool")
+        
+        def run_and_validate(step_name: str) -> bool:
+            success = self.run_step(step_name)
+            if success and validate_outputs:
+                self._validate_step_outputs(step_name)
+            return success
+        
+        if use_processes:
+            # Workers are spawned rather than forked since the scheduler threads are live
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                while pending or running:
+                    if not stopped:
+                        ready = [name for name in pending if not waiting_on[name]]
+                        for step_name in ready:
+                            pending.remove(step_name)
+                            running[pool.submit(run_and_validate, step_name)] = step_name
+                            logger.info(f"Started step: {step_name}")
+                    
+                    if not running:
+                        break
+                    
+                    done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        step_name = running.pop(future)
+                        if not future.result():
+                            if stop_on_error:
+                                if not stopped:
+                                    logger.error(f"Pipeline stopped due to failure in step: {step_name}")
+                                stopped = True
+                                with self._run_lock:
+                                    self.current_run.status = "failed"
+                            else:
+                                logger.warning(f"Step {step_name} failed, continuing with next steps")
+                        for name in pending:
+                            waiting_on[name].discard(step_name)
+        finally:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
+    
+    def get_step_durations(self) -> Dict[str, float]:
+        """Get wall-clock duration in seconds of each step in the current run."""
+        if not self.current_run:
+            return {}
+        
+        return {
+            step_name: (self.current_run.step_end_times[step_name] - start).total_seconds()
+            for step_name, start in self.current_run.step_start_times.items()
+            if step_name in self.current_run.step_end_times
+        }
+    
     def _validate_step_outputs(self, step_name: str):
         """Validate that step outputs were created and are valid."""
         step = self.steps[step_name]
         
+        if step_name in self._step_frames:
+            # In-process outputs are still in memory; no need to re-read them
+            for table_name, df in self._step_frames[step_name].items():
+                if len(df) == 0:
+                    logger.warning(f"Output {table_name} is empty")
+                else:
+                    logger.info(f"Output validated: {table_name} ({len(df)} rows, {len(df.columns)} columns)")
+            return
+        
         for output_file in step.outputs:
             output_path = self.output_path / output_file
             
@@ -491,6 +1375,10 @@ class NBOPipeline:
             'data_path': str(self.data_path),
             'output_path': str(self.output_path), 
             'scripts_path': str(self.scripts_path),
+            'execution_mode': self.execution_mode,
+            'max_workers': self.max_workers,
+            'executor': self.executor,
+            'use_cache': self.step_cache is not None,
             'total_steps': len(self.steps),
             'execution_order': self.get_execution_order(),
             'current_run': {
@@ -506,7 +1394,14 @@ class NBOPipeline:
 def run_nbo_pipeline(data_path: str = "data", 
                     output_path: str = "output",
                     config_path: Optional[str] = None,
-                    steps: Optional[List[str]] = None) -> PipelineRun:
+                    steps: Optional[List[str]] = None,
+                    execution_mode: Optional[str] = None,
+                    max_workers: Optional[int] = None,
+                    executor: Optional[str] = None,
+                    use_cache: Optional[bool] = None,
+                    checkpoint_runs: Optional[bool] = None,
+                    resume_run_id: Optional[str] = None,
+                    retrain_model: bool = False) -> PipelineRun:
     """
     Convenience function to run the NBO pipeline.
     
@@ -515,10 +1410,25 @@ def run_nbo_pipeline(data_path: str = "data",
         output_path: Path to output directory  
         config_path: Path to configuration file/directory
         steps: Specific steps to run (default: all)
+        execution_mode: "subprocess" or "in_process" (default: from settings)
+        max_workers: Number of steps to run concurrently (default: from settings)
+        executor: "thread" or "process" (default: from settings)
+        use_cache: Whether to restore unchanged steps from the cache (default: from settings)
+        checkpoint_runs: Whether to checkpoint the run so it can be resumed (default:
+            from settings; always on when resuming)
+        resume_run_id: ID of a checkpointed run to continue instead of starting a new one
+        retrain_model: Refit the model even if the registry has one for the training snapshot
         
     Returns:
         PipelineRun object with results
     """
     config = NBOConfig(config_path) if config_path else None
-    pipeline = NBOPipeline(data_path, output_path, config)
-    return pipeline.run_pipeline(steps)
+    if retrain_model:
+        config = config or NBOConfig()
+        config.set_setting('model.retrain', True)
+    if resume_run_id:
+        checkpoint_runs = True
+    pipeline = NBOPipeline(data_path, output_path, config, execution_mode=execution_mode,
+                           max_workers=max_workers, executor=executor, use_cache=use_cache,
+                           checkpoint_runs=checkpoint_runs)
+    return pipeline.run_pipeline(steps, resume_run_id=resume_run_id)
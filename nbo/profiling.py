@@ -0,0 +1,185 @@
+"""
+Resource instrumentation for pipeline steps.
+
+This module provides utilities to:
+- Measure wall time, CPU time and peak memory of a block of code
+- Hold per-step metrics (rows and bytes in/out) for a pipeline run
+- Export step metrics as a JSON or CSV trace
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Union
+from dataclasses import dataclass, field, asdict
+import logging
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+TRACE_COLUMNS = [
+    "run_id", "step_name", "status", "start_time", "end_time",
+    "wall_time_s", "cpu_time_s", "peak_rss_mb",
+    "input_rows", "output_rows", "bytes_read", "bytes_written",
+]
+
+
+@dataclass
+class StepMetrics:
+    """Resource usage of a single pipeline step."""
+    step_name: str
+    status: str = "running"  # running, completed, cached, failed
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    wall_time_s: float = 0.0
+    cpu_time_s: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    input_rows: Dict[str, int] = field(default_factory=dict)  # table -> rows
+    output_rows: Dict[str, int] = field(default_factory=dict)  # table -> rows
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert metrics to a dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StepMetrics":
+        """Create metrics from a dictionary produced by ``to_dict``."""
+        return cls(**data)
+
+    def to_trace_row(self, run_id: str) -> Dict[str, Any]:
+        """Flatten metrics into one trace row (row counts are summed)."""
+        row = self.to_dict()
+        row["run_id"] = run_id
+        row["input_rows"] = sum(self.input_rows.values())
+        row["output_rows"] = sum(self.output_rows.values())
+        return {col: row[col] for col in TRACE_COLUMNS}
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Get the resident set size of this process, if the platform exposes it."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss_bytes(children: bool = False) -> Optional[int]:
+    """Get the lifetime peak RSS of this process or of its finished children."""
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    return resource.getrusage(who).ru_maxrss * _MAXRSS_UNIT
+
+
+def children_cpu_time() -> float:
+    """Get the total CPU time of finished child processes."""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+class ResourceMonitor:
+    """
+    Context manager measuring wall time, CPU time and peak RSS.
+
+    Peak RSS is sampled from a background thread, so it covers the whole
+    process: steps running concurrently in one process share the figure.
+
+    Args:
+        cpu_clock: "process" to count CPU time of all threads (including
+            native worker threads), "thread" for the calling thread only
+        interval: Seconds between RSS samples
+    """
+
+    def __init__(self, cpu_clock: str = "process", interval: float = 0.05):
+        self.cpu_clock = time.thread_time if cpu_clock == "thread" else time.process_time
+        self.interval = interval
+        self.wall_time_s = 0.0
+        self.cpu_time_s = 0.0
+        self.peak_rss_bytes: Optional[int] = None
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    def _sample(self):
+        rss = current_rss_bytes()
+        if rss is not None and (self.peak_rss_bytes is None or rss > self.peak_rss_bytes):
+            self.peak_rss_bytes = rss
+
+    def _run_sampler(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "ResourceMonitor":
+        self._wall_start = time.perf_counter()
+        self._cpu_start = self.cpu_clock()
+        self._sample()
+        if self.peak_rss_bytes is not None:
+            self._sampler = threading.Thread(target=self._run_sampler, daemon=True)
+            self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.wall_time_s = time.perf_counter() - self._wall_start
+        self.cpu_time_s = self.cpu_clock() - self._cpu_start
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        self._sample()
+        if self.peak_rss_bytes is None:
+            # No live RSS on this platform; fall back to the lifetime peak
+            self.peak_rss_bytes = peak_rss_bytes()
+        return False
+
+    @property
+    def peak_rss_mb(self) -> Optional[float]:
+        if self.peak_rss_bytes is None:
+            return None
+        return self.peak_rss_bytes / (1024 * 1024)
+
+
+def export_trace(run_id: str, metrics: List[StepMetrics], path: Union[str, Path]) -> Path:
+    """
+    Export step metrics as a trace file.
+
+    Args:
+        run_id: ID of the pipeline run
+        metrics: Metrics of each step
+        path: Output file; ".csv" writes one flat row per step, anything else
+            writes JSON with per-table row counts
+
+    Returns:
+        Path of the written trace
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if path.suffix.lower() == ".csv":
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=TRACE_COLUMNS)
+            writer.writeheader()
+            for step_metrics in metrics:
+                writer.writerow(step_metrics.to_trace_row(run_id))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "run_id": run_id,
+                "steps": [step_metrics.to_dict() for step_metrics in metrics],
+            }, f, indent=2)
+
+    logger.info(f"Step metrics trace written to {path}")
+    return path
@@ -0,0 +1,194 @@
+"""
+Mergeable sketches for approximate data profiling.
+
+Each sketch uses bounded memory, can be updated from a batch of values with
+vectorized NumPy operations and can be merged with a sketch of the same kind
+built on another chunk of the data (or in another process):
+
+- HyperLogLog: distinct counts (relative error about 1.04 / sqrt(2**precision))
+- SpaceSaving: most frequent values with a bound on their count error
+- TDigest: quantiles, most accurate in the tails
+"""
+
+from typing import Any, Dict, Optional
+import numpy as np
+import pandas as pd
+
+# Values are counted in batches so SpaceSaving never builds a hash table
+# larger than one batch
+SPACE_SAVING_BATCH = 65536
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """Hash non-null values to 64-bit integers (equal values hash equal across dtypes)."""
+    return pd.util.hash_pandas_object(values.dropna(), index=False).to_numpy(dtype=np.uint64)
+
+
+def _leading_zeros(values: np.ndarray) -> np.ndarray:
+    """Count leading zero bits of uint64 values (64 for zero)."""
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    with np.errstate(divide='ignore'):
+        # Each half is exact in float64, so floor(log2) is its bit length - 1
+        high_bits = np.where(high > 0, np.floor(np.log2(high)) + 1, 0)
+        low_bits = np.where(low > 0, np.floor(np.log2(low)) + 1, 0)
+    return np.where(high > 0, 32 - high_bits, 64 - low_bits).astype(np.int64)
+
+
+class HyperLogLog:
+    """Distinct-count sketch over 64-bit value hashes."""
+
+    def __init__(self, precision: int = 14):
+        """
+        Initialize the sketch.
+
+        Args:
+            precision: log2 of the number of registers (memory is 2**precision bytes)
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError(f"HyperLogLog precision must be between 4 and 18, got {precision}")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, hashes: np.ndarray) -> "HyperLogLog":
+        """Add 64-bit hashes (see ``hash_values``)."""
+        if len(hashes) == 0:
+            return self
+        p = np.uint64(self.precision)
+        index = (hashes >> (np.uint64(64) - p)).astype(np.int64)
+        rank = np.minimum(_leading_zeros(hashes << p) + 1, 64 - self.precision + 1)
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Merge another sketch of the same precision into this one."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        """Estimate the number of distinct values added."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        empty = int((self.registers == 0).sum())
+        if raw <= 2.5 * m and empty > 0:
+            # Small-range correction (linear counting)
+            return float(m * np.log(m / empty))
+        return float(raw)
+
+
+class SpaceSaving:
+    """
+    Top-k sketch keeping the ``capacity`` most frequent values.
+
+    Retained counts are lower bounds that undercount by at most ``error``;
+    any value that was dropped occurred at most ``error`` times per merge.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.counts: Dict[Any, int] = {}
+        self.error = 0
+
+    def _add_counts(self, counts: Dict[Any, int]):
+        merged = dict(self.counts)
+        for value, count in counts.items():
+            merged[value] = merged.get(value, 0) + int(count)
+        if len(merged) > self.capacity:
+            ranked = sorted(merged.items(), key=lambda item: (-item[1], str(item[0])))
+            self.error += ranked[self.capacity][1]
+            merged = dict(ranked[:self.capacity])
+        self.counts = merged
+
+    def update(self, values: pd.Series) -> "SpaceSaving":
+        """Count the non-null values of a Series, one bounded batch at a time."""
+        values = values.dropna()
+        for start in range(0, len(values), SPACE_SAVING_BATCH):
+            batch = values.iloc[start:start + SPACE_SAVING_BATCH].value_counts()
+            batch = batch[batch > 0]
+            if len(batch) > self.capacity:
+                # Values outside the batch's top capacity occur at most this often
+                self.error += int(batch.iloc[self.capacity])
+                batch = batch.iloc[:self.capacity]
+            self._add_counts(batch.to_dict())
+        return self
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """Merge another sketch into this one."""
+        self.error += other.error
+        self._add_counts(other.counts)
+        return self
+
+    def top(self, k: int) -> Dict[Any, int]:
+        """Get the k most frequent values and their counts."""
+        ranked = sorted(self.counts.items(), key=lambda item: (-item[1], str(item[0])))
+        return dict(ranked[:k])
+
+
+class TDigest:
+    """Quantile sketch of weighted centroids (k1 scale function)."""
+
+    def __init__(self, delta: float = 200):
+        """
+        Initialize the sketch.
+
+        Args:
+            delta: Compression; the digest keeps on the order of delta / 2 centroids
+        """
+        self.delta = delta
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray, presorted: bool = False):
+        if not presorted:
+            order = np.argsort(means, kind='mergesort')
+            means, weights = means[order], weights[order]
+        total = weights.sum()
+        left = (np.cumsum(weights) - weights) / total
+        # Centroids whose left edge falls in the same unit of the scale
+        # function are merged, so each centroid covers about one unit of k
+        k = self.delta / (2 * np.pi) * np.arcsin(np.clip(2 * left - 1, -1, 1))
+        group = np.floor(k - k[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def update(self, values: np.ndarray) -> "TDigest":
+        """Add numeric values (NaNs are ignored)."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        # Compress the batch on its own, then merge the two small digests
+        batch = TDigest(self.delta)
+        values = np.sort(values)
+        batch.min, batch.max = float(values[0]), float(values[-1])
+        batch._compress(values, np.ones(len(values)), presorted=True)
+        return self.merge(batch)
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        """Merge another digest into this one."""
+        if len(other.weights) == 0:
+            return self
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(np.concatenate([self.means, other.means]),
+                       np.concatenate([self.weights, other.weights]))
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile (0 <= q <= 1), or None for an empty digest."""
+        if len(self.weights) == 0:
+            return None
+        total = self.weights.sum()
+        centers = np.cumsum(self.weights) - self.weights / 2
+        return float(np.interp(q * total, np.r_[0.0, centers, total],
+                               np.r_[self.min, self.means, self.max]))
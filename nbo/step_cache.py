@@ -0,0 +1,303 @@
+"""
+Content-addressed artifact cache for pipeline steps.
+
+Each step's outputs are stored under a cache key derived from the hashes of
+its inputs, its code and the relevant configuration. When a later run computes
+the same key, the outputs are restored instead of recomputing the step.
+"""
+
+import ast
+import json
+import hashlib
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from datetime import datetime
+import logging
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+FILE_HASHES_FILE = "file_hashes.json"
+
+
+def hash_text(*parts: str) -> str:
+    """Hash a sequence of strings into a hex digest."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def hash_file(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """Hash the contents of a file into a hex digest."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def local_imports(source_file: Union[str, Path]) -> List[Path]:
+    """
+    Get a module's file and the files of the sibling modules it imports, transitively.
+
+    Both package-relative imports (``from .uplift import ...``) and the plain
+    imports step scripts fall back to (``from uplift import ...``) are followed.
+
+    Args:
+        source_file: Python source file of the module
+
+    Returns:
+        Sorted list of source files, including ``source_file``
+    """
+    source_file = Path(source_file).resolve()
+    package_dir = source_file.parent
+    package_name = package_dir.name
+    seen = set()
+    stack = [source_file]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+
+        names = []
+        for node in ast.walk(ast.parse(path.read_text(encoding='utf-8'))):
+            if isinstance(node, ast.Import):
+                names.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.level <= 1:
+                if node.module:
+                    names.append(node.module)
+                else:  # from . import module
+                    names.extend(alias.name for alias in node.names)
+
+        for name in names:
+            if name.startswith(f"{package_name}."):
+                name = name[len(package_name) + 1:]
+            candidate = package_dir / f"{name.split('.')[0]}.py"
+            if candidate.exists():
+                stack.append(candidate)
+    return sorted(seen)
+
+
+def write_frames(directory: Union[str, Path], frames: Dict[str, pd.DataFrame]) -> int:
+    """Write DataFrames to ``<directory>/<table>.parquet``; returns bytes written."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    bytes_written = 0
+    for table_name, df in frames.items():
+        table_file = directory / f"{table_name}.parquet"
+        df.to_parquet(table_file, index=False)
+        bytes_written += table_file.stat().st_size
+    return bytes_written
+
+
+def read_frames(directory: Union[str, Path], table_names: List[str]) -> Dict[str, pd.DataFrame]:
+    """Read DataFrames written by ``write_frames``."""
+    directory = Path(directory)
+    return {
+        table_name: pd.read_parquet(directory / f"{table_name}.parquet")
+        for table_name in table_names
+    }
+
+
+class StepCache:
+    """Stores step outputs keyed by content hash, one entry per step."""
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialize the step cache.
+
+        Args:
+            cache_dir: Directory for cached artifacts
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file_hashes = self._load_file_hashes()
+
+    def _load_file_hashes(self) -> Dict[str, Dict[str, Union[int, str]]]:
+        """Load memoized file hashes from a previous run."""
+        hashes_file = self.cache_dir / FILE_HASHES_FILE
+        if not hashes_file.exists():
+            return {}
+        try:
+            with open(hashes_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable file hash cache {hashes_file}: {e}")
+            return {}
+
+    def file_hash(self, path: Union[str, Path]) -> str:
+        """
+        Get the content hash of a file.
+
+        Hashes are memoized by file size and modification time, so unchanged
+        files are not re-read on every run.
+
+        Args:
+            path: File to hash
+
+        Returns:
+            Hex digest of the file contents
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        entry = self._file_hashes.get(str(path))
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return str(entry['hash'])
+
+        file_hash = hash_file(path)
+        with self._lock:
+            self._file_hashes[str(path)] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'hash': file_hash,
+            }
+            with open(self.cache_dir / FILE_HASHES_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self._file_hashes, f, indent=2)
+        return file_hash
+
+    def _step_dir(self, step_name: str) -> Path:
+        return self.cache_dir / step_name
+
+    def load(self, step_name: str, key: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Load cached outputs for a step.
+
+        Args:
+            step_name: Name of the step
+            key: Cache key the outputs must have been stored under
+
+        Returns:
+            Dictionary of table name to DataFrame, or None on a cache miss
+        """
+        step_dir = self._step_dir(step_name)
+        manifest_file = step_dir / MANIFEST_FILE
+        if not manifest_file.exists():
+            return None
+
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('key') != key:
+                return None
+            return read_frames(step_dir, manifest.get('tables', []))
+        except Exception as e:
+            logger.warning(f"Could not restore cached outputs for {step_name}: {e}")
+            return None
+
+    def entry_bytes(self, step_name: str) -> int:
+        """Get the size on disk of a step's cached outputs."""
+        step_dir = self._step_dir(step_name)
+        if not step_dir.exists():
+            return 0
+        return sum(p.stat().st_size for p in step_dir.glob("*.parquet"))
+
+    def save(self, step_name: str, key: str, outputs: Dict[str, pd.DataFrame]) -> int:
+        """
+        Store step outputs under a cache key, replacing any previous entry.
+
+        Args:
+            step_name: Name of the step
+            key: Cache key
+            outputs: Dictionary of table name to DataFrame
+
+        Returns:
+            Number of bytes written
+        """
+        step_dir = self._step_dir(step_name)
+        if step_dir.exists():
+            shutil.rmtree(step_dir)
+        bytes_written = write_frames(step_dir, outputs)
+
+        # The manifest is written last so a partial entry is never a hit
+        manifest = {
+            'key': key,
+            'tables': list(outputs.keys()),
+            'created': datetime.now().isoformat(),
+        }
+        with open(step_dir / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        return bytes_written
+
+    def _read_manifest(self, step_name: str, key: str) -> Optional[Dict]:
+        """Read a step's manifest if it was stored under ``key``."""
+        manifest_file = self._step_dir(step_name) / MANIFEST_FILE
+        if not manifest_file.exists():
+            return None
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return manifest if manifest.get('key') == key else None
+
+    def record_written(self, step_name: str, key: str, written: Dict[str, str],
+                       output_settings: str = ""):
+        """
+        Remember the output files written from a cache entry.
+
+        Args:
+            step_name: Name of the step
+            key: Cache key of the entry the files were written from
+            written: Dictionary of filename -> path of the written files
+            output_settings: Serialized settings that decided which files were written
+        """
+        with self._lock:
+            manifest = self._read_manifest(step_name, key)
+            if manifest is None:
+                return
+            manifest['written'] = {}
+            manifest['output_settings'] = output_settings
+            for name, path in written.items():
+                stat = Path(path).stat()
+                manifest['written'][name] = {'path': str(path), 'size': stat.st_size,
+                                             'mtime_ns': stat.st_mtime_ns}
+            with open(self._step_dir(step_name) / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+
+    def written_outputs(self, step_name: str, key: str,
+                        output_settings: str = "") -> Optional[Dict[str, str]]:
+        """
+        Get the output files written from a cache entry, if they are unchanged since.
+
+        Args:
+            step_name: Name of the step
+            key: Cache key of the entry
+            output_settings: Serialized settings the files must have been written with
+
+        Returns:
+            Dictionary of filename -> path, or None if the files must be rewritten
+        """
+        manifest = self._read_manifest(step_name, key)
+        if (manifest is None or 'written' not in manifest
+                or manifest.get('output_settings') != output_settings):
+            return None
+        for entry in manifest['written'].values():
+            path = Path(entry['path'])
+            if not path.exists():
+                return None
+            stat = path.stat()
+            if stat.st_size != entry['size'] or stat.st_mtime_ns != entry['mtime_ns']:
+                return None
+        return {name: entry['path'] for name, entry in manifest['written'].items()}
+
+    def clear(self, step_names: Optional[List[str]] = None):
+        """
+        Remove cached entries.
+
+        Args:
+            step_names: Steps to clear (default: all steps)
+        """
+        if step_names is None:
+            step_names = [p.name for p in self.cache_dir.iterdir() if p.is_dir()]
+        for step_name in step_names:
+            step_dir = self._step_dir(step_name)
+            if step_dir.exists():
+                shutil.rmtree(step_dir)
+        logger.info(f"Cleared step cache for: {step_names}")
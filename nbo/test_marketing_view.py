@@ -12,6 +12,78 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+INPUT_TABLES = ["offer_catalog_v1", "decision_log_output"]
+OUTPUT_TABLES = ["test_marketing_view_output"]
+
+
+def build_marketing_view(offer_catalog: pd.DataFrame, decision_log: pd.DataFrame) -> pd.DataFrame:
+    """Combine validated offers with final decisions into the marketing view."""
+    # Ensure we have the key columns for joining
+    if 'promotion_id' not in offer_catalog.columns:
+        raise ValueError("offer_catalog missing promotion_id column")
+    
+    if 'promotion_id' not in decision_log.columns:
+        raise ValueError("decision_log missing promotion_id column")
+    
+    catalog_view = offer_catalog[['promotion_id', 'promotion_name', 'product_category', 
+                                  'base_price', 'channel_eligibility', 'start_date', 'end_date',
+                                  'legal_flag']].copy()
+    # An in-memory or parquet catalog keeps channel_eligibility as lists/arrays;
+    # use the same text form the CSV round trip produces so the frame stays hashable
+    catalog_view['channel_eligibility'] = catalog_view['channel_eligibility'].map(
+        lambda v: str(list(v)) if isinstance(v, (list, np.ndarray)) else v
+    )
+    
+    # Merge decision log with offer catalog to get complete offer details
+    test_marketing_view = decision_log.merge(
+        catalog_view.drop_duplicates(),
+        on='promotion_id',
+        how='left',
+        suffixes=('', '_catalog')
+    )
+    
+    # Add marketing-specific fields
+    test_marketing_view['campaign_type'] = 'NBO_ML_DRIVEN'
+    test_marketing_view['test_cell'] = 'TREATMENT'
+    test_marketing_view['selection_method'] = 'UPLIFT_MODEL'
+    test_marketing_view['created_timestamp'] = pd.Timestamp.now().isoformat()
+    
+    # Add some derived marketing metrics
+    if 'eim_final' in test_marketing_view.columns and 'expected_ticket' in test_marketing_view.columns:
+        test_marketing_view['roi_estimate'] = (
+            test_marketing_view['eim_final'] / test_marketing_view['expected_ticket']
+        ).fillna(0)
+    
+    if 'discount_cost_banded' in test_marketing_view.columns and 'base_price' in test_marketing_view.columns:
+        test_marketing_view['discount_percentage'] = (
+            test_marketing_view['discount_cost_banded'] / test_marketing_view['base_price'] * 100
+        ).fillna(0)
+    
+    # Select final columns for marketing view
+    marketing_columns = [
+        'guest_id', 'promotion_id', 'promotion_name', 'product_category',
+        'campaign_type', 'test_cell', 'selection_method',
+        'base_price', 'discount_cost_banded', 'discount_percentage',
+        'expected_ticket', 'eim_final', 'roi_estimate',
+        'channel_eligibility', 'start_date', 'end_date',
+        'p_treat', 'p_ctrl', 'uplift',
+        'created_timestamp', 'snapshot_id', 'build_version'
+    ]
+    
+    # Only include columns that exist
+    available_columns = [col for col in marketing_columns if col in test_marketing_view.columns]
+    final_view = test_marketing_view[available_columns].copy()
+    
+    # Sort by guest_id for consistent output
+    return final_view.sort_values('guest_id')
+
+
+def run(tables):
+    """In-process entry point used by NBOPipeline."""
+    final_view = build_marketing_view(tables["offer_catalog_v1"], tables["decision_log_output"])
+    return {"test_marketing_view_output": final_view}
+
+
 def main():
     """Generate test marketing view from contract checks and guardrails winners outputs."""
     
@@ -44,58 +116,7 @@ def main():
         
         # Create test marketing view by joining the data
         # This combines the validated offer information with the final decisions
-        
-        # Ensure we have the key columns for joining
-        if 'promotion_id' not in offer_catalog.columns:
-            raise ValueError("offer_catalog missing promotion_id column")
-        
-        if 'promotion_id' not in decision_log.columns:
-            raise ValueError("decision_log missing promotion_id column")
-        
-        # Merge decision log with offer catalog to get complete offer details
-        test_marketing_view = decision_log.merge(
-            offer_catalog[['promotion_id', 'promotion_name', 'product_category', 
-                          'base_price', 'channel_eligibility', 'start_date', 'end_date',
-                          'legal_flag']].drop_duplicates(),
-            on='promotion_id',
-            how='left',
-            suffixes=('', '_catalog')
-        )
-        
-        # Add marketing-specific fields
-        test_marketing_view['campaign_type'] = 'NBO_ML_DRIVEN'
-        test_marketing_view['test_cell'] = 'TREATMENT'
-        test_marketing_view['selection_method'] = 'UPLIFT_MODEL'
-        test_marketing_view['created_timestamp'] = pd.Timestamp.now().isoformat()
-        
-        # Add some derived marketing metrics
-        if 'eim_final' in test_marketing_view.columns and 'expected_ticket' in test_marketing_view.columns:
-            test_marketing_view['roi_estimate'] = (
-                test_marketing_view['eim_final'] / test_marketing_view['expected_ticket']
-            ).fillna(0)
-        
-        if 'discount_cost_banded' in test_marketing_view.columns and 'base_price' in test_marketing_view.columns:
-            test_marketing_view['discount_percentage'] = (
-                test_marketing_view['discount_cost_banded'] / test_marketing_view['base_price'] * 100
-            ).fillna(0)
-        
-        # Select final columns for marketing view
-        marketing_columns = [
-            'guest_id', 'promotion_id', 'promotion_name', 'product_category',
-            'campaign_type', 'test_cell', 'selection_method',
-            'base_price', 'discount_cost_banded', 'discount_percentage',
-            'expected_ticket', 'eim_final', 'roi_estimate',
-            'channel_eligibility', 'start_date', 'end_date',
-            'p_treat', 'p_ctrl', 'uplift',
-            'created_timestamp', 'snapshot_id', 'build_version'
-        ]
-        
-        # Only include columns that exist
-        available_columns = [col for col in marketing_columns if col in test_marketing_view.columns]
-        final_view = test_marketing_view[available_columns].copy()
-        
-        # Sort by guest_id for consistent output
-        final_view = final_view.sort_values('guest_id')
+        final_view = build_marketing_view(offer_catalog, decision_log)
         
         # Save output
         output_file = "test_marketing_view_output.csv"
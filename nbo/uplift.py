@@ -0,0 +1,200 @@
+"""
+Uplift models for offer response.
+
+This module provides:
+- Learner factories for the supported gradient boosting backends
+- T-, S- and X-learner uplift models trained on one shared float32 feature matrix
+- Batched scoring of p_treat, p_ctrl and uplift
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.ensemble import (GradientBoostingClassifier, GradientBoostingRegressor,
+                              HistGradientBoostingClassifier, HistGradientBoostingRegressor)
+from sklearn.calibration import CalibratedClassifierCV
+
+logger = logging.getLogger(__name__)
+
+# gbm: exact-split GradientBoosting (single-threaded per fit)
+# hist_gbm: HistGradientBoosting on float32 features, binned and multi-threaded
+LEARNERS = ("gbm", "hist_gbm")
+
+# t_learner: separate treatment and control response models
+# s_learner: one response model with the treatment flag as a feature
+# x_learner: T-learner responses plus effect models fit on imputed treatment effects
+UPLIFT_METHODS = ("t_learner", "s_learner", "x_learner")
+
+# Control response rate assumed when the control group is too small to model
+BASELINE_P_CTRL = 0.5
+
+
+def feature_matrix(df: pd.DataFrame, feat_cols: List[str]) -> np.ndarray:
+    """Build the contiguous float32 feature matrix (missing values as 0)."""
+    return np.ascontiguousarray(df[feat_cols].fillna(0.0).to_numpy(dtype=np.float32))
+
+
+def make_classifier(params: Dict[str, Any], y: np.ndarray, n_jobs: Optional[int] = None):
+    """
+    Build a calibrated response classifier for the configured learner.
+
+    Args:
+        params: Model parameters (learner, n_estimators, random_state, calibration_cv)
+        y: Labels it will be fit on (bounds the number of calibration folds)
+        n_jobs: Parallel calibration folds for the gbm learner (hist_gbm
+            already uses all cores inside each fit)
+    """
+    learner = params["learner"]
+    # Every calibration fold needs both classes
+    cv = max(2, min(params["calibration_cv"], int(np.bincount(y, minlength=2).min())))
+    if learner == "gbm":
+        base = GradientBoostingClassifier(n_estimators=params["n_estimators"],
+                                          random_state=params["random_state"])
+        return CalibratedClassifierCV(base, cv=cv, n_jobs=n_jobs)
+    if learner == "hist_gbm":
+        base = HistGradientBoostingClassifier(max_iter=params["n_estimators"], early_stopping=False,
+                                              random_state=params["random_state"])
+        return CalibratedClassifierCV(base, cv=cv)
+    raise ValueError(f"Unknown model learner '{learner}'. Choose from: {LEARNERS}")
+
+
+def make_regressor(params: Dict[str, Any]):
+    """Build a treatment-effect regressor for the configured learner."""
+    learner = params["learner"]
+    if learner == "gbm":
+        return GradientBoostingRegressor(n_estimators=params["n_estimators"],
+                                         random_state=params["random_state"])
+    if learner == "hist_gbm":
+        return HistGradientBoostingRegressor(max_iter=params["n_estimators"], early_stopping=False,
+                                             random_state=params["random_state"])
+    raise ValueError(f"Unknown model learner '{learner}'. Choose from: {LEARNERS}")
+
+
+def _fit_rows(estimator, X: np.ndarray, rows: np.ndarray, y: np.ndarray):
+    """Fit an estimator on a subset of rows of the shared matrix."""
+    return estimator.fit(X[rows], y)
+
+
+def _positive_proba(model, X: np.ndarray) -> np.ndarray:
+    return model.predict_proba(X)[:, 1]
+
+
+class UpliftModel:
+    """
+    Treatment and control response models with an uplift estimate.
+
+    Args:
+        method: One of UPLIFT_METHODS
+        params: Model parameters (learner, n_estimators, random_state,
+            calibration_cv, min_control_samples)
+        n_jobs: Worker processes for independent fits (treatment and
+            control models are fit side by side)
+    """
+
+    def __init__(self, method: str, params: Dict[str, Any], n_jobs: Optional[int] = None):
+        if method not in UPLIFT_METHODS:
+            raise ValueError(f"Unknown uplift method '{method}'. Choose from: {UPLIFT_METHODS}")
+        if params["learner"] not in LEARNERS:
+            raise ValueError(f"Unknown model learner '{params['learner']}'. Choose from: {LEARNERS}")
+        self.method = method
+        self.params = dict(params)
+        self.n_jobs = n_jobs
+        self.treated_only = False
+        self.models: Dict[str, Any] = {}
+        self.propensity: Optional[float] = None
+
+    def _fit_parallel(self, jobs: List[Tuple[str, Any, np.ndarray, np.ndarray]], X: np.ndarray):
+        """Fit (name, estimator, rows, y) jobs, in worker processes when n_jobs allows."""
+        n_jobs = self.n_jobs if self.n_jobs is not None else 1
+        if len(jobs) == 1 or n_jobs == 1:
+            fitted = [_fit_rows(est, X, rows, y) for _, est, rows, y in jobs]
+        else:
+            # loky memory-maps X, so all workers read the same matrix
+            fitted = Parallel(n_jobs=min(len(jobs), n_jobs) if n_jobs > 0 else len(jobs), backend="loky")(
+                delayed(_fit_rows)(est, X, rows, y) for _, est, rows, y in jobs)
+        for (name, _, _, _), model in zip(jobs, fitted):
+            self.models[name] = model
+
+    def fit(self, X: np.ndarray, treatment: np.ndarray, y: np.ndarray) -> "UpliftModel":
+        """
+        Fit the uplift model.
+
+        Args:
+            X: Feature matrix (see ``feature_matrix``)
+            treatment: Treatment flag per row (1 = treated)
+            y: Binary response per row
+        """
+        treatment = np.asarray(treatment).astype(bool)
+        y = np.asarray(y).astype(int)
+        treated, control = np.flatnonzero(treatment), np.flatnonzero(~treatment)
+
+        if len(treated) == 0:
+            raise ValueError("Treatment group must contain samples. Current count: 0")
+
+        if (len(control) < self.params.get("min_control_samples", 1)
+                or np.bincount(y[control], minlength=2).min() < 2):
+            logger.warning(f"Only {len(control)} usable control group samples - "
+                           f"using baseline p_ctrl={BASELINE_P_CTRL}")
+            self.treated_only = True
+            self._fit_parallel([("treated", make_classifier(self.params, y[treated]),
+                                 treated, y[treated])], X)
+            return self
+
+        if self.method == "s_learner":
+            X_s = np.empty((len(X), X.shape[1] + 1), dtype=np.float32)
+            X_s[:, :-1] = X
+            X_s[:, -1] = treatment
+            self._fit_parallel([("response", make_classifier(self.params, y, self.n_jobs),
+                                 np.arange(len(X)), y)], X_s)
+            return self
+
+        self._fit_parallel([
+            ("treated", make_classifier(self.params, y[treated]), treated, y[treated]),
+            ("control", make_classifier(self.params, y[control]), control, y[control]),
+        ], X)
+
+        if self.method == "x_learner":
+            # Imputed individual effects: observed response vs the other arm's model
+            d_treated = y[treated] - _positive_proba(self.models["control"], X[treated])
+            d_control = _positive_proba(self.models["treated"], X[control]) - y[control]
+            self._fit_parallel([
+                ("effect_treated", make_regressor(self.params), treated, d_treated),
+                ("effect_control", make_regressor(self.params), control, d_control),
+            ], X)
+            # Randomized assignment: the propensity is the treated share
+            self.propensity = len(treated) / len(X)
+        return self
+
+    def predict(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score p_treat, p_ctrl and uplift for each row of X.
+
+        Returns:
+            Tuple of (p_treat, p_ctrl, uplift) arrays
+        """
+        if self.treated_only:
+            p_treat = _positive_proba(self.models["treated"], X)
+            p_ctrl = np.full(len(X), BASELINE_P_CTRL)
+            return p_treat, p_ctrl, p_treat - p_ctrl
+
+        if self.method == "s_learner":
+            # Both arms in one batch: rows [0, n) treated, [n, 2n) control
+            X_s = np.empty((2 * len(X), X.shape[1] + 1), dtype=np.float32)
+            X_s[:len(X), :-1] = X
+            X_s[len(X):, :-1] = X
+            X_s[:len(X), -1] = 1.0
+            X_s[len(X):, -1] = 0.0
+            p = _positive_proba(self.models["response"], X_s)
+            p_treat, p_ctrl = p[:len(X)], p[len(X):]
+            return p_treat, p_ctrl, p_treat - p_ctrl
+
+        p_treat = _positive_proba(self.models["treated"], X)
+        p_ctrl = _positive_proba(self.models["control"], X)
+        if self.method == "x_learner":
+            g = self.propensity
+            uplift = (g * self.models["effect_control"].predict(X)
+                      + (1 - g) * self.models["effect_treated"].predict(X))
+            return p_treat, p_ctrl, uplift
+        return p_treat, p_ctrl, p_treat - p_ctrl
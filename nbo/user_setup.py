@@ -6,17 +6,63 @@ and validate it against the expected schema.
 """
 
 import shutil
+import pickle
+import hashlib
+import multiprocessing
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import logging
+from concurrent.futures import ProcessPoolExecutor
 
 from .configuration import NBOConfig
 from .data_loader import DataLoader
-from .validation import assess_data_quality, validate_business_rules
+from .validation import (DataQualityReport, assess_data_quality, assess_data_quality_incremental,
+                         validate_business_rules)
 
 logger = logging.getLogger(__name__)
 
+# Suffix of the persisted quality state of each table under the state directory
+QUALITY_STATE_SUFFIX = ".quality.pkl"
+
+
+def hash_file_prefixes(file_path: Path, size: int,
+                       checkpoint: Optional[int] = None) -> Tuple[str, Optional[str]]:
+    """
+    Hash the first ``size`` bytes of a file in one pass.
+    
+    Args:
+        file_path: File to hash
+        size: Number of bytes to hash
+        checkpoint: Also hash the first ``checkpoint`` bytes (at most ``size``)
+        
+    Returns:
+        Tuple of (hash of ``size`` bytes, hash of ``checkpoint`` bytes or None)
+    """
+    digest = hashlib.sha256()
+    checkpoint_hash = digest.hexdigest() if checkpoint == 0 else None
+    position = 0
+    with open(file_path, 'rb') as f:
+        while position < size:
+            read_size = min(1 << 20, size - position)
+            if checkpoint is not None and position < checkpoint:
+                read_size = min(read_size, checkpoint - position)
+            chunk = f.read(read_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+            position += len(chunk)
+            if position == checkpoint:
+                checkpoint_hash = digest.copy().hexdigest()
+    return digest.hexdigest(), checkpoint_hash
+
+
+def _validate_table_in_process(config: NBOConfig, data_path: Path, table_name: str,
+                               state_dir: Optional[Path]) -> Dict[str, Any]:
+    """Validate one table in a worker process (see ``UserDataSetup.validate_user_data``)."""
+    setup = UserDataSetup(config)
+    return setup._validate_table(DataLoader(data_path, config), table_name, state_dir)
+
 
 class UserDataSetup:
     """Helper class for users to set up and validate their own data."""
@@ -152,19 +198,117 @@ This will validate your data against the expected schema and business rules.
         
         return content
     
+    def _assess_quality_incremental(self, df: pd.DataFrame, table_name: str, source_path: Path,
+                                    state_dir: Path) -> DataQualityReport:
+        """
+        Assess a table's quality from its persisted state plus any appended rows.
+        
+        The state is reused when the source file only grew since it was saved
+        (its old bytes are unchanged); otherwise the whole table is profiled.
+        """
+        state_path = state_dir / f"{table_name}{QUALITY_STATE_SUFFIX}"
+        source_size = source_path.stat().st_size
+        
+        previous, metadata = None, {}
+        if state_path.exists():
+            try:
+                previous, metadata = DataQualityReport.load(state_path)
+            except (OSError, ValueError, KeyError, pickle.UnpicklingError) as e:
+                logger.warning(f"Could not reuse quality state of {table_name}: {e}")
+        
+        # One pass over the source hashes both the old-size prefix and the whole file
+        previous_size = metadata.get('source_size', -1)
+        checkpoint = previous_size if previous is not None and 0 <= previous_size <= source_size else None
+        source_sha256, prefix_sha256 = hash_file_prefixes(source_path, source_size, checkpoint)
+        
+        quality_report = None
+        if previous is not None:
+            if (prefix_sha256 is not None
+                    and previous.row_count <= len(df)
+                    and prefix_sha256 == metadata.get('source_prefix_sha256')):
+                try:
+                    quality_report = assess_data_quality_incremental(
+                        df.iloc[previous.row_count:], table_name, previous)
+                    logger.info(f"Profiled {len(df) - previous.row_count} appended rows of {table_name}")
+                except ValueError as e:
+                    logger.warning(f"Could not reuse quality state of {table_name}: {e}")
+            else:
+                logger.info(f"{table_name} changed beyond an append; profiling the whole table")
+        
+        if quality_report is None:
+            quality_report = assess_data_quality(df, table_name, approximate=True)
+        
+        quality_report.save(state_path, {
+            'source_size': source_size,
+            'source_prefix_sha256': source_sha256,
+        })
+        return quality_report
+    
+    def _validate_table(self, loader: DataLoader, table_name: str,
+                        state_dir: Optional[Path]) -> Dict[str, Any]:
+        """
+        Load, profile and rule-check one table.
+        
+        Args:
+            loader: Data loader for the data directory
+            table_name: Name of the table to validate
+            state_dir: Directory persisting quality state (None profiles in full)
+            
+        Returns:
+            Per-table validation result
+        """
+        # Load and validate data
+        df = loader.load_table(table_name, validate_schema=True)
+        
+        # Data quality assessment (sketch-based for very large tables, which
+        # are updated incrementally when quality state is kept)
+        approximate_min_rows = self.config.get_setting('validation.approximate_min_rows')
+        approximate = approximate_min_rows is not None and len(df) >= approximate_min_rows
+        if approximate and state_dir is not None:
+            quality_report = self._assess_quality_incremental(
+                df, table_name, loader.get_table_path(table_name), Path(state_dir))
+        else:
+            quality_report = assess_data_quality(df, table_name, approximate=approximate)
+        
+        # Business rules validation
+        business_errors = validate_business_rules(df, table_name)
+        
+        # Compile results
+        quality_score = quality_report.calculate_quality_score()
+        return {
+            'file_name': table_name,
+            'rows': len(df),
+            'columns': len(df.columns),
+            'quality_score': quality_score,
+            'quality_issues': quality_report.issues,
+            'quality_warnings': quality_report.warnings,
+            'business_errors': business_errors,
+            'status': 'passed' if not business_errors and quality_score > 70 else 'failed'
+        }
+    
     def validate_user_data(self, data_path: Path, 
-                          strict: bool = True) -> Dict[str, Any]:
+                          strict: bool = True,
+                          state_dir: Optional[Path] = None,
+                          jobs: Optional[int] = None) -> Dict[str, Any]:
         """
         Validate user-provided data against schema and business rules.
         
         Args:
             data_path: Path to user data directory
             strict: Whether to fail on validation errors
+            state_dir: Directory persisting each table's quality state, so
+                append-only tables only profile their new rows (default:
+                ``validation.state_dir``; None profiles every table in full)
+            jobs: Number of tables validated concurrently in worker processes;
+                1 validates them one after another (default: ``validation.jobs``)
             
         Returns:
             Validation report dictionary
         """
         data_path = Path(data_path)
+        if state_dir is None and self.config.get_setting('validation.state_dir'):
+            state_dir = data_path / self.config.get_setting('validation.state_dir')
+        jobs = max(1, int(jobs or self.config.get_setting('validation.jobs', 1)))
         
         if not data_path.exists():
             raise FileNotFoundError(f"Data path does not exist: {data_path}")
@@ -198,60 +342,64 @@ This will validate your data against the expected schema and business rules.
             if strict:
                 raise ValueError(error_msg)
         
-        # Validate each available file
-        for table_name in available_tables:
-            validation_report['files_validated'] += 1
-            
-            try:
-                # Load and validate data
-                df = loader.load_table(table_name, validate_schema=True)
-                
-                # Data quality assessment
-                quality_report = assess_data_quality(df, table_name)
-                
-                # Business rules validation
-                business_errors = validate_business_rules(df, table_name)
-                
-                # Compile results
-                file_result = {
-                    'file_name': table_name,
-                    'rows': len(df),
-                    'columns': len(df.columns),
-                    'quality_score': quality_report.calculate_quality_score(),
-                    'quality_issues': quality_report.issues,
-                    'quality_warnings': quality_report.warnings,
-                    'business_errors': business_errors,
-                    'status': 'passed' if not business_errors and quality_report.calculate_quality_score() > 70 else 'failed'
-                }
-                
-                validation_report['validation_results'][table_name] = file_result
+        # Validate each available file, in worker processes when jobs allows;
+        # results are merged in table order either way
+        pool = None
+        if jobs > 1 and len(available_tables) > 1:
+            # Workers are spawned rather than forked since Arrow and loader threads may be live
+            pool = ProcessPoolExecutor(max_workers=min(jobs, len(available_tables)),
+                                       mp_context=multiprocessing.get_context("spawn"))
+            futures = {
+                table_name: pool.submit(_validate_table_in_process, self.config, data_path,
+                                        table_name, state_dir)
+                for table_name in available_tables
+            }
+        
+        try:
+            for table_name in available_tables:
+                validation_report['files_validated'] += 1
                 
-                if file_result['status'] == 'passed':
-                    validation_report['files_passed'] += 1
-                    logger.info(f"✓ {table_name}: Validation passed")
-                else:
-                    validation_report['files_failed'] += 1
-                    logger.warning(f"✗ {table_name}: Validation failed")
+                try:
+                    if pool is not None:
+                        file_result = futures[table_name].result()
+                    else:
+                        file_result = self._validate_table(loader, table_name, state_dir)
                     
-                    # Add errors to main report
-                    for error in business_errors:
-                        validation_report['errors'].append(f"{table_name}: {error}")
+                    validation_report['validation_results'][table_name] = file_result
                     
-                    for issue in quality_report.issues:
-                        validation_report['errors'].append(f"{table_name}: {issue}")
-                
-                # Add warnings
-                for warning in quality_report.warnings:
-                    validation_report['warnings'].append(f"{table_name}: {warning}")
-                
-            except Exception as e:
-                validation_report['files_failed'] += 1
-                error_msg = f"Failed to validate {table_name}: {str(e)}"
-                validation_report['errors'].append(error_msg)
-                logger.error(error_msg)
-                
-                if strict:
-                    raise
+                    if file_result['status'] == 'passed':
+                        validation_report['files_passed'] += 1
+                        logger.info(f"✓ {table_name}: Validation passed")
+                    else:
+                        validation_report['files_failed'] += 1
+                        logger.warning(f"✗ {table_name}: Validation failed")
+                        
+                        # Add errors to main report
+                        for error in file_result['business_errors']:
+                            validation_report['errors'].append(f"{table_name}: {error}")
+                        
+                        for issue in file_result['quality_issues']:
+                            validation_report['errors'].append(f"{table_name}: {issue}")
+                    
+                    # Add warnings
+                    for warning in file_result['quality_warnings']:
+                        validation_report['warnings'].append(f"{table_name}: {warning}")
+                    
+                except Exception as e:
+                    validation_report['files_failed'] += 1
+                    error_msg = f"Failed to validate {table_name}: {str(e)}"
+                    validation_report['errors'].append(error_msg)
+                    logger.error(error_msg)
+                    
+                    if strict:
+                        raise
+        finally:
+            if pool is not None:
+                # Drop tables not yet started (e.g. after a strict failure);
+                # shutdown(cancel_futures=True) needs Python 3.9
+                for future in futures.values():
+                    future.cancel()
+                pool.shutdown(wait=True)
         
         # Determine overall status
         if validation_report['files_failed'] == 0:
@@ -324,16 +472,20 @@ def setup_user_data(output_dir: str = "data_template") -> Dict[str, str]:
     return setup.create_data_template(Path(output_dir))
 
 
-def validate_user_data(data_path: str, strict: bool = True) -> Dict[str, Any]:
+def validate_user_data(data_path: str, strict: bool = True,
+                       state_dir: Optional[str] = None, jobs: Optional[int] = None) -> Dict[str, Any]:
     """
     Convenience function to validate user data.
     
     Args:
         data_path: Path to user data directory
         strict: Whether to fail on validation errors
+        state_dir: Directory persisting quality state for incremental profiling
+        jobs: Number of tables validated concurrently in worker processes
         
     Returns:
         Validation report dictionary
     """
     setup = UserDataSetup()
-    return setup.validate_user_data(Path(data_path), strict)
+    return setup.validate_user_data(Path(data_path), strict,
+                                    Path(state_dir) if state_dir else None, jobs)
@@ -2,15 +2,80 @@
 Data validation utilities for the NBO package.
 
 This module provides utilities for validating data quality and consistency.
+Reports are either exact or, for very large tables, approximate: built from
+mergeable sketches so reports of chunks or worker processes can be combined.
 """
 
+import copy
+import pickle
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Union
 import logging
 
+from .sketches import HyperLogLog, SpaceSaving, TDigest, hash_values
+
 logger = logging.getLogger(__name__)
 
+# Quantiles reported for numeric columns of approximate reports
+APPROXIMATE_QUANTILES = {'p01': 0.01, 'p50': 0.5, 'p99': 0.99}
+
+
+def _dtype_kind(dtype: str) -> str:
+    """Group dtypes whose values hash alike (see ``row_hashes``)."""
+    if dtype in ('object', 'str', 'category') or dtype.startswith('string'):
+        return 'text'
+    if dtype.lower().startswith(('int', 'uint')):
+        return 'int'
+    return dtype
+
+
+@dataclass
+class QualityProfile:
+    """
+    Mergeable state behind an approximate DataQualityReport.
+    
+    Counts, moments and sketches of two profiles of the same table combine
+    into the profile of both chunks; duplicate rows are tracked through the
+    set of distinct 64-bit row hashes.
+    """
+    row_count: int = 0
+    data_types: Dict[str, str] = field(default_factory=dict)
+    missing: Dict[str, int] = field(default_factory=dict)
+    row_hashes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint64))
+    numeric: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    digests: Dict[str, TDigest] = field(default_factory=dict)
+    distinct: Dict[str, HyperLogLog] = field(default_factory=dict)
+    top_values: Dict[str, SpaceSaving] = field(default_factory=dict)
+    
+    def merge(self, other: "QualityProfile") -> "QualityProfile":
+        """Merge the profile of another chunk of the same table into this one."""
+        if self.row_count and other.row_count:
+            kinds = [(col, _dtype_kind(dtype)) for col, dtype in self.data_types.items()]
+            other_kinds = [(col, _dtype_kind(dtype)) for col, dtype in other.data_types.items()]
+            if kinds != other_kinds:
+                raise ValueError("Cannot merge quality profiles with different columns or column types")
+        if not self.row_count:
+            self.data_types = dict(other.data_types)
+        
+        self.row_count += other.row_count
+        for col, count in other.missing.items():
+            self.missing[col] = self.missing.get(col, 0) + count
+        self.row_hashes = np.union1d(self.row_hashes, other.row_hashes)
+        for col, raw in other.numeric.items():
+            self.numeric[col] = merge_numeric_stats(self.numeric[col], raw) if col in self.numeric else dict(raw)
+        for sketches, other_sketches in ((self.digests, other.digests),
+                                         (self.distinct, other.distinct),
+                                         (self.top_values, other.top_values)):
+            for col, sketch in other_sketches.items():
+                if col in sketches:
+                    sketches[col].merge(sketch)
+                else:
+                    sketches[col] = copy.deepcopy(sketch)
+        return self
+
 
 class DataQualityReport:
     """Class to hold data quality assessment results."""
@@ -26,6 +91,133 @@ class DataQualityReport:
         self.categorical_stats: Dict[str, Dict[str, Any]] = {}
         self.issues: List[str] = []
         self.warnings: List[str] = []
+        # Set on approximate reports (see assess_data_quality)
+        self.approximate = False
+        self.profile: Optional[QualityProfile] = None
+    
+    @classmethod
+    def from_profile(cls, table_name: str, profile: QualityProfile) -> "DataQualityReport":
+        """
+        Build an approximate report from a quality profile.
+        
+        Missing rates, duplicates and numeric moments are exact; distinct
+        counts, most common values and quantiles are sketch estimates.
+        """
+        report = cls(table_name)
+        report.approximate = True
+        report.profile = profile
+        report.row_count = profile.row_count
+        report.column_count = len(profile.data_types)
+        
+        if report.row_count == 0:
+            report.add_issue("Table is empty")
+            return report
+        
+        report.missing_data = {col: profile.missing[col] / profile.row_count for col in profile.data_types}
+        report.duplicate_rows = profile.row_count - len(profile.row_hashes)
+        report.data_types = dict(profile.data_types)
+        non_null = {col: profile.row_count - profile.missing[col] for col in profile.data_types}
+        
+        for col, raw in profile.numeric.items():
+            if raw['count'] > 0:
+                stats = summarize_numeric_stats(raw)
+                stats['quantiles'] = {name: profile.digests[col].quantile(q)
+                                      for name, q in APPROXIMATE_QUANTILES.items()}
+                report.numeric_stats[col] = stats
+        
+        for col, sketch in profile.distinct.items():
+            if non_null[col] > 0:
+                unique_values = min(max(1, int(round(sketch.estimate()))), non_null[col])
+                report.categorical_stats[col] = {
+                    'unique_values': unique_values,
+                    'most_common': profile.top_values[col].top(5),
+                    'cardinality_ratio': unique_values / non_null[col],
+                }
+        
+        report._check_findings(non_null)
+        return report
+    
+    def merge(self, other: "DataQualityReport") -> "DataQualityReport":
+        """
+        Combine two approximate reports of chunks of the same table.
+        
+        Returns:
+            New approximate report covering the rows of both reports
+            
+        Raises:
+            ValueError: If either report is not approximate
+        """
+        if self.profile is None or other.profile is None:
+            raise ValueError("Only approximate reports (approximate=True) can be merged")
+        profile = QualityProfile().merge(self.profile).merge(other.profile)
+        return DataQualityReport.from_profile(self.table_name, profile)
+    
+    def save(self, path: Union[str, Path], metadata: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Persist an approximate report's mergeable state.
+        
+        Args:
+            path: File to write
+            metadata: Extra JSON-like information stored with the state
+            
+        Returns:
+            Path written
+        """
+        if self.profile is None:
+            raise ValueError("Only approximate reports (approximate=True) can be saved")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'table_name': self.table_name, 'profile': self.profile,
+                         'metadata': metadata or {}}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+        return path
+    
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Tuple["DataQualityReport", Dict[str, Any]]:
+        """
+        Load a report saved with ``save``.
+        
+        Returns:
+            Tuple of (report, metadata)
+        """
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        return cls.from_profile(state['table_name'], state['profile']), state['metadata']
+    
+    def _check_findings(self, non_null: Dict[str, int]):
+        """
+        Add issues and warnings for the computed statistics.
+        
+        Args:
+            non_null: Number of non-null values per column
+        """
+        for col, missing_rate in self.missing_data.items():
+            if missing_rate > 0.5:
+                self.add_issue(f"Column '{col}' has {missing_rate:.1%} missing values")
+            elif missing_rate > 0.2:
+                self.add_warning(f"Column '{col}' has {missing_rate:.1%} missing values")
+        
+        if self.duplicate_rows > 0:
+            duplicate_rate = self.duplicate_rows / self.row_count
+            if duplicate_rate > 0.1:
+                self.add_issue(f"{self.duplicate_rows} duplicate rows ({duplicate_rate:.1%})")
+            else:
+                self.add_warning(f"{self.duplicate_rows} duplicate rows ({duplicate_rate:.1%})")
+        
+        for col, stats in self.numeric_stats.items():
+            if stats['std'] == 0:
+                self.add_warning(f"Column '{col}' has constant values")
+            
+            if stats['zeros'] / non_null[col] > 0.5:
+                self.add_warning(f"Column '{col}' has {stats['zeros']/non_null[col]:.1%} zero values")
+        
+        for col, stats in self.categorical_stats.items():
+            if stats['unique_values'] == 1:
+                self.add_warning(f"Column '{col}' has only one unique value")
+            elif stats['cardinality_ratio'] > 0.95:
+                self.add_warning(f"Column '{col}' has very high cardinality ({stats['cardinality_ratio']:.1%})")
     
     def add_issue(self, issue: str):
         """Add a data quality issue."""
@@ -50,6 +242,7 @@ class DataQualityReport:
             'categorical_stats': self.categorical_stats,
             'issues': self.issues,
             'warnings': self.warnings,
+            'approximate': self.approximate,
             'quality_score': self.calculate_quality_score()
         }
     
@@ -73,17 +266,154 @@ class DataQualityReport:
         return max(0.0, score)
 
 
-def assess_data_quality(df: pd.DataFrame, table_name: str) -> DataQualityReport:
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """Hash every row of a DataFrame (values only) to a 64-bit integer."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy(dtype=np.uint64)
+
+
+def count_duplicate_rows(df: pd.DataFrame) -> int:
+    """Count rows that repeat an earlier row, comparing 64-bit row hashes."""
+    if len(df) == 0:
+        return 0
+    return int(pd.Series(row_hashes(df)).duplicated().sum())
+
+
+def text_columns(df: pd.DataFrame) -> List[str]:
+    """Get object, string and categorical columns."""
+    return [col for col in df.columns
+            if df[col].dtype == object or isinstance(df[col].dtype, (pd.StringDtype, pd.CategoricalDtype))]
+
+
+def numeric_block_stats(df: pd.DataFrame, columns: List[str]) -> Dict[str, Dict[str, float]]:
+    """
+    Compute the moments and counts of numeric columns in one reduction.
+    
+    The columns are stacked into a single float64 block (missing values as
+    NaN) and reduced column-wise. Each column gets its non-null count, sum,
+    sum of squared deviations from the mean (m2), min, max, zeros and
+    negatives; ``summarize_numeric_stats`` turns these into report stats.
+    
+    Args:
+        df: DataFrame to profile
+        columns: Numeric columns
+        
+    Returns:
+        Dictionary of column name to raw statistics
+    """
+    if not columns:
+        return {}
+    
+    block = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(block)
+    count = valid.sum(axis=0)
+    filled = np.where(valid, block, 0.0)
+    total = filled.sum(axis=0)
+    mean = np.divide(total, count, out=np.zeros_like(total), where=count > 0)
+    m2 = (np.where(valid, block - mean, 0.0) ** 2).sum(axis=0)
+    minimum = np.where(valid, block, np.inf).min(axis=0)
+    maximum = np.where(valid, block, -np.inf).max(axis=0)
+    zeros = (block == 0).sum(axis=0)
+    negatives = (block < 0).sum(axis=0)
+    
+    return {
+        col: {
+            'count': int(count[i]), 'sum': float(total[i]), 'm2': float(m2[i]),
+            'min': float(minimum[i]), 'max': float(maximum[i]),
+            'zeros': int(zeros[i]), 'negatives': int(negatives[i]),
+        }
+        for i, col in enumerate(columns)
+    }
+
+
+def merge_numeric_stats(a: Dict[str, float], b: Dict[str, float]) -> Dict[str, float]:
+    """Combine raw numeric statistics of two chunks (parallel variance formula for m2)."""
+    count = a['count'] + b['count']
+    if not a['count'] or not b['count']:
+        return dict(a if a['count'] else b)
+    delta = b['sum'] / b['count'] - a['sum'] / a['count']
+    return {
+        'count': count,
+        'sum': a['sum'] + b['sum'],
+        'm2': a['m2'] + b['m2'] + delta * delta * a['count'] * b['count'] / count,
+        'min': min(a['min'], b['min']),
+        'max': max(a['max'], b['max']),
+        'zeros': a['zeros'] + b['zeros'],
+        'negatives': a['negatives'] + b['negatives'],
+    }
+
+
+def profile_frame(df: pd.DataFrame, hll_precision: int = 14, top_capacity: int = 64,
+                  tdigest_delta: float = 200) -> QualityProfile:
+    """
+    Build the mergeable quality profile of a DataFrame.
+    
+    Args:
+        df: DataFrame (or chunk of a table) to profile
+        hll_precision: HyperLogLog precision for distinct counts
+        top_capacity: Values tracked for the most common values
+        tdigest_delta: t-digest compression for quantiles
+        
+    Returns:
+        QualityProfile of the rows
+    """
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    profile = QualityProfile(
+        row_count=len(df),
+        data_types={col: str(df[col].dtype) for col in df.columns},
+        missing={col: int(count) for col, count in df.isna().sum().items()},
+        row_hashes=np.unique(row_hashes(df)) if len(df) else np.empty(0, dtype=np.uint64),
+        numeric=numeric_block_stats(df, numeric_cols),
+    )
+    for col in numeric_cols:
+        profile.digests[col] = TDigest(tdigest_delta).update(
+            df[col].to_numpy(dtype=np.float64, na_value=np.nan))
+    for col in text_columns(df):
+        profile.distinct[col] = HyperLogLog(hll_precision).update(hash_values(df[col]))
+        profile.top_values[col] = SpaceSaving(top_capacity).update(df[col])
+    return profile
+
+
+def summarize_numeric_stats(raw: Dict[str, float]) -> Dict[str, Any]:
+    """Turn raw numeric statistics into min, max, mean, std (ddof=1), zeros and negatives."""
+    count = raw['count']
+    if count < 2:
+        std = float('nan')
+    elif raw['min'] == raw['max']:
+        std = 0.0  # Exact for constant columns, whatever the rounding of the mean
+    else:
+        std = float(np.sqrt(raw['m2'] / (count - 1)))
+    return {
+        'min': raw['min'],
+        'max': raw['max'],
+        'mean': raw['sum'] / count,
+        'std': std,
+        'zeros': raw['zeros'],
+        'negatives': raw['negatives'],
+    }
+
+
+def assess_data_quality(df: pd.DataFrame, table_name: str,
+                        approximate: bool = False) -> DataQualityReport:
     """
     Assess data quality of a DataFrame.
     
+    Missing values come from one ``isna`` pass, duplicates from 64-bit row
+    hashes and all numeric statistics from one reduction over the numeric
+    columns.
+    
     Args:
         df: DataFrame to assess
         table_name: Name of the table
+        approximate: Use bounded-memory sketches for distinct counts, most
+            common values and quantiles; the report can be merged with
+            reports of other chunks of the table
         
     Returns:
         DataQualityReport with assessment results
     """
+    if approximate:
+        return DataQualityReport.from_profile(table_name, profile_frame(df))
+    
     report = DataQualityReport(table_name)
     
     # Basic statistics
@@ -95,54 +425,26 @@ def assess_data_quality(df: pd.DataFrame, table_name: str) -> DataQualityReport:
         return report
     
     # Missing data analysis
+    missing_counts = df.isna().sum()
     for col in df.columns:
-        missing_count = df[col].isna().sum()
-        missing_rate = missing_count / len(df)
-        report.missing_data[col] = missing_rate
-        
-        if missing_rate > 0.5:
-            report.add_issue(f"Column '{col}' has {missing_rate:.1%} missing values")
-        elif missing_rate > 0.2:
-            report.add_warning(f"Column '{col}' has {missing_rate:.1%} missing values")
+        report.missing_data[col] = missing_counts[col] / len(df)
+    non_null = {col: len(df) - int(missing_counts[col]) for col in df.columns}
     
     # Duplicate rows
-    report.duplicate_rows = df.duplicated().sum()
-    if report.duplicate_rows > 0:
-        duplicate_rate = report.duplicate_rows / len(df)
-        if duplicate_rate > 0.1:
-            report.add_issue(f"{report.duplicate_rows} duplicate rows ({duplicate_rate:.1%})")
-        else:
-            report.add_warning(f"{report.duplicate_rows} duplicate rows ({duplicate_rate:.1%})")
+    report.duplicate_rows = count_duplicate_rows(df)
     
     # Data types
     for col in df.columns:
         report.data_types[col] = str(df[col].dtype)
     
     # Numeric column analysis
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    for col in numeric_cols:
-        series = df[col].dropna()
-        if len(series) > 0:
-            stats = {
-                'min': float(series.min()),
-                'max': float(series.max()),
-                'mean': float(series.mean()),
-                'std': float(series.std()),
-                'zeros': int((series == 0).sum()),
-                'negatives': int((series < 0).sum())
-            }
-            report.numeric_stats[col] = stats
-            
-            # Check for suspicious patterns
-            if stats['std'] == 0:
-                report.add_warning(f"Column '{col}' has constant values")
-            
-            if stats['zeros'] / len(series) > 0.5:
-                report.add_warning(f"Column '{col}' has {stats['zeros']/len(series):.1%} zero values")
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+    for col, raw in numeric_block_stats(df, numeric_cols).items():
+        if raw['count'] > 0:
+            report.numeric_stats[col] = summarize_numeric_stats(raw)
     
     # Categorical column analysis
-    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
-    for col in categorical_cols:
+    for col in text_columns(df):
         series = df[col].dropna()
         if len(series) > 0:
             value_counts = series.value_counts()
@@ -152,16 +454,40 @@ def assess_data_quality(df: pd.DataFrame, table_name: str) -> DataQualityReport:
                 'cardinality_ratio': len(value_counts) / len(series)
             }
             report.categorical_stats[col] = stats
-            
-            # Check for suspicious patterns
-            if len(value_counts) == 1:
-                report.add_warning(f"Column '{col}' has only one unique value")
-            elif stats['cardinality_ratio'] > 0.95:
-                report.add_warning(f"Column '{col}' has very high cardinality ({stats['cardinality_ratio']:.1%})")
     
+    # Check for suspicious patterns
+    report._check_findings(non_null)
     return report
 
 
+def assess_data_quality_incremental(new_rows: pd.DataFrame, table_name: str,
+                                   previous: Optional[DataQualityReport] = None) -> DataQualityReport:
+    """
+    Update an approximate quality report with rows appended to its table.
+    
+    Only the new rows are profiled; their profile is merged into the previous
+    report's, giving the same findings and quality score as profiling the
+    whole table with ``approximate=True``.
+    
+    Args:
+        new_rows: Rows added since the previous report
+        table_name: Name of the table
+        previous: Approximate report of the table before the append (None
+            to start a new one)
+        
+    Returns:
+        Approximate report covering the previous and the new rows
+        
+    Raises:
+        ValueError: If the new rows' columns or column types differ from the
+            previous report's
+    """
+    current = assess_data_quality(new_rows, table_name, approximate=True)
+    if previous is None:
+        return current
+    return previous.merge(current)
+
+
 def validate_business_rules(df: pd.DataFrame, table_name: str) -> List[str]:
     """
     Validate business-specific rules for NBO data.
@@ -222,12 +548,52 @@ def validate_business_rules(df: pd.DataFrame, table_name: str) -> List[str]:
     return errors
 
 
-def check_data_consistency(dataframes: Dict[str, pd.DataFrame]) -> Dict[str, List[str]]:
+def build_id_dictionary(columns: Dict[str, pd.Series]) -> Tuple[pd.Index, Dict[str, np.ndarray]]:
+    """
+    Encode the IDs of several tables on one shared integer dictionary.
+    
+    Args:
+        columns: Dictionary of table name to ID column
+        
+    Returns:
+        Tuple of (dictionary of distinct IDs, table name to the sorted
+        unique integer codes of its IDs)
+    """
+    table_ids = {name: pd.unique(column.dropna().to_numpy(dtype=object)) for name, column in columns.items()}
+    all_ids = np.concatenate([ids for ids in table_ids.values()]) if table_ids else np.empty(0, dtype=object)
+    codes, dictionary = pd.factorize(all_ids)
+    
+    table_codes = {}
+    offset = 0
+    for name, ids in table_ids.items():
+        table_codes[name] = np.sort(codes[offset:offset + len(ids)])
+        offset += len(ids)
+    return pd.Index(dictionary), table_codes
+
+
+def _missing_ids_message(missing: np.ndarray, dictionary: pd.Index, id_name: str, where: str,
+                         max_samples: int) -> str:
+    """Describe IDs missing from a table with their exact count and a sample."""
+    message = f"{len(missing)} {id_name}s {where}"
+    if max_samples > 0:
+        sample = ', '.join(str(value) for value in dictionary[missing[:max_samples]])
+        more = ', ...' if len(missing) > max_samples else ''
+        message += f" (e.g. {sample}{more})"
+    return message
+
+
+def check_data_consistency(dataframes: Dict[str, pd.DataFrame],
+                           max_samples: int = 5) -> Dict[str, List[str]]:
     """
     Check consistency across multiple related tables.
     
+    IDs are encoded on a shared integer dictionary and each table's IDs are
+    kept as a sorted array of codes, so membership differences between
+    tables are vectorized set operations.
+    
     Args:
         dataframes: Dictionary of table name to DataFrame
+        max_samples: Number of offending IDs quoted per issue
         
     Returns:
         Dictionary of table name to list of consistency issues
@@ -235,24 +601,20 @@ def check_data_consistency(dataframes: Dict[str, pd.DataFrame]) -> Dict[str, Lis
     issues = {}
     
     # Check guest_id consistency
-    guest_id_tables = {name: df for name, df in dataframes.items() if 'guest_id' in df.columns}
+    guest_id_tables = {name: df['guest_id'] for name, df in dataframes.items() if 'guest_id' in df.columns}
     
     if len(guest_id_tables) > 1:
-        all_guest_ids = set()
-        table_guest_ids = {}
-        
-        for table_name, df in guest_id_tables.items():
-            table_guest_ids[table_name] = set(df['guest_id'].dropna().unique())
-            all_guest_ids.update(table_guest_ids[table_name])
+        dictionary, table_codes = build_id_dictionary(guest_id_tables)
         
         # Check for guest IDs that appear in some tables but not others
-        for table_name, guest_ids in table_guest_ids.items():
+        for table_name, codes in table_codes.items():
             missing_from_other_tables = []
-            for other_table, other_guest_ids in table_guest_ids.items():
+            for other_table, other_codes in table_codes.items():
                 if other_table != table_name:
-                    missing = guest_ids - other_guest_ids
-                    if missing:
-                        missing_from_other_tables.append(f"{len(missing)} guest_ids not in {other_table}")
+                    missing = np.setdiff1d(codes, other_codes, assume_unique=True)
+                    if len(missing):
+                        missing_from_other_tables.append(_missing_ids_message(
+                            missing, dictionary, 'guest_id', f"not in {other_table}", max_samples))
             
             if missing_from_other_tables:
                 if table_name not in issues:
@@ -260,21 +622,21 @@ def check_data_consistency(dataframes: Dict[str, pd.DataFrame]) -> Dict[str, Lis
                 issues[table_name].extend(missing_from_other_tables)
     
     # Check promotion_id consistency
-    promotion_tables = {name: df for name, df in dataframes.items() if 'promotion_id' in df.columns}
+    promotion_tables = {name: df['promotion_id'] for name, df in dataframes.items() if 'promotion_id' in df.columns}
     
     if 'offer_catalog_v1' in promotion_tables:
-        catalog_promotions = set(promotion_tables['offer_catalog_v1']['promotion_id'].dropna().unique())
+        dictionary, table_codes = build_id_dictionary(promotion_tables)
+        catalog_codes = table_codes['offer_catalog_v1']
         
-        for table_name, df in promotion_tables.items():
+        for table_name, codes in table_codes.items():
             if table_name != 'offer_catalog_v1':
-                table_promotions = set(df['promotion_id'].dropna().unique())
-                invalid_promotions = table_promotions - catalog_promotions
+                invalid_promotions = np.setdiff1d(codes, catalog_codes, assume_unique=True)
                 
-                if invalid_promotions:
+                if len(invalid_promotions):
                     if table_name not in issues:
                         issues[table_name] = []
-                    issues[table_name].append(
-                        f"{len(invalid_promotions)} promotion_ids not found in offer catalog"
-                    )
+                    issues[table_name].append(_missing_ids_message(
+                        invalid_promotions, dictionary, 'promotion_id', "not found in offer catalog",
+                        max_samples))
     
     return issues
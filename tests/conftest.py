@@ -5,5 +5,14 @@ Test configuration for pytest.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add the package to the Python path for testing
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(autouse=True)
+def user_cache_home(tmp_path, monkeypatch):
+    """Keep the DataLoader's columnar cache out of the real user cache directory."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    return tmp_path / 'cache'
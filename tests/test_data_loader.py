@@ -0,0 +1,255 @@
+"""
+Tests for the DataLoader.
+"""
+
+import os
+import pytest
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from nbo import DataLoader, data_loader
+from nbo.data_loader import TableCache
+from nbo.configuration import NBOConfig
+
+
+def write_loader_data(data_path: Path, n_rows: int = 50):
+    """Write a schema-typed table (with NULL literals) and an untyped table."""
+    data_path.mkdir(parents=True, exist_ok=True)
+
+    pd.DataFrame({
+        'override_id': [str(i) for i in range(n_rows)],
+        'promotion_id': [str(i % 3 + 1) if i % 10 else 'NULL' for i in range(n_rows)],
+        'legal_flag': ['1' if i % 2 else 'false' for i in range(n_rows)],
+        'policy_paused_flag': ['0'] * n_rows,
+        'claims_approved': ['True'] * n_rows,
+        'override_reason': [' manual review ' if i % 4 else 'NULL' for i in range(n_rows)],
+        'created_by': ['ops'] * n_rows,
+        'created_date': ['2025-08-01 10:00:00'] * n_rows,
+        'modified_by': ['ops'] * n_rows,
+        'modified_date': ['2025-08-02 11:30:00' if i % 5 else 'NULL' for i in range(n_rows)],
+    }).to_csv(data_path / 'dbo.policy_overrides.csv', index=False)
+
+    pd.DataFrame({
+        'guest_id': [f"g{i:03d}" for i in range(n_rows)],
+        'aov': [5.0 + i for i in range(n_rows)],
+    }).to_csv(data_path / 'extra_untyped.csv', index=False)
+
+
+def test_columnar_cache_round_trip():
+    """Test that cached loads return the same typed table without re-parsing the CSV."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        write_loader_data(data_path)
+
+        expected = DataLoader(data_path, columnar_cache=False).load_table('policy_overrides')
+        loader = DataLoader(data_path)
+        first = loader.load_table('policy_overrides')
+        assert (loader.columnar_cache_dir / 'policy_overrides.parquet').exists()
+        # The cache lives in the user cache directory, not next to the user's data
+        assert sorted(p.name for p in data_path.iterdir()) == ['dbo.policy_overrides.csv', 'extra_untyped.csv']
+
+        # Touching the source without changing it keeps the cache valid
+        os.utime(data_path / 'dbo.policy_overrides.csv')
+        second = DataLoader(data_path).load_table('policy_overrides')
+
+        pd.testing.assert_frame_equal(first, expected)
+        pd.testing.assert_frame_equal(second, expected)
+        assert str(second['legal_flag'].dtype) == 'boolean'
+
+
+def test_columnar_cache_invalidated_by_source_change():
+    """Test that editing the source CSV invalidates its cached table."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        write_loader_data(data_path)
+
+        assert len(DataLoader(data_path).load_table('policy_overrides')) == 50
+        write_loader_data(data_path, n_rows=20)
+        assert len(DataLoader(data_path).load_table('policy_overrides')) == 20
+
+
+def test_load_table_projects_columns_with_schema_types():
+    """Test that columns= loads only the requested columns, typed from the schema."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        write_loader_data(data_path)
+        loader = DataLoader(data_path, columnar_cache=False)
+
+        df = loader.load_table('policy_overrides', columns=['modified_date', 'promotion_id'])
+
+        assert df.columns.tolist() == ['modified_date', 'promotion_id']
+        assert str(df['promotion_id'].dtype) == 'Int64'
+        assert len(df) == 50
+        assert df['promotion_id'].isna().sum() == 5
+        assert str(df['modified_date'].dtype) == 'datetime64[us, UTC]'
+        # Projections are not cached as the full table
+        assert 'policy_overrides' not in loader._data_cache
+
+
+def test_arrow_engine_matches_c_parser():
+    """Test that the Arrow CSV engine loads the same typed table as the C parser."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        write_loader_data(data_path)
+
+        expected = DataLoader(data_path, columnar_cache=False, engine='c').load_table('policy_overrides')
+        loader = DataLoader(data_path, columnar_cache=False, engine='pyarrow')
+
+        assert loader.get_table_engine('policy_overrides') == 'pyarrow'
+        pd.testing.assert_frame_equal(loader.load_table('policy_overrides'), expected)
+
+        with pytest.raises(ValueError, match="Unknown CSV engine"):
+            DataLoader(data_path, engine='python')
+
+
+def test_table_cache_budget_evicts_least_recently_used():
+    """Test that the table cache stays within its byte budget and counts hits, misses and evictions."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        write_loader_data(data_path)
+        (data_path / 'extra_untyped.csv').rename(data_path / 'other_untyped.csv')
+        write_loader_data(data_path)
+
+        sizes = {name: int(DataLoader(data_path, columnar_cache=False).load_table(name)
+                           .memory_usage(deep=True).sum())
+                 for name in ('extra_untyped', 'other_untyped')}
+        loader = DataLoader(data_path, columnar_cache=False,
+                            cache_max_bytes=sizes['extra_untyped'] + sizes['other_untyped'] - 1)
+
+        first = loader.load_table('extra_untyped')
+        first['aov'] = 0.0  # Writes to a returned table never reach the cache
+        assert (loader.load_table('extra_untyped')['aov'] > 0).all()
+        loader.load_table('other_untyped')
+
+        info = loader.get_cache_info()
+        assert info['cached_tables'] == ['other_untyped']
+        assert info['memory_usage'] == sizes['other_untyped']
+        assert (info['hits'], info['misses'], info['evictions']) == (1, 2, 1)
+
+
+def test_table_cache_copy_on_write_falls_back_to_copies(monkeypatch, caplog):
+    """Test that copy_on_write mode warns and deep-copies without pandas copy-on-write."""
+    monkeypatch.setattr(data_loader, 'copy_on_write_enabled', lambda: False)
+
+    cache = TableCache(return_mode='copy_on_write')
+    df = cache.put('guests', pd.DataFrame({'aov': [1.0, 2.0]}))
+    df.loc[0, 'aov'] = 0.0
+
+    assert "deep-copied instead" in caplog.text
+    assert cache.info()['return_mode'] == 'copy'
+    assert cache.get('guests')['aov'].tolist() == [1.0, 2.0]
+
+
+def test_iter_table_streams_typed_chunks():
+    """Test that iter_table yields bounded chunks matching the fully loaded table."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        write_loader_data(data_path)
+        loader = DataLoader(data_path, columnar_cache=False)
+
+        chunks = list(loader.iter_table('policy_overrides', chunksize=15))
+
+        assert [len(chunk) for chunk in chunks] == [15, 15, 15, 5]
+        pd.testing.assert_frame_equal(pd.concat(chunks), loader.load_table('policy_overrides'))
+
+        projected = next(loader.iter_table('policy_overrides', chunksize=15, columns=['promotion_id']))
+        assert projected.columns.tolist() == ['promotion_id']
+        assert str(projected['promotion_id'].dtype) == 'Int64'
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_load_multiple_tables_concurrently(executor):
+    """Test that concurrent loads match sequential ones and isolate failing tables."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        write_loader_data(data_path)
+        (data_path / 'broken.csv').write_bytes(b'')
+
+        names = ['policy_overrides', 'broken', 'extra_untyped']
+        expected = DataLoader(data_path, columnar_cache=False).load_multiple_tables(names, max_workers=1)
+        loader = DataLoader(data_path, columnar_cache=False)
+        tables = loader.load_multiple_tables(names, max_workers=3, executor=executor)
+
+        assert list(tables) == ['policy_overrides', 'extra_untyped']
+        for name, df in expected.items():
+            pd.testing.assert_frame_equal(tables[name], df)
+        assert loader.load_stats['broken']['error']
+        assert loader.load_stats['extra_untyped']['rows'] == 50
+        assert loader.get_cache_info()['cached_tables'] != []
+
+
+def test_clean_data_strips_text_and_infers_integers():
+    """Test that string columns are stripped and null-normalized and integer text is inferred."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        write_loader_data(data_path)
+        pd.DataFrame({
+            'code': [' 7', '8 ', 'NULL', '  '],
+            'ratio': ['0.5', '2', None, '3'],
+            'label': [' a ', 'None', 'b', ' '],
+        }).to_csv(data_path / 'extra_text.csv', index=False)
+        loader = DataLoader(data_path, columnar_cache=False)
+
+        overrides = loader.load_table('policy_overrides')
+        assert set(overrides['override_reason'].dropna()) == {'manual review'}
+
+        df = loader.load_table('extra_text')
+        assert str(df['code'].dtype) == 'Int64'
+        assert df['code'].tolist()[:2] == [7, 8] and df['code'].isna().sum() == 2
+        assert df['ratio'].dtype == 'float64'
+        assert df['label'].isna().tolist() == [False, True, False, True]
+
+
+def test_low_cardinality_columns_load_as_categoricals():
+    """Test that schema-flagged and low-cardinality text columns load as categoricals."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        write_loader_data(data_path)
+        pd.DataFrame({
+            'promotion_id': range(200),
+            'promotion_name': [f"promo {i % 4}" for i in range(200)],
+            'promotion_description': [f"description {i}" for i in range(200)],
+        }).to_csv(data_path / 'dbo.promotions.csv', index=False)
+
+        config = NBOConfig()
+        config.set_setting('loader.categorical_min_rows', 40)
+        config.set_setting('loader.categorical_max_unique_ratio', 0.1)
+        loader = DataLoader(data_path, config, columnar_cache=False)
+
+        promotions = loader.load_table('promotions', validate_schema=False)
+        assert promotions['promotion_name'].dtype == 'category'
+        assert promotions['promotion_description'].dtype != 'category'
+
+        # Auto-detected from the threshold; dates keep their own type
+        overrides = loader.load_table('policy_overrides')
+        assert overrides['created_by'].dtype == 'category'
+        assert str(overrides['created_date'].dtype) == 'datetime64[us, UTC]'
+
+
+def test_default_cache_return_mode_does_not_warn(caplog):
+    """Test that loaders built from the shipped settings copy without warning."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        loader = DataLoader(temp_dir, columnar_cache=False)
+
+        assert loader.get_cache_info()['return_mode'] == 'copy'
+        assert "copy_on_write" not in caplog.text
+
+
+def test_clean_data_keeps_missing_values_missing():
+    """Test that stripping leaves NaN and non-string values alone and skips null literals after na_values."""
+    df = pd.DataFrame({
+        'text': [' a ', np.nan, 5, 'nan '],
+        'label': pd.array([' b', None, 'None', ' '], dtype='string'),
+    })
+    with tempfile.TemporaryDirectory() as temp_dir:
+        loader = DataLoader(temp_dir, columnar_cache=False)
+
+        cleaned = loader._clean_data(df.copy(), 'any', drop_empty=False)
+        assert cleaned['text'].tolist()[0] == 'a' and cleaned['text'].isna().tolist() == [False, True, False, True]
+        assert cleaned['text'].tolist()[2] == 5
+
+        cleaned = loader._clean_data(df.copy(), 'any', drop_empty=False, na_applied=True)
+        assert cleaned['text'].tolist()[3] == 'nan'
+        assert cleaned['label'].isna().tolist() == [False, True, False, True]
@@ -0,0 +1,73 @@
+"""
+Tests for model training and candidate scoring helpers.
+"""
+
+import numpy as np
+import pandas as pd
+
+from nbo.model_training import explode_discount_bands, score_candidates
+
+
+def test_explode_discount_bands():
+    """Test that each candidate gets one row per allowed band up to its max discount."""
+    sc = pd.DataFrame({
+        "guest_id": ["g1", "g2", "g3"],
+        "uplift": [0.1, 0.2, 0.3],
+        "expected_ticket": [10.0, 20.0, 30.0],
+        "margin_pct": [0.5, 0.5, 0.5],
+        "base_price": [100.0, 50.0, 200.0],
+        "max_discount_pct": [0.2, 0.0, 0.3],
+    }, index=[7, 8, 9])
+    # g1 and g3 share the "10-20-30" bands; g2's promotion has no parsed bands
+    band_codes = np.array([0, 1, 0])
+    parsed_bands = [[10.0, 20.0, 30.0], []]
+
+    exploded = explode_discount_bands(sc, band_codes, parsed_bands)
+
+    expected = pd.DataFrame({
+        "guest_id": ["g1", "g1", "g2", "g3", "g3", "g3"],
+        "uplift": [0.1, 0.1, 0.2, 0.3, 0.3, 0.3],
+        "expected_ticket": [10.0, 10.0, 20.0, 30.0, 30.0, 30.0],
+        "margin_pct": [0.5] * 6,
+        "base_price": [100.0, 100.0, 50.0, 200.0, 200.0, 200.0],
+        "max_discount_pct": [0.2, 0.2, 0.0, 0.3, 0.3, 0.3],
+        "discount_band": [10, 20, 0, 10, 20, 30],
+        "discount_cost": [10.0, 20.0, 0.0, 20.0, 40.0, 60.0],
+        "cannibalization_penalty": [0.0] * 6,
+        "eim_raw": [-9.5, -19.5, 2.0, -15.5, -35.5, -55.5],
+    })
+    pd.testing.assert_frame_equal(exploded, expected)
+
+
+def test_explode_discount_bands_without_allowed_bands():
+    """Test that candidates whose bands all exceed the max discount are dropped."""
+    sc = pd.DataFrame({"uplift": [0.1], "expected_ticket": [10.0], "margin_pct": [0.5],
+                       "base_price": [100.0], "max_discount_pct": [0.05]})
+
+    assert explode_discount_bands(sc, np.array([0]), [[10.0, 20.0]]).empty
+
+
+class SumModel:
+    """Stand-in model whose uplift is the row sum of the feature matrix."""
+
+    def predict(self, X):
+        total = X.sum(axis=1).astype(float)
+        return total, np.zeros(len(X)), total
+
+
+def test_score_candidates_attaches_catalog_features():
+    """Test that offer-level model features are taken from the catalog by offer index."""
+    catalog = pd.DataFrame({"promotion_id": [1, 2], "start_date": ["2025-08-01"] * 2,
+                            "end_date": ["2025-09-30"] * 2, "legal_flag": [True, True],
+                            "offer_weight": [100.0, 200.0]})
+    candidates = pd.DataFrame({"guest_id": ["g1", "g1", "g2"], "promotion_id": [1, 2, 2],
+                               "offer_idx": np.array([0, 1, 1], dtype=np.int32)})
+    fm = pd.DataFrame({"guest_id": ["g1", "g2"], "aov_28d": [1.0, 2.0]})
+    offer_master = pd.DataFrame({"promotion_id": [1, 2], "base_price": [5.0, 5.0],
+                                 "allowed_discount_bands": ["0%", "0%"], "margin_basis_pct": [30.0, 30.0],
+                                 "channel_eligibility": ["Push"] * 2, "promotion_name": ["A", "B"],
+                                 "product_category": ["X", "Y"]})
+
+    scores = score_candidates(SumModel(), ["aov_28d", "offer_weight"], fm, candidates, offer_master, catalog)
+
+    assert list(scores["uplift"]) == [101.0, 201.0, 202.0]
@@ -0,0 +1,523 @@
+"""
+Tests for the NBO pipeline orchestrator.
+"""
+
+import pytest
+import tempfile
+import pandas as pd
+from pathlib import Path
+
+from nbo import NBOPipeline, NBOConfig
+from nbo.model_registry import ModelRegistry
+from nbo.step_cache import local_imports
+
+
+def write_pipeline_data(data_path: Path, n_guests: int = 30):
+    """Write a small but complete set of pipeline input tables."""
+    data_path.mkdir(parents=True, exist_ok=True)
+    guests = [f"g{i:03d}" for i in range(n_guests)]
+    
+    pd.DataFrame({
+        'promotion_id': [1, 2, 3],
+        'promotion_name': ['Value Deal', 'BOGO', 'Expired'],
+        'product_category': ['Sandwich', 'Beverage', 'Side'],
+        'base_price': [5.0, 2.5, 3.0],
+        'start_date': ['2025-08-01', '2025-08-01', '2025-01-01'],
+        'end_date': ['2025-09-30', '2025-09-30', '2025-02-01'],
+        'legal_flag': [True, True, True],
+        'channel_eligibility': ['Email Channel', 'Push', 'Push'],
+        'allowed_discount_bands': ['10%-20%', '0%-10%', '0%'],
+        'margin_basis_pct': [35.0, 40.0, 25.0],
+    }).to_csv(data_path / 'offer_master.csv', index=False)
+    
+    feature_mart = pd.DataFrame({
+        'guest_id': guests,
+        'asof_date': ['2025-08-20'] * n_guests,
+        'aov_28d': [float(5 + i % 20) for i in range(n_guests)],
+        'aov_90d': [float(3 + i % 7) for i in range(n_guests)],
+        'visits_28d': [i % 5 for i in range(n_guests)],
+    })
+    feature_mart.to_csv(data_path / 'feature_mart.csv', index=False)
+    
+    pd.DataFrame({
+        'guest_id': guests,
+        'response_within_window': [i % 2 for i in range(n_guests)],
+    }).to_csv(data_path / 'label_set.csv', index=False)
+    
+    modeling = feature_mart.copy()
+    modeling['response_within_window'] = [(i // 2) % 2 for i in range(n_guests)]
+    modeling['treatment_flag'] = [1 if i % 3 else 0 for i in range(n_guests)]
+    modeling.to_csv(data_path / 'modeling_set_v2.csv', index=False)
+    
+    pd.DataFrame({
+        'guest_id': guests[:4],
+        'offer_id': [1, 2, 1, 2],
+        'touch_ts': ['2025-08-21 10:00:00'] * 2 + ['2025-08-01 10:00:00'] * 2,
+        'channel': ['Email'] * 4,
+    }).to_csv(data_path / 'touch_history.csv', index=False)
+
+
+def test_in_process_pipeline_run():
+    """Test that the in-process engine runs all steps and writes outputs."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        output_path = Path(temp_dir) / 'output'
+        write_pipeline_data(data_path)
+        
+        pipeline = NBOPipeline(data_path=data_path, output_path=output_path,
+                               execution_mode='in_process')
+        result = pipeline.run_pipeline()
+        
+        assert result.status == 'completed', result.error_messages
+        assert set(result.steps_completed) == set(pipeline.steps)
+        
+        # Fatigued pairs (touched within 72h) are removed from candidates
+        candidates = pipeline.get_frame('scored_candidates')
+        assert len(candidates) == 30 * 2 - 2
+        
+        decisions = pd.read_csv(output_path / 'decision_log_output.csv')
+        assert decisions['guest_id'].is_unique
+        assert 'nlp_rationale' in decisions.columns
+        assert (output_path / 'test_marketing_view_output.csv').exists()
+
+
+def test_parallel_pipeline_respects_dependencies():
+    """Test that the parallel scheduler only starts steps after their dependencies."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        write_pipeline_data(data_path)
+        
+        pipeline = NBOPipeline(data_path=data_path, output_path=Path(temp_dir) / 'output',
+                               execution_mode='in_process', max_workers=4, executor='thread')
+        result = pipeline.run_pipeline()
+        
+        assert result.status == 'completed', result.error_messages
+        assert set(result.step_end_times) == set(pipeline.steps)
+        for step in pipeline.steps.values():
+            for dep in step.dependencies:
+                assert result.step_start_times[step.name] >= result.step_end_times[dep]
+        
+        assert set(pipeline.get_step_durations()) == set(pipeline.steps)
+
+
+def test_parallel_pipeline_process_executor():
+    """Test that in-process steps run in spawned worker processes and checkpoint their run."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        write_pipeline_data(data_path)
+        
+        pipeline = NBOPipeline(data_path=data_path, output_path=Path(temp_dir) / 'output',
+                               execution_mode='in_process', max_workers=2, executor='process',
+                               checkpoint_runs=True)
+        result = pipeline.run_pipeline()
+        
+        assert result.status == 'completed', result.error_messages
+        assert set(result.steps_completed) == set(pipeline.steps)
+        assert len(pipeline.get_frame('scored_candidates')) == 30 * 2 - 2
+        # CPU time and peak memory are measured inside the workers
+        assert all(m.peak_rss_mb for m in result.step_metrics.values())
+        
+        saved = pipeline.load_run(result.run_id)
+        assert set(saved.steps_completed) == set(pipeline.steps)
+        assert set(saved.step_metrics) == set(pipeline.steps)
+
+
+def test_step_cache_skips_unchanged_steps():
+    """Test that unchanged steps are restored from the cache on re-runs."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        output_path = Path(temp_dir) / 'output'
+        write_pipeline_data(data_path)
+        
+        def run():
+            pipeline = NBOPipeline(data_path=data_path, output_path=output_path,
+                                   execution_mode='in_process', use_cache=True)
+            return pipeline.run_pipeline()
+        
+        first = run()
+        assert first.status == 'completed', first.error_messages
+        assert first.steps_cached == []
+        
+        scores_file = output_path / 'model_scores_output.parquet'
+        written_at = scores_file.stat().st_mtime_ns
+        
+        second = run()
+        assert second.status == 'completed', second.error_messages
+        assert set(second.steps_cached) == set(second.steps_completed)
+        # Unchanged output files are not rewritten, and runs are not checkpointed by default
+        assert scores_file.stat().st_mtime_ns == written_at
+        assert not (output_path / 'runs').exists()
+        
+        # Changing an input only re-runs the steps that read it
+        labels = pd.read_csv(data_path / 'label_set.csv')
+        labels.iloc[:1].to_csv(data_path / 'label_set.csv', index=False)
+        third = run()
+        assert 'contract_checks' not in third.steps_cached
+        assert 'catalog_guardrails' in third.steps_cached
+        assert 'model_training' in third.steps_cached
+        
+        # A step's own settings section is part of its key
+        config = NBOConfig()
+        config.set_setting('candidates.n_buckets', 2)
+        pipeline = NBOPipeline(data_path=data_path, output_path=output_path, config=config,
+                               execution_mode='in_process', use_cache=True)
+        fourth = pipeline.run_pipeline()
+        assert 'catalog_guardrails' in fourth.steps_cached
+        assert 'fatigue_candidates' not in fourth.steps_cached
+
+
+def test_local_imports_follow_package_modules():
+    """Test that a step's code hash covers the package modules it imports, transitively."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        package = Path(temp_dir) / 'pkg'
+        package.mkdir()
+        (package / 'step.py').write_text(
+            "import pandas as pd\n"
+            "try:\n    from .helpers import f\nexcept ImportError:\n    from helpers import f\n")
+        (package / 'helpers.py').write_text("from pkg.core import g\n")
+        (package / 'core.py').write_text("import os\n")
+        (package / 'unused.py').write_text("")
+        
+        assert [p.name for p in local_imports(package / 'step.py')] == ['core.py', 'helpers.py', 'step.py']
+
+
+def test_model_registry_reuses_fitted_model():
+    """Test that scoring runs load the registered model until the training data changes."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        output_path = Path(temp_dir) / 'output'
+        write_pipeline_data(data_path)
+        
+        def run():
+            pipeline = NBOPipeline(data_path=data_path, output_path=output_path,
+                                   execution_mode='in_process', use_cache=False)
+            result = pipeline.run_pipeline()
+            assert result.status == 'completed', result.error_messages
+            return pipeline.get_frame('model_scores_output')
+        
+        registry = ModelRegistry(output_path / 'models')
+        first = run()
+        assert len(registry.list_models()) == 1
+        
+        second = run()
+        assert len(registry.list_models()) == 1
+        pd.testing.assert_series_equal(first['p_treat'], second['p_treat'])
+        
+        # A new training snapshot registers a new model
+        modeling = pd.read_csv(data_path / 'modeling_set_v2.csv')
+        modeling.iloc[:-1].to_csv(data_path / 'modeling_set_v2.csv', index=False)
+        run()
+        assert len(registry.list_models()) == 2
+
+
+def test_resume_failed_run():
+    """Test that a failed run resumes from its first incomplete step."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        output_path = Path(temp_dir) / 'output'
+        write_pipeline_data(data_path)
+        
+        # Make model_training fail by hiding its training data
+        modeling_file = data_path / 'modeling_set_v2.csv'
+        modeling_file.rename(Path(temp_dir) / 'modeling_set_v2.csv')
+        
+        pipeline = NBOPipeline(data_path=data_path, output_path=output_path,
+                               execution_mode='in_process', use_cache=False, checkpoint_runs=True)
+        failed = pipeline.run_pipeline()
+        assert failed.status == 'failed'
+        assert failed.steps_failed == ['model_training']
+        assert failed.run_id in pipeline.list_runs()
+        
+        (Path(temp_dir) / 'modeling_set_v2.csv').rename(modeling_file)
+        
+        pipeline = NBOPipeline(data_path=data_path, output_path=output_path,
+                               execution_mode='in_process', use_cache=False, checkpoint_runs=True)
+        resumed = pipeline.run_pipeline(resume_run_id=failed.run_id)
+        
+        assert resumed.status == 'completed', resumed.error_messages
+        assert resumed.run_id == failed.run_id
+        assert set(resumed.steps_completed) == set(pipeline.steps)
+        # Steps completed before the failure were reused, not re-run
+        assert resumed.step_start_times['fatigue_candidates'] == failed.step_start_times['fatigue_candidates']
+        assert pipeline.load_run(failed.run_id).status == 'completed'
+
+
+def test_resume_restores_cached_steps_and_prunes_old_runs():
+    """Test that checkpoints reference cached outputs instead of copying them, and are pruned."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        output_path = Path(temp_dir) / 'output'
+        write_pipeline_data(data_path)
+        modeling_file = data_path / 'modeling_set_v2.csv'
+        modeling_file.rename(Path(temp_dir) / 'modeling_set_v2.csv')
+        
+        pipeline = NBOPipeline(data_path=data_path, output_path=output_path,
+                               execution_mode='in_process', use_cache=True, checkpoint_runs=True)
+        failed = pipeline.run_pipeline()
+        assert failed.steps_failed == ['model_training']
+        run_dir = output_path / 'runs' / failed.run_id
+        assert not (run_dir / 'fatigue_candidates').exists()
+        
+        (Path(temp_dir) / 'modeling_set_v2.csv').rename(modeling_file)
+        pipeline = NBOPipeline(data_path=data_path, output_path=output_path,
+                               execution_mode='in_process', use_cache=False, checkpoint_runs=True)
+        resumed = pipeline.run_pipeline(resume_run_id=failed.run_id)
+        assert resumed.status == 'completed', resumed.error_messages
+        assert resumed.step_start_times['fatigue_candidates'] == failed.step_start_times['fatigue_candidates']
+        
+        for i in range(3):
+            (output_path / 'runs' / f"run_2025010{i}_000000").mkdir()
+            (output_path / 'runs' / f"run_2025010{i}_000000" / 'run_state.json').write_text('{}')
+        assert pipeline.prune_runs(keep=2) == ['run_20250100_000000', 'run_20250101_000000']
+        assert pipeline.list_runs() == ['run_20250102_000000', failed.run_id]
+
+
+def test_step_metrics_and_trace_export():
+    """Test that per-step metrics are recorded and exported as a trace."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        output_path = Path(temp_dir) / 'output'
+        write_pipeline_data(data_path)
+        
+        pipeline = NBOPipeline(data_path=data_path, output_path=output_path,
+                               execution_mode='in_process', checkpoint_runs=True)
+        result = pipeline.run_pipeline()
+        
+        assert result.status == 'completed', result.error_messages
+        assert set(result.step_metrics) == set(pipeline.steps)
+        metrics = result.step_metrics['fatigue_candidates']
+        assert metrics.status == 'completed'
+        assert metrics.wall_time_s > 0
+        assert metrics.cpu_time_s is not None
+        assert metrics.output_rows['scored_candidates'] == 30 * 2 - 2
+        assert metrics.bytes_read > 0
+        assert metrics.bytes_written > 0
+        
+        csv_trace = pd.read_csv(result.export_trace(Path(temp_dir) / 'trace.csv'))
+        assert set(csv_trace['step_name']) == set(pipeline.steps)
+        assert (csv_trace['run_id'] == result.run_id).all()
+        
+        json_trace = output_path / 'runs' / result.run_id / 'trace.json'
+        assert json_trace.exists()
+        assert pipeline.load_run(result.run_id).step_metrics.keys() == result.step_metrics.keys()
+
+
+def test_candidates_skip_fatigued_pairs():
+    """Test that fatigue removes a promotion for a guest across all its catalog rows."""
+    from nbo.fatigue_candidates import build_candidates, attach_offer_attributes
+    
+    catalog = pd.DataFrame({
+        'promotion_id': [1, 2, 2, 3],
+        'start_date': ['2025-08-01'] * 4,
+        'end_date': ['2025-09-30'] * 4,
+        'legal_flag': [True, True, True, False],
+    })
+    fm = pd.DataFrame({'guest_id': [10, 20, 10]})
+    touches = pd.DataFrame({
+        'guest_id': [10, 20, 99],
+        'offer_id': [2, 1, 1],
+        'touch_ts': ['2025-08-21T12:00:00Z', '2025-08-01T00:00:00Z', '2025-08-21T12:00:00Z'],
+    })
+    
+    candidates = build_candidates(catalog, fm, touches)
+    
+    pairs = list(zip(candidates['guest_id'], candidates['promotion_id']))
+    assert pairs == [(10, 1), (20, 1), (20, 2), (20, 2)]
+    assert list(candidates.columns) == ['guest_id', 'promotion_id', 'offer_idx']
+    # Catalog attributes are attached by offer index, not stored per pair
+    attached = attach_offer_attributes(candidates, catalog, ['end_date'])
+    assert list(attached['end_date']) == ['2025-09-30'] * 4
+    assert list(attached['offer_idx']) == [0, 0, 1, 2]
+    # Fatigue is resolved per guest bucket with the same result
+    for n_buckets in [2, 3]:
+        pd.testing.assert_frame_equal(build_candidates(catalog, fm, touches, n_buckets=n_buckets), candidates)
+
+
+def test_bucketed_candidates_write_partitioned_dataset():
+    """Test that bucketed candidates are streamed to a dataset that downstream steps read back."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        output_path = Path(temp_dir) / 'output'
+        write_pipeline_data(data_path)
+        
+        config = NBOConfig()
+        config.set_setting('candidates.n_buckets', 4)
+        config.set_setting('candidates.write_partitioned', True)
+        pipeline = NBOPipeline(data_path=data_path, output_path=output_path, config=config,
+                               execution_mode='in_process', use_cache=False)
+        result = pipeline.run_pipeline(steps=['catalog_guardrails', 'contract_checks',
+                                              'fatigue_candidates', 'model_training'])
+        
+        assert result.status == 'completed', result.error_messages
+        # No full candidate frame is kept or written as a single file
+        assert pipeline.get_frame('scored_candidates') is None
+        assert not (output_path / 'scored_candidates.parquet').exists()
+        
+        parts = sorted((output_path / 'scored_candidates').glob('guest_bucket=*/part-0.parquet'))
+        assert 1 < len(parts) <= 4
+        dataset = pd.concat([pd.read_parquet(p) for p in parts])
+        assert len(dataset) == 30 * 2 - 2
+        # Each guest lives in exactly one bucket
+        assert sum(pd.read_parquet(p)['guest_id'].nunique() for p in parts) == dataset['guest_id'].nunique()
+        written = result.outputs_generated
+        assert all(written[f"scored_candidates/{p.parent.name}/part-0.parquet"] == str(p) for p in parts)
+        
+        # model_training reads the dataset back
+        assert result.step_metrics['model_training'].input_rows['scored_candidates'] == len(dataset)
+        assert not pipeline.get_frame('model_scores_output').empty
+
+
+def test_invalid_bucket_count():
+    """Test that fewer than one guest bucket is rejected."""
+    from nbo.fatigue_candidates import guest_buckets
+    
+    with pytest.raises(ValueError):
+        guest_buckets(pd.Series(['g1']), 0)
+
+
+def test_cached_candidates_rerun_when_dataset_changed():
+    """Test that a cache hit re-runs the step when its partitioned dataset is gone."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        output_path = Path(temp_dir) / 'output'
+        write_pipeline_data(data_path)
+        
+        config = NBOConfig()
+        config.set_setting('candidates.n_buckets', 4)
+        config.set_setting('candidates.write_partitioned', True)
+        steps = ['catalog_guardrails', 'contract_checks', 'fatigue_candidates']
+        
+        def run():
+            pipeline = NBOPipeline(data_path=data_path, output_path=output_path, config=config,
+                                   execution_mode='in_process', use_cache=True)
+            return pipeline.run_pipeline(steps=steps)
+        
+        first = run()
+        dataset = output_path / 'scored_candidates'
+        parts = sorted(dataset.glob('guest_bucket=*/part-0.parquet'))
+        assert first.status == 'completed', first.error_messages
+        
+        assert 'fatigue_candidates' in run().steps_cached
+        
+        parts[0].unlink()
+        third = run()
+        assert third.status == 'completed', third.error_messages
+        assert 'fatigue_candidates' not in third.steps_cached
+        assert sorted(dataset.glob('guest_bucket=*/part-0.parquet')) == parts
+
+
+def test_subprocess_step_metrics_measure_script_files():
+    """Test that subprocess steps report the files their script read and wrote."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        scripts_path = Path(temp_dir) / 'scripts'
+        write_pipeline_data(data_path)
+        scripts_path.mkdir()
+        pd.read_csv(data_path / 'offer_master.csv').to_parquet(scripts_path / 'offer_master.parquet')
+        (scripts_path / 'catalog_guardrails.py').write_text(
+            "import pandas as pd\n"
+            "om = pd.read_parquet('offer_master.parquet').head(2)\n"
+            "om.to_csv('offer_catalog_v1.csv', index=False)\n"
+            "om.to_parquet('offer_catalog_v1.parquet')\n"
+        )
+        
+        pipeline = NBOPipeline(data_path=data_path, output_path=Path(temp_dir) / 'output',
+                               scripts_path=scripts_path, execution_mode='subprocess')
+        result = pipeline.run_pipeline(steps=['catalog_guardrails'])
+        
+        assert result.status == 'completed', result.error_messages
+        metrics = result.step_metrics['catalog_guardrails']
+        assert metrics.input_rows == {'offer_master': 3}
+        assert metrics.bytes_read == (scripts_path / 'offer_master.parquet').stat().st_size
+        assert metrics.output_rows == {'offer_catalog_v1': 2}
+        assert metrics.bytes_written == sum((scripts_path / f).stat().st_size
+                                            for f in ['offer_catalog_v1.csv', 'offer_catalog_v1.parquet'])
+        assert metrics.peak_rss_mb is None
+        assert metrics.cpu_time_s > 0
+
+
+def test_resume_subprocess_run_restores_script_outputs():
+    """Test that resuming a subprocess run puts back the files its completed steps wrote."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        output_path = Path(temp_dir) / 'output'
+        scripts_path = Path(temp_dir) / 'scripts'
+        write_pipeline_data(data_path)
+        scripts_path.mkdir()
+        (scripts_path / 'catalog_guardrails.py').write_text(
+            "import pandas as pd\n"
+            "pd.DataFrame({'promotion_id': [1, 2]}).to_parquet('offer_catalog_v1.parquet')\n"
+        )
+        (scripts_path / 'contract_checks.py').write_text(
+            "import os, sys\n"
+            "import pandas as pd\n"
+            "pd.read_parquet('offer_catalog_v1.parquet')\n"
+            "sys.exit(1 if os.path.exists('fail') else 0)\n"
+        )
+        (scripts_path / 'fail').touch()
+        
+        pipeline = NBOPipeline(data_path=data_path, output_path=output_path, scripts_path=scripts_path,
+                               execution_mode='subprocess', checkpoint_runs=True)
+        failed = pipeline.run_pipeline(steps=['catalog_guardrails', 'contract_checks'])
+        assert failed.steps_completed == ['catalog_guardrails']
+        assert failed.step_files == {'catalog_guardrails': ['offer_catalog_v1.parquet']}
+        
+        (scripts_path / 'fail').unlink()
+        (scripts_path / 'offer_catalog_v1.parquet').unlink()
+        resumed = pipeline.run_pipeline(resume_run_id=failed.run_id)
+        
+        assert resumed.status == 'completed', resumed.error_messages
+        assert resumed.step_start_times['catalog_guardrails'] == failed.step_start_times['catalog_guardrails']
+        assert (scripts_path / 'offer_catalog_v1.parquet').exists()
+
+
+def test_run_ids_are_unique():
+    """Test that runs started within the same second get their own run directories."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pipeline = NBOPipeline(data_path=temp_dir, output_path=temp_dir, execution_mode='in_process')
+        run_ids = {pipeline.run_pipeline(steps=[]).run_id for _ in range(3)}
+        assert len(run_ids) == 3
+
+
+def test_subprocess_command_forwards_step_settings():
+    """Test that subprocess steps get the registry and retrain settings as flags."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = Path(temp_dir) / 'output'
+        config = NBOConfig()
+        pipeline = NBOPipeline(data_path=temp_dir, output_path=output_path, config=config,
+                               execution_mode='subprocess')
+        step = pipeline.steps['model_training']
+        
+        command = pipeline._script_command(step)
+        assert command[1:] == ['model_training.py', '--registry-dir', str(output_path.resolve() / 'models')]
+        
+        config.set_setting('model.retrain', True)
+        assert '--retrain' in pipeline._script_command(step)
+        assert pipeline._script_command(pipeline.steps['shap'])[1:] == ['shap.py']
+        
+        config.set_setting('candidates.n_buckets', 4)
+        config.set_setting('candidates.write_partitioned', True)
+        assert pipeline._script_command(pipeline.steps['fatigue_candidates'])[1:] == [
+            'fatigue_candidates.py', '--buckets', '4', '--partitioned']
+
+
+def test_in_process_missing_input():
+    """Test that missing input tables fail the step instead of raising."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        data_path.mkdir()
+        
+        pipeline = NBOPipeline(data_path=data_path, output_path=Path(temp_dir) / 'output',
+                               execution_mode='in_process')
+        result = pipeline.run_pipeline()
+        
+        assert result.status == 'failed'
+        assert result.steps_failed == ['catalog_guardrails']
+        assert 'offer_master' in result.error_messages[0]
+
+
+def test_invalid_execution_mode():
+    """Test that unknown execution modes are rejected."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with pytest.raises(ValueError):
+            NBOPipeline(data_path=temp_dir, output_path=temp_dir, execution_mode='remote')
@@ -0,0 +1,118 @@
+"""
+Tests for the uplift models.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingClassifier, HistGradientBoostingClassifier
+
+from nbo.model_registry import ModelRegistry
+from nbo.model_training import get_model, predict_uplift
+from nbo.uplift import UpliftModel, UPLIFT_METHODS, BASELINE_P_CTRL, feature_matrix
+
+PARAMS = {"learner": "hist_gbm", "n_estimators": 20, "random_state": 0,
+          "calibration_cv": 3, "min_control_samples": 10}
+
+
+def make_experiment(n=2000, seed=0):
+    """Randomized experiment where treatment only helps when feature 1 is positive."""
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 3)).astype(np.float32)
+    t = rng.integers(0, 2, n)
+    y = (X[:, 0] + 1.5 * t * (X[:, 1] > 0) + rng.normal(size=n) > 0.5).astype(int)
+    return X, t, y
+
+
+@pytest.mark.parametrize("method", UPLIFT_METHODS)
+def test_uplift_methods_recover_effect(method):
+    """Test that every uplift method scores higher uplift where treatment helps."""
+    X, t, y = make_experiment()
+    model = UpliftModel(method, PARAMS).fit(X, t, y)
+
+    p_treat, p_ctrl, uplift = model.predict(X)
+
+    assert p_treat.shape == p_ctrl.shape == uplift.shape == (len(X),)
+    assert ((p_treat >= 0) & (p_treat <= 1) & (p_ctrl >= 0) & (p_ctrl <= 1)).all()
+    assert uplift[X[:, 1] > 0].mean() > uplift[X[:, 1] <= 0].mean() + 0.1
+
+
+def test_small_control_group_uses_baseline():
+    """Test that a control group below min_control_samples falls back to the baseline."""
+    X, t, y = make_experiment(n=300)
+    t[:] = 1
+    t[:5] = 0
+
+    model = UpliftModel("t_learner", PARAMS).fit(X, t, y)
+    p_treat, p_ctrl, uplift = model.predict(X)
+
+    assert model.treated_only
+    assert (p_ctrl == BASELINE_P_CTRL).all()
+    np.testing.assert_allclose(uplift, p_treat - BASELINE_P_CTRL)
+
+
+def test_unknown_uplift_method():
+    """Test that unknown methods are rejected."""
+    with pytest.raises(ValueError, match="Unknown uplift method"):
+        UpliftModel("z_learner", PARAMS)
+
+
+class RecordingModel:
+    """Stand-in model that scores the row sum and records each batch size."""
+
+    def __init__(self):
+        self.batches = []
+
+    def predict(self, X):
+        self.batches.append(X.shape)
+        total = X.sum(axis=1).astype(float)
+        return total, total / 2, total / 2
+
+
+def test_predict_uplift_scores_each_guest_once():
+    """Test that guest-level features are scored once per guest and broadcast to candidates."""
+    feat = pd.DataFrame({"guest_id": ["g1", "g2", "g3"], "f1": [1.0, 2.0, 3.0], "f2": [10.0, 20.0, 30.0]})
+    candidates = pd.DataFrame({"guest_id": ["g1", "g1", "g2", "g2", "g4"],
+                               "promotion_id": [1, 2, 1, 2, 1]})
+    model = RecordingModel()
+
+    sc, (p_treat, p_ctrl, uplift) = predict_uplift(model, ["f1", "f2"], feat, candidates)
+
+    assert model.batches == [(3, 2)]  # g1, g2 and the featureless g4
+    assert sc.columns.tolist() == ["guest_id", "promotion_id", "f1", "f2"]
+    row_level = candidates.merge(feat, on="guest_id", how="left")
+    np.testing.assert_allclose(p_treat, feature_matrix(row_level, ["f1", "f2"]).sum(axis=1))
+    np.testing.assert_allclose(uplift, [5.5, 5.5, 11.0, 11.0, 0.0])
+
+    # Guest x offer features are taken from the candidates and scored per row
+    candidates["f3"] = [1.0, 2.0, 3.0, 4.0, 5.0]
+    model = RecordingModel()
+    _, (p_treat, _, _) = predict_uplift(model, ["f1", "f3"], feat, candidates)
+    assert model.batches == [(5, 2)]
+    np.testing.assert_allclose(p_treat, [2.0, 3.0, 5.0, 6.0, 5.0])
+
+
+@pytest.mark.parametrize("learner,estimator", [("gbm", GradientBoostingClassifier),
+                                               ("hist_gbm", HistGradientBoostingClassifier)])
+def test_get_model_configures_learner_and_reuses_registry(tmp_path, learner, estimator):
+    """Test that the configured learner is fit once per training snapshot and reused from the registry."""
+    X, t, y = make_experiment(n=600)
+    modeling = pd.DataFrame(X, columns=["f0", "f1", "f2"])
+    modeling["guest_id"] = [f"g{i}" for i in range(len(X))]
+    modeling["treatment_flag"] = t
+    modeling["response_within_window"] = y
+    settings = {"learner": learner, "n_estimators": 10, "calibration_cv": 2}
+
+    model, feat_cols = get_model(modeling, tmp_path, settings=settings)
+    reused, reused_cols = get_model(modeling, tmp_path, settings=settings)
+
+    assert feat_cols == reused_cols == ["f0", "f1", "f2"]
+    assert model.params["learner"] == learner
+    assert isinstance(model.models["treated"].estimator, estimator)
+    assert len(ModelRegistry(tmp_path).list_models()) == 1
+    np.testing.assert_allclose(reused.predict(X)[2], model.predict(X)[2])
+
+    # A different learner is a different model
+    other = "hist_gbm" if learner == "gbm" else "gbm"
+    get_model(modeling, tmp_path, settings=dict(settings, learner=other))
+    assert len(ModelRegistry(tmp_path).list_models()) == 2
@@ -0,0 +1,181 @@
+"""
+Tests for data quality validation.
+"""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nbo import DataLoader
+from nbo.configuration import NBOConfig
+from nbo.sketches import HyperLogLog, TDigest, hash_values
+from nbo.user_setup import UserDataSetup, hash_file_prefixes
+from nbo.validation import (DataQualityReport, assess_data_quality, assess_data_quality_incremental,
+                            check_data_consistency)
+
+
+def make_table(n=1000, seed=0):
+    """Table with numeric, nullable integer, text and categorical columns."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'guest_id': [f"g{i % 700:04d}" for i in range(n)],
+        'visits': pd.array(rng.integers(0, 5, n), dtype='Int64'),
+        'aov': rng.normal(10, 3, n),
+        'flag': [0.0] * n,
+        'season': pd.Categorical(rng.choice(['Winter', 'Summer'], n)),
+    })
+    df.loc[::7, 'aov'] = np.nan
+    df.loc[::11, 'visits'] = pd.NA
+    return df
+
+
+def test_assess_data_quality_statistics():
+    """Test the single-pass profile against per-column pandas statistics."""
+    df = pd.concat([make_table(), make_table().head(50)], ignore_index=True)
+
+    report = assess_data_quality(df, 'guest_table')
+
+    assert report.row_count == 1050
+    assert report.duplicate_rows == df.duplicated().sum() >= 50
+    assert report.missing_data == pytest.approx(df.isna().mean().to_dict())
+    for col in ['visits', 'aov', 'flag']:
+        series = df[col].dropna().astype(float)
+        stats = report.numeric_stats[col]
+        assert stats['min'] == series.min() and stats['max'] == series.max()
+        assert stats['mean'] == pytest.approx(series.mean())
+        assert stats['std'] == pytest.approx(series.std())
+        assert stats['zeros'] == (series == 0).sum()
+    assert report.numeric_stats['flag']['std'] == 0
+    assert "Column 'flag' has constant values" in report.warnings
+    assert report.categorical_stats['season']['unique_values'] == 2
+
+
+def test_approximate_report_merges_chunks():
+    """Test that approximate chunk reports merge into the exact report's findings."""
+    df = pd.concat([make_table(), make_table().head(50)], ignore_index=True)
+    exact = assess_data_quality(df, 'guest_table')
+
+    chunks = [assess_data_quality(df.iloc[i:i + 300], 'guest_table', approximate=True)
+              for i in range(0, len(df), 300)]
+    merged = chunks[0]
+    for chunk in chunks[1:]:
+        merged = merged.merge(chunk)
+
+    assert merged.approximate and merged.row_count == len(df)
+    assert merged.duplicate_rows == exact.duplicate_rows
+    assert merged.missing_data == exact.missing_data
+    assert merged.warnings == exact.warnings and merged.issues == exact.issues
+    assert merged.calculate_quality_score() == pytest.approx(exact.calculate_quality_score())
+    assert merged.numeric_stats['aov']['std'] == pytest.approx(exact.numeric_stats['aov']['std'])
+    assert merged.categorical_stats['guest_id']['unique_values'] == pytest.approx(700, rel=0.02)
+    assert merged.categorical_stats['season']['most_common'] == exact.categorical_stats['season']['most_common']
+
+    with pytest.raises(ValueError, match="approximate"):
+        exact.merge(merged)
+
+
+def test_sketch_accuracy():
+    """Test HyperLogLog and t-digest estimates on data of known distribution."""
+    values = pd.Series([f"guest_{i}" for i in range(100_000)])
+    left = HyperLogLog().update(hash_values(values[:60_000]))
+    right = HyperLogLog().update(hash_values(values[40_000:]))
+    assert left.merge(right).estimate() == pytest.approx(100_000, rel=0.03)
+
+    x = np.random.default_rng(0).normal(size=200_000)
+    digest = TDigest()
+    for part in np.array_split(x, 4):
+        digest.update(part)
+    for q in (0.01, 0.5, 0.99):
+        assert digest.quantile(q) == pytest.approx(np.quantile(x, q), abs=0.02)
+
+
+def test_incremental_report_matches_full_profile():
+    """Test that profiling appended rows into a saved report matches a full approximate profile."""
+    df = make_table(3000)
+    full = assess_data_quality(df, 'guest_table', approximate=True)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        state_path = Path(temp_dir) / 'guest_table.quality.pkl'
+        assess_data_quality_incremental(df.iloc[:2000], 'guest_table').save(state_path)
+        previous, _ = DataQualityReport.load(state_path)
+
+        updated = assess_data_quality_incremental(df.iloc[2000:], 'guest_table', previous)
+
+    assert updated.row_count == 3000 and previous.row_count == 2000
+    assert updated.calculate_quality_score() == full.calculate_quality_score()
+    assert updated.warnings == full.warnings
+    assert updated.categorical_stats['guest_id']['unique_values'] == full.categorical_stats['guest_id']['unique_values']
+
+
+def test_validate_user_data_profiles_appended_rows():
+    """Test that validate_user_data reuses quality state for an appended file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        data_path.mkdir()
+        state_dir = Path(temp_dir) / 'state'
+        source = data_path / 'guest_table.csv'
+        make_table(2000).drop(columns='season').to_csv(source, index=False)
+        setup = UserDataSetup()
+
+        # Below validation.approximate_min_rows the exact profile is kept
+        exact = setup.validate_user_data(data_path, strict=False, state_dir=state_dir)
+        assert not (state_dir / 'guest_table.quality.pkl').exists()
+        table = DataLoader(data_path, columnar_cache=False).load_table('guest_table')
+        assert (exact['validation_results']['guest_table']['quality_score']
+                == assess_data_quality(table, 'guest_table').calculate_quality_score())
+
+        config = NBOConfig()
+        config.set_setting('validation.approximate_min_rows', 1000)
+        setup = UserDataSetup(config)
+        setup.validate_user_data(data_path, strict=False, state_dir=state_dir)
+        make_table(500, seed=1).drop(columns='season').to_csv(source, mode='a', header=False, index=False)
+        report = setup.validate_user_data(data_path, strict=False, state_dir=state_dir)
+
+        saved, metadata = DataQualityReport.load(state_dir / 'guest_table.quality.pkl')
+        assert saved.row_count == 2500
+        assert metadata['source_size'] == source.stat().st_size
+        whole, prefix = hash_file_prefixes(source, source.stat().st_size, checkpoint=100)
+        assert whole == metadata['source_prefix_sha256']
+        assert prefix == hash_file_prefixes(source, 100)[0]
+        table = DataLoader(data_path, columnar_cache=False).load_table('guest_table')
+        full = assess_data_quality(table, 'guest_table', approximate=True)
+        assert report['validation_results']['guest_table']['quality_score'] == full.calculate_quality_score()
+
+
+def test_check_data_consistency_counts_and_samples_ids():
+    """Test that cross-table ID checks report exact counts with a bounded sample of IDs."""
+    dataframes = {
+        'guests': pd.DataFrame({'guest_id': [f"g{i}" for i in range(10)] + [None]}),
+        'visits': pd.DataFrame({'guest_id': ['g0', 'g1', 'g1', 'g99'],
+                                'promotion_id': pd.array([1, 2, 7, None], dtype='Int64')}),
+        'offer_catalog_v1': pd.DataFrame({'promotion_id': [1, 2, 3]}),
+    }
+
+    issues = check_data_consistency(dataframes, max_samples=3)
+
+    assert issues['guests'] == ["8 guest_ids not in visits (e.g. g2, g3, g4, ...)"]
+    assert issues['visits'] == ["1 guest_ids not in guests (e.g. g99)",
+                                "1 promotion_ids not found in offer catalog (e.g. 7)"]
+    assert 'offer_catalog_v1' not in issues
+
+
+def test_validate_user_data_in_worker_processes():
+    """Test that parallel validation merges the same report in table order."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir) / 'data'
+        data_path.mkdir()
+        for i, name in enumerate(['c_table', 'a_table', 'b_table']):
+            make_table(300, seed=i).drop(columns='season').to_csv(data_path / f"{name}.csv", index=False)
+        (data_path / 'broken.csv').write_bytes(b'')
+        setup = UserDataSetup()
+
+        expected = setup.validate_user_data(data_path, strict=False, jobs=1)
+        report = setup.validate_user_data(data_path, strict=False, jobs=2)
+
+        assert report == expected
+        assert list(report['validation_results']) == [
+            name for name in DataLoader(data_path).get_available_tables() if name != 'broken']
+        assert any(error.startswith("Failed to validate broken") for error in report['errors'])